@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db.models import Count
+from django.db.models.functions import Substr
 from django.urls import reverse
 from django.utils.html import format_html
 from .models import (Politician, Faction, PoliticianFaction, PlenarySession, AgendaItem, Speech, 
@@ -50,12 +52,13 @@ class FactionAdmin(admin.ModelAdmin):
     readonly_fields = ['uuid', 'created_at', 'updated_at']
     
     def members_count(self, obj):
-        return obj.members.count()
+        return obj.members__count
     members_count.short_description = 'Members'
     members_count.admin_order_field = 'members__count'
     
     def get_queryset(self, request):
-        return super().get_queryset(request).prefetch_related('members')
+        # Count memberships in SQL instead of loading every membership row
+        return super().get_queryset(request).annotate(Count('members'))
 
 
 @admin.register(PoliticianFaction)
@@ -211,7 +214,7 @@ class SpeechAdmin(admin.ModelAdmin):
         from django.contrib import messages
         
         # Filter to speeches that don't have summaries yet
-        speeches_without_summary = queryset.filter(event_type='SPEECH')
+        speeches_without_summary = queryset.filter(event_type='SPEECH').defer(None)
         
         if not speeches_without_summary.exists():
             messages.warning(request, "All selected speeches already have summaries.")
@@ -229,7 +232,11 @@ class SpeechAdmin(admin.ModelAdmin):
     generate_ai_summaries_action.short_description = "Generate summaries for selected speeches"
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('politician', 'agenda_item')
+        # The changelist only shows a preview, so fetch the first 201 characters of the
+        # text (see Speech.text_preview) instead of the whole, often TOASTed, body
+        return super().get_queryset(request).select_related('politician', 'agenda_item').defer(
+            'text'
+        ).annotate(text_head=Substr('text', 1, 201))
 
 
 @admin.register(AgendaSummary)
@@ -282,6 +289,7 @@ class AgendaDecisionAdmin(admin.ModelAdmin):
     search_fields = ['agenda_item__title', 'politician__full_name', 'decision_text']
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['agenda_item', 'politician']
+    list_select_related = ['agenda_item', 'politician']
     
     fieldsets = (
         ('Basic Information', {
@@ -325,6 +333,7 @@ class AgendaActivePoliticianAdmin(admin.ModelAdmin):
     search_fields = ['agenda_item__title', 'politician__full_name', 'activity_description']
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['agenda_item', 'politician']
+    list_select_related = ['agenda_item', 'politician']
     
     fieldsets = (
         ('Basic Information', {
@@ -291,11 +291,11 @@ class AIService:
         response_content = ""
         full_content = ""
         
-        for line in response.iter_lines():
+        # NDJSON stream: read data as it arrives and parse each raw bytes line directly
+        for line in response.iter_lines(chunk_size=None):
             if line:
-                line_str = line.decode('utf-8')
                 try:
-                    data_json = json.loads(line_str)
+                    data_json = json.loads(line)
                     
                     # Collect response content
                     if 'response' in data_json:
@@ -38,7 +38,7 @@ def translation_context(request):
         return translate(key, current_language, **kwargs)
     
     # Get menu pages
-    menu_pages = TextPage.objects.filter(is_published=True, show_in_menu=True).order_by('menu_order', 'title')
+    menu_pages = TextPage.get_menu_pages()
     
     return {
         't': t_obj,  # For dot notation: {{ t.SITE_NAME }}
@@ -1,40 +1,100 @@
 """
-Shared mixin for Gemini Batch API processing across management commands
+Shared mixin for Gemini (and optionally OpenAI) Batch API processing across management commands
 """
 import time
+import hashlib
 import logging
 import json
 import tempfile
 import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from django.core.management.base import CommandError
 from django.conf import settings
+from django.db import transaction
 
 logger = logging.getLogger(__name__)
 
 
+def _create_http_session():
+    """Pooled session for provider and Batch API calls; idempotent GETs (status polling) are retried"""
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return session
+
+
+# Tagged translation response parsers (compiled once, used for every response)
+EN_TAG_RE = re.compile(r'<en>(.*?)</en>', re.DOTALL)
+RU_TAG_RE = re.compile(r'<ru>(.*?)</ru>', re.DOTALL)
+
+# Translation prompt prefixes per target language; the Estonian text is appended as-is
+TRANSLATION_PROMPT_PREFIXES = {
+    'both': """Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
+
+Provide the translations in this exact format:
+<en>English translation here</en>
+<ru>Russian translation here</ru>
+
+Estonian text:
+""",
+    'en': "Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n",
+    'ru': "Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n",
+}
+
+TARGET_LANGUAGE_NAMES = {
+    'both': "English and Russian",
+    'en': "English",
+    'ru': "Russian",
+}
+
+
+def build_translation_prompt(target_language, text):
+    """Translation prompt asking for target_language ('en', 'ru' or 'both') of the Estonian text"""
+    prefix = TRANSLATION_PROMPT_PREFIXES.get(target_language)
+    if prefix is None:
+        raise ValueError(f"Unsupported target language: {target_language}")
+    return prefix + text
+
+
+# Deferred item updates are written with bulk_update in chunks of this size
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Shared by the translation commands so provider calls, uploads and polling reuse keep-alive connections
+http_session = _create_http_session()
+
+
 class GeminiBatchAPIMixin:
     """Mixin to add Gemini Batch API support to management commands"""
     
+    # Providers whose Batch API a command supports; commands may opt in to 'openai'
+    batch_api_providers = ('gemini',)
+    
     def add_batch_api_arguments(self, parser):
         """Add common batch API arguments to argument parser"""
         parser.add_argument(
             '--use-batch-api',
             dest='use_batch_api',
             action='store_true',
-            help='Use Gemini Batch API for cost-effective batch processing (50%% cost reduction)'
+            help='Use provider Batch API for cost-effective batch processing (50%% cost reduction)'
         )
         parser.add_argument(
             '--no-batch-api',
             dest='use_batch_api',
             action='store_false',
-            help='Disable Gemini Batch API and use standard parallel processing (default)'
+            help='Disable Batch API and use standard parallel processing'
         )
         parser.set_defaults(use_batch_api=True)
         parser.add_argument(
             '--resume-from-batch-id',
             type=str,
-            help='Resume from an existing Gemini batch job (e.g., "batches/abc123")'
+            help='Resume from an existing batch job (e.g., "batches/abc123" for Gemini, "batch_abc123" for OpenAI)'
         )
     
     def initialize_batch_api(self, options):
@@ -42,18 +102,20 @@ class GeminiBatchAPIMixin:
         self.use_batch_api = options.get('use_batch_api', True)
         self.resume_from_batch_id = options.get('resume_from_batch_id')
         
+        supported = ', '.join(f'--ai-provider={provider}' for provider in self.batch_api_providers)
+        
         # Validate
-        if self.use_batch_api and self.ai_provider != 'gemini':
-            raise CommandError("Batch API only supported with --ai-provider=gemini")
+        if self.use_batch_api and self.ai_provider not in self.batch_api_providers:
+            raise CommandError(f"Batch API only supported with {supported}")
         
         if self.resume_from_batch_id:
-            if self.ai_provider != 'gemini':
-                raise CommandError("--resume-from-batch-id only works with --ai-provider=gemini")
+            if self.ai_provider not in self.batch_api_providers:
+                raise CommandError(f"--resume-from-batch-id only works with {supported}")
             self.use_batch_api = True
     
     def should_use_batch_api(self):
         """Check if batch API should be used"""
-        return self.use_batch_api and self.ai_provider == 'gemini' and not self.resume_from_batch_id
+        return self.use_batch_api and self.ai_provider in self.batch_api_providers and not self.resume_from_batch_id
     
     def create_batch_jsonl_for_items(self, items_list, create_prompt_func):
         """
@@ -63,18 +125,49 @@ class GeminiBatchAPIMixin:
             items_list: List of items to process
             create_prompt_func: Function that takes an item and returns prompt text
             
+        Identical prompts (e.g. repeated procedural text) are sent only once; every
+        item sharing a prompt is mapped to the same result key.
+            
         Returns:
-            tuple: (jsonl_data, items_with_prompts) where items_with_prompts is the list of items that were included
+            tuple: (jsonl_data, items_with_prompts, result_keys) where items_with_prompts is the
+            list of items that were included and result_keys maps item pk -> batch result key
         """
         jsonl_data = []
         items_with_prompts = []
-        gemini_model = getattr(settings, 'GEMINI_MODEL', 'gemini-2.5-flash-lite-preview-09-2025')
+        result_keys = {}
+        keys_by_prompt = {}
+        openai_model = getattr(settings, 'OPENAI_MODEL', 'gpt-4o-mini')
         
         for item in items_list:
             prompt = create_prompt_func(item)
             if not prompt:
                 continue
             
+            prompt_digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).digest()
+            if prompt_digest in keys_by_prompt:
+                result_keys[item.pk] = keys_by_prompt[prompt_digest]
+                items_with_prompts.append(item)
+                continue
+            keys_by_prompt[prompt_digest] = result_keys[item.pk] = f"item_{item.pk}"
+            
+            if self.ai_provider == 'openai':
+                jsonl_data.append({
+                    "custom_id": f"item_{item.pk}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": openai_model,
+                        "messages": [
+                            {
+                                "role": "user",
+                                "content": prompt
+                            }
+                        ]
+                    }
+                })
+                items_with_prompts.append(item)
+                continue
+            
             request_data = {
                 "key": f"item_{item.pk}",
                 "request": {
@@ -98,10 +191,13 @@ class GeminiBatchAPIMixin:
             jsonl_data.append(request_data)
             items_with_prompts.append(item)
         
-        return jsonl_data, items_with_prompts
+        return jsonl_data, items_with_prompts, result_keys
     
     def upload_batch_file(self, file_path):
         """Upload JSONL file to Gemini API"""
+        if self.ai_provider == 'openai':
+            return self._upload_openai_batch_file(file_path)
+        
         gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
         
         if not gemini_api_key:
@@ -123,7 +219,7 @@ class GeminiBatchAPIMixin:
             'file': ('batch_requests.jsonl', file_content, 'application/json')
         }
         
-        response = requests.post(url, headers=headers, files=files, timeout=120)
+        response = http_session.post(url, headers=headers, files=files, timeout=120)
         
         if response.status_code == 200:
             result = response.json()
@@ -138,6 +234,9 @@ class GeminiBatchAPIMixin:
     
     def create_batch_job(self, file_uri):
         """Create a batch job with the uploaded file"""
+        if self.ai_provider == 'openai':
+            return self._create_openai_batch_job(file_uri)
+        
         gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
         gemini_model = getattr(settings, 'GEMINI_MODEL', 'gemini-2.5-flash-lite-preview-09-2025')
         
@@ -156,7 +255,7 @@ class GeminiBatchAPIMixin:
             }
         }
         
-        response = requests.post(url, headers=headers, json=data, timeout=120)
+        response = http_session.post(url, headers=headers, json=data, timeout=120)
         
         if response.status_code == 200:
             result = response.json()
@@ -169,6 +268,9 @@ class GeminiBatchAPIMixin:
     
     def poll_batch_job(self, batch_job_name, max_wait_seconds=3600, poll_interval=30):
         """Poll batch job status until completion or timeout"""
+        if self.ai_provider == 'openai':
+            return self._poll_openai_batch_job(batch_job_name, max_wait_seconds, poll_interval)
+        
         gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
         
         url = f"https://generativelanguage.googleapis.com/v1beta/{batch_job_name}?key={gemini_api_key}"
@@ -178,7 +280,7 @@ class GeminiBatchAPIMixin:
         first_unknown = True
         
         while elapsed_time < max_wait_seconds:
-            response = requests.get(url, timeout=30)
+            response = http_session.get(url, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -244,6 +346,9 @@ class GeminiBatchAPIMixin:
     
     def download_batch_results(self, result_file_uri, batch_job_name=None):
         """Download and parse batch results using google-genai SDK"""
+        if self.ai_provider == 'openai':
+            return self._download_openai_batch_results(result_file_uri)
+        
         gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
         
         self.stdout.write(f"Result file URI: {result_file_uri}")
@@ -287,6 +392,151 @@ class GeminiBatchAPIMixin:
             logger.exception(f"Error downloading with SDK: {e}")
             raise CommandError(f"Failed to download batch results: {str(e)}")
     
+    # ========================================================================
+    # OPENAI BATCH API
+    # ========================================================================
+    
+    def _openai_headers(self):
+        """Authorization headers for the OpenAI API"""
+        openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
+        if not openai_api_key:
+            raise CommandError("OPENAI_API_KEY not configured")
+        return {'Authorization': f'Bearer {openai_api_key}'}
+    
+    def _upload_openai_batch_file(self, file_path):
+        """Upload JSONL file to OpenAI Files API with purpose=batch"""
+        with open(file_path, 'rb') as f:
+            file_content = f.read()
+        
+        files = {
+            'file': ('batch_requests.jsonl', file_content, 'application/jsonl')
+        }
+        
+        response = http_session.post(
+            'https://api.openai.com/v1/files',
+            headers=self._openai_headers(),
+            data={'purpose': 'batch'},
+            files=files,
+            timeout=120
+        )
+        
+        if response.status_code == 200:
+            result = response.json()
+            if 'id' in result:
+                return result['id']
+            raise CommandError(f"Unexpected upload response format: {result}")
+        else:
+            raise CommandError(f"File upload failed: {response.status_code} - {response.text}")
+    
+    def _create_openai_batch_job(self, file_id):
+        """Create an OpenAI batch job for chat completions"""
+        data = {
+            "input_file_id": file_id,
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+            "metadata": {
+                "description": self.__class__.__module__.split('.')[-1]
+            }
+        }
+        
+        response = http_session.post(
+            'https://api.openai.com/v1/batches',
+            headers=self._openai_headers(),
+            json=data,
+            timeout=120
+        )
+        
+        if response.status_code == 200:
+            result = response.json()
+            if 'id' in result:
+                return result['id']
+            raise CommandError(f"Unexpected batch creation response format: {result}")
+        else:
+            raise CommandError(f"Batch job creation failed: {response.status_code} - {response.text}")
+    
+    def _poll_openai_batch_job(self, batch_id, max_wait_seconds=3600, poll_interval=30):
+        """Poll OpenAI batch status until completion. Returns the output file ID."""
+        url = f"https://api.openai.com/v1/batches/{batch_id}"
+        
+        start_time = time.time()
+        elapsed_time = 0
+        
+        while elapsed_time < max_wait_seconds:
+            response = http_session.get(url, headers=self._openai_headers(), timeout=30)
+            
+            if response.status_code != 200:
+                raise CommandError(f"Failed to check batch status: {response.status_code} - {response.text}")
+            
+            result = response.json()
+            state = result.get('status', 'unknown')
+            request_counts = result.get('request_counts') or {}
+            total_requests = request_counts.get('total', 0)
+            completed_requests = request_counts.get('completed', 0) + request_counts.get('failed', 0)
+            
+            elapsed_time = time.time() - start_time
+            
+            if total_requests > 0:
+                progress_pct = (completed_requests / total_requests) * 100
+                self.stdout.write(f"Status: {state} | Progress: {completed_requests}/{total_requests} ({progress_pct:.1f}%) | Elapsed: {elapsed_time/60:.1f}m")
+            else:
+                self.stdout.write(f"Status: {state} (elapsed: {elapsed_time/60:.1f}m)")
+            
+            if state == 'completed':
+                self.stdout.write(self.style.SUCCESS("Batch job completed successfully!"))
+                output_file_id = result.get('output_file_id')
+                if output_file_id:
+                    return output_file_id
+                self.stdout.write(self.style.WARNING("Full response for debugging:"))
+                self.stdout.write(json.dumps(result, indent=2))
+                raise CommandError("No output file in completed batch")
+            
+            elif state in ['failed', 'expired', 'cancelled', 'cancelling']:
+                self.stdout.write(self.style.ERROR(f"Full error response:"))
+                self.stdout.write(json.dumps(result, indent=2))
+                raise CommandError(f"Batch job {state}")
+            
+            time.sleep(poll_interval)
+            elapsed_time = time.time() - start_time
+        
+        raise CommandError(f"Batch job timed out after {max_wait_seconds/60:.1f} minutes")
+    
+    def _download_openai_batch_results(self, output_file_id):
+        """Download an OpenAI batch output file and map custom_id -> response text"""
+        self.stdout.write(f"Result file ID: {output_file_id}")
+        
+        response = http_session.get(
+            f"https://api.openai.com/v1/files/{output_file_id}/content",
+            headers=self._openai_headers(),
+            timeout=300
+        )
+        if response.status_code != 200:
+            raise CommandError(f"Failed to download batch results: {response.status_code} - {response.text}")
+        
+        results = {}
+        for line in response.text.strip().split('\n'):
+            if not line:
+                continue
+            try:
+                result_item = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse result line: {e}")
+                continue
+            
+            key = result_item.get('custom_id', '')
+            response_data = result_item.get('response') or {}
+            if response_data.get('status_code') != 200:
+                logger.error(f"Batch request {key} failed: {result_item.get('error') or response_data}")
+                continue
+            
+            choices = (response_data.get('body') or {}).get('choices') or []
+            if choices:
+                content = (choices[0].get('message') or {}).get('content') or ''
+                if content.strip():
+                    results[key] = content.strip()
+        
+        self.stdout.write(f"Downloaded {len(results)} results")
+        return results
+    
     def process_batch_with_chunking(self, items_list, item_type, create_prompt_func, update_func):
         """
         Process items using Gemini Batch API with chunking to avoid rate limits
@@ -295,7 +545,8 @@ class GeminiBatchAPIMixin:
             items_list: List of items to process
             item_type: String describing item type (for logging)
             create_prompt_func: Function(item) -> prompt_text (or None to skip)
-            update_func: Function(item, result_text) -> None to update item
+            update_func: Function(item, result_text) -> None to update item, or a list of
+                changed field names to have the mixin save items with bulk_update
         """
         total_items = len(items_list)
         chunk_size = max(self.batch_size, 100)
@@ -337,7 +588,7 @@ class GeminiBatchAPIMixin:
         
         try:
             self.stdout.write("Step 1: Creating batch request file...")
-            jsonl_data, items_with_prompts = self.create_batch_jsonl_for_items(items_list, create_prompt_func)
+            jsonl_data, items_with_prompts, result_keys = self.create_batch_jsonl_for_items(items_list, create_prompt_func)
             
             if not jsonl_data:
                 self.stdout.write(self.style.WARNING("No items need processing (all already translated)"))
@@ -352,6 +603,9 @@ class GeminiBatchAPIMixin:
             
             skipped_count = len(items_list) - len(items_with_prompts)
             self.stdout.write(f"Created batch file with {len(jsonl_data)} requests (skipped {skipped_count} already translated)")
+            duplicate_count = len(items_with_prompts) - len(jsonl_data)
+            if duplicate_count:
+                self.stdout.write(f"Deduplicated {duplicate_count} items with identical prompts")
             
             try:
                 self.stdout.write("\nStep 2: Uploading batch file...")
@@ -380,7 +634,7 @@ class GeminiBatchAPIMixin:
                 
                 self.stdout.write("\nStep 6: Updating database with results...")
                 # Only update items that were actually included in the batch
-                processed, errors = self._update_items_from_results(items_with_prompts, results, update_func)
+                processed, errors = self._update_items_from_results(items_with_prompts, results, update_func, result_keys)
                 
                 total_time = time.time() - start_time
                 self.stdout.write("\n" + "=" * 60)
@@ -406,13 +660,15 @@ class GeminiBatchAPIMixin:
             self.stdout.write(self.style.ERROR(f"Batch processing error: {str(e)}"))
             raise
     
-    def _update_items_from_results(self, items_list, results, update_func):
-        """Update items with batch results"""
+    def _update_items_from_results(self, items_list, results, update_func, result_keys=None):
+        """Update items with batch results (items with deduplicated prompts share a result key)"""
         processed = 0
         errors = 0
+        pending_updates = []
+        result_keys = result_keys or {}
         
         for item in items_list:
-            key = f"item_{item.pk}"
+            key = result_keys.get(item.pk, f"item_{item.pk}")
             
             if key not in results:
                 self.stdout.write(f"No result for item {item.pk}")
@@ -426,7 +682,11 @@ class GeminiBatchAPIMixin:
                     self.stdout.write(f"[DRY RUN] Would update item {item.pk}")
                     processed += 1
                 else:
-                    update_func(item, result_text)
+                    updated_fields = update_func(item, result_text)
+                    if updated_fields:
+                        pending_updates.append((item, updated_fields))
+                        if len(pending_updates) >= BULK_UPDATE_BATCH_SIZE:
+                            self._flush_pending_updates(pending_updates)
                     processed += 1
                     
             except Exception as e:
@@ -434,12 +694,28 @@ class GeminiBatchAPIMixin:
                 self.stdout.write(self.style.ERROR(f"Error updating item {item.pk}: {str(e)}"))
                 errors += 1
         
+        self._flush_pending_updates(pending_updates)
         return processed, errors
     
+    def _flush_pending_updates(self, pending_updates):
+        """Save deferred item updates with bulk_update, grouped by model and changed fields"""
+        if not pending_updates:
+            return
+        
+        grouped = {}
+        for item, fields in pending_updates:
+            grouped.setdefault((type(item), tuple(fields)), []).append(item)
+        
+        with transaction.atomic():
+            for (model_class, fields), items in grouped.items():
+                model_class.objects.bulk_update(items, list(fields), batch_size=BULK_UPDATE_BATCH_SIZE)
+        
+        pending_updates.clear()
+    
     def _generate_resume_command(self, batch_job_name):
         """Generate a complete resume command"""
         cmd_parts = [f"python manage.py {self.__class__.__module__.split('.')[-1]}"]
-        cmd_parts.append(f"--ai-provider=gemini")
+        cmd_parts.append(f"--ai-provider={self.ai_provider}")
         cmd_parts.append(f"--resume-from-batch-id={batch_job_name}")
         
         if hasattr(self, 'target_language') and self.target_language != 'both':
@@ -463,7 +739,8 @@ class GeminiBatchAPIMixin:
         Args:
             batch_job_id: The batch job ID to resume
             model_class: Django model class to query items
-            update_func: Function(item, result_text) -> None to update item
+            update_func: Function(item, result_text) -> None to update item, or a list of
+                changed field names to have the mixin save items with bulk_update
         """
         self.stdout.write("=" * 80)
         self.stdout.write(self.style.HTTP_INFO(f"RESUMING BATCH JOB: {batch_job_id}"))
@@ -505,7 +782,12 @@ class GeminiBatchAPIMixin:
             raise CommandError(f"Error resuming batch job: {str(e)}")
     
     def _update_items_from_batch_results_by_pk(self, results, model_class, update_func):
-        """Update database items with translation results (used when resuming)"""
+        """
+        Update database items with translation results (used when resuming)
+        
+        Only items whose prompt was sent are updated; items deduplicated into another
+        item's request have no result key and are picked up by the next regular run.
+        """
         processed = 0
         errors = 0
         
@@ -523,6 +805,7 @@ class GeminiBatchAPIMixin:
             self.stdout.write(self.style.ERROR("No valid item keys found in batch results"))
             return 0, len(results)
         
+        pending_updates = []
         items = model_class.objects.filter(pk__in=item_pks)
         items_dict = {item.pk: item for item in items}
         
@@ -550,7 +833,11 @@ class GeminiBatchAPIMixin:
                     self.stdout.write(f"[DRY RUN] Would update item {item.pk}")
                     processed += 1
                 else:
-                    update_func(item, result_text)
+                    updated_fields = update_func(item, result_text)
+                    if updated_fields:
+                        pending_updates.append((item, updated_fields))
+                        if len(pending_updates) >= BULK_UPDATE_BATCH_SIZE:
+                            self._flush_pending_updates(pending_updates)
                     processed += 1
                     
             except Exception as e:
@@ -558,5 +845,6 @@ class GeminiBatchAPIMixin:
                 self.stdout.write(self.style.ERROR(f"Error updating item {item.pk}: {str(e)}"))
                 errors += 1
         
+        self._flush_pending_updates(pending_updates)
         return processed, errors
 
@@ -1,7 +1,6 @@
 """
 Management command to clean HTML tags from existing data
 """
-import re
 from django.core.management.base import BaseCommand
 from django.utils.html import strip_tags
 from django.db import transaction
@@ -53,11 +52,9 @@ class Command(BaseCommand):
         # Strip HTML tags
         cleaned = strip_tags(text)
         
-        # Normalize whitespace - replace multiple spaces/newlines with single space
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        
-        # Strip leading and trailing whitespace
-        cleaned = cleaned.strip()
+        # Normalize whitespace - collapse runs of spaces/newlines to a single space and
+        # strip both ends (str.split() matches the same Unicode whitespace as \s, without regex)
+        cleaned = ' '.join(cleaned.split())
         
         return cleaned
 
@@ -3,8 +3,9 @@ Management command to clear AI summaries from various models
 """
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.utils import timezone
 from parliament_speeches.models import (
-    AgendaItem, Speech, PoliticianProfilePart, 
+    AgendaItem, AgendaSummary, Speech, PoliticianProfilePart, 
     MediaReaction, 
     Politician, PlenarySession
 )
@@ -284,42 +285,35 @@ class Command(BaseCommand):
         try:
             with transaction.atomic():
                 cleared_count = 0
+                now = timezone.now()
+                
+                # One UPDATE/DELETE per model instead of a save() per row; the auto_now
+                # timestamps are set explicitly since update() doesn't touch them
                 
                 # Clear agenda item AI summaries (structured summaries)
-                for agenda_item in agenda_items_to_clear:
-                    try:
-                        if hasattr(agenda_item, 'structured_summary'):
-                            agenda_item.structured_summary.delete()
-                            cleared_count += 1
-                    except Exception as e:
-                        self.stdout.write(self.style.ERROR(f"Error clearing structured summary for agenda {agenda_item.id}: {e}"))
+                deleted, _ = AgendaSummary.objects.filter(
+                    agenda_item__in=[agenda_item.pk for agenda_item in agenda_items_to_clear]
+                ).delete()
+                cleared_count += deleted
                 
                 # Clear speech AI summaries
-                for speech in speeches_to_clear:
-                    speech.ai_summary = None
-                    speech.ai_summary_en = None
-                    speech.ai_summary_ru = None
-                    speech.save()
-                    cleared_count += 1
+                cleared_count += Speech.objects.filter(
+                    pk__in=[speech.pk for speech in speeches_to_clear]
+                ).update(ai_summary=None, ai_summary_en=None, ai_summary_ru=None, updated_at=now)
                 
                 # Clear politician profile AI summaries
-                for profile in politician_profiles_to_clear:
-                    profile.analysis = ""
-                    profile.analysis_en = None
-                    profile.analysis_ru = None
-                    profile.save()
-                    cleared_count += 1
+                cleared_count += PoliticianProfilePart.objects.filter(
+                    pk__in=[profile.pk for profile in politician_profiles_to_clear]
+                ).update(analysis="", analysis_en=None, analysis_ru=None, updated_at=now)
                 
                 # Clear media reaction AI summaries
-                for reaction in media_reactions_to_clear:
-                    reaction.media_analysis_et = ""
-                    reaction.media_analysis_en = None
-                    reaction.media_analysis_ru = None
-                    reaction.media_summary_et = ""
-                    reaction.media_summary_en = None
-                    reaction.media_summary_ru = None
-                    reaction.save()
-                    cleared_count += 1
+                cleared_count += MediaReaction.objects.filter(
+                    pk__in=[reaction.pk for reaction in media_reactions_to_clear]
+                ).update(
+                    media_analysis_et="", media_analysis_en=None, media_analysis_ru=None,
+                    media_summary_et="", media_summary_en=None, media_summary_ru=None,
+                    last_updated=now
+                )
                 
                 self.stdout.write(
                     self.style.SUCCESS(
@@ -3,14 +3,13 @@ Management command to parse speeches from Estonian Parliament API
 """
 import requests
 import logging
-import re
 import uuid
 import hashlib
 from datetime import datetime, timedelta
 from dateutil.parser import parse as parse_date
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from django.db import transaction
+from django.db import DatabaseError, transaction
 from django.utils import timezone
 from django.utils.html import strip_tags
 from django.core.files.base import ContentFile
@@ -672,6 +671,7 @@ class Command(BaseCommand):
         # Process events (speeches)
         events = agenda_item_data.get('events', [])
         total_events = len(events)
+        pending_speeches = []
         
         for event_data in events:
             # Track event types
@@ -679,20 +679,35 @@ class Command(BaseCommand):
             if event_types_stats is not None:
                 event_types_stats[event_type] = event_types_stats.get(event_type, 0) + 1
             
-            result = self.process_speech_event(agenda_item, event_data, processing_stats)
-            if result == 'created':
+            speech = self.process_speech_event(agenda_item, event_data, processing_stats)
+            if speech:
+                pending_speeches.append((event_type, speech))
+            else:  # skipped
+                skipped_events += 1
+                if processing_stats:
+                    processing_stats['speeches_skipped'] += 1
+        
+        # Insert the agenda item's new speeches in bulk
+        created_uuids, failed_uuids = self.save_speeches([speech for _, speech in pending_speeches])
+        
+        for event_type, speech in pending_speeches:
+            if speech.uuid in created_uuids:
+                created_uuids.discard(speech.uuid)
+                logger.debug(f"Created speech: {speech.speaker} - {speech.text[:50]}... (UUID: {str(speech.uuid)[:8]}...)")
                 speeches_count += 1
                 if processing_stats:
                     processing_stats['speeches_created'] += 1
                     # Track created speeches by event type
                     processing_stats['created_by_type'][event_type] = processing_stats['created_by_type'].get(event_type, 0) + 1
-            elif result == 'existed':
-                if processing_stats:
-                    processing_stats['speeches_already_existed'] += 1
-            else:  # result == False (skipped)
+            elif speech.uuid in failed_uuids:
                 skipped_events += 1
                 if processing_stats:
                     processing_stats['speeches_skipped'] += 1
+            else:
+                # Since we're using content-based UUIDs, if it already exists, it's truly the same content
+                logger.debug(f"Speech already exists: {speech.speaker} - {speech.text[:50]}... (UUID: {str(speech.uuid)[:8]}...)")
+                if processing_stats:
+                    processing_stats['speeches_already_existed'] += 1
         
         if total_events > 0:
             logger.info(f"Agenda item '{agenda_item.title[:50]}...': {speeches_count} speeches processed, {skipped_events} events skipped")
@@ -706,7 +721,7 @@ class Command(BaseCommand):
         return speeches_count
 
     def process_speech_event(self, agenda_item, event_data, processing_stats=None):
-        """Process a speech event"""
+        """Build an unsaved Speech for a speech event, or return False if the event is skipped"""
         event_uuid = event_data.get('uuid')
         event_type = event_data.get('type', 'SPEECH')
         
@@ -755,7 +770,7 @@ class Command(BaseCommand):
         # This ensures uniqueness and avoids API UUID duplication issues
         unique_content = f"{agenda_item.uuid}_{event_date.isoformat()}_{speaker_name}_{text}"
         content_hash = hashlib.sha256(unique_content.encode('utf-8')).hexdigest()
-        event_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, content_hash))
+        event_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, content_hash)
         
         # Track statistics
         if processing_stats:
@@ -764,39 +779,69 @@ class Command(BaseCommand):
             if event_data.get('uuid'):
                 processing_stats['uuid_from_api'] += 1
         
+        return Speech(
+            uuid=event_uuid,
+            agenda_item=agenda_item,
+            politician=politician,
+            event_type=event_type,
+            date=event_date,
+            speaker=speaker_name,
+            text=text,
+            link=event_data.get('link', ''),
+            is_incomplete=is_incomplete,
+            parsed_at=timezone.now()
+        )
+
+    def save_speeches(self, speeches):
+        """Insert the speeches that don't exist yet in bulk, returning (created UUIDs, failed UUIDs)"""
+        if not speeches:
+            return set(), set()
+        
+        existing_uuids = set(
+            Speech.objects.filter(uuid__in={speech.uuid for speech in speeches}).values_list('uuid', flat=True)
+        )
+        # The same event can appear twice in one agenda item; insert it once
+        new_speeches = {}
+        for speech in speeches:
+            if speech.uuid not in existing_uuids and speech.uuid not in new_speeches:
+                new_speeches[speech.uuid] = speech
+        
+        if not new_speeches:
+            return set(), set()
+        
+        # ignore_conflicts covers speeches inserted concurrently by another run; such speeches
+        # cannot be told apart from ours afterwards and are counted as created here
         try:
-            # Create speech
-            speech, created = Speech.objects.get_or_create(
-                uuid=event_uuid,
-                defaults={
-                    'agenda_item': agenda_item,
-                    'politician': politician,
-                    'event_type': event_type,
-                    'date': event_date,
-                    'speaker': speaker_name,
-                    'text': text,
-                    'link': event_data.get('link', ''),
-                    'is_incomplete': is_incomplete,
-                    'parsed_at': timezone.now()
-                }
-            )
-            
-            if created:
-                logger.debug(f"Created speech: {speaker_name} - {text[:50]}... (UUID: {event_uuid[:8]}...)")
-                return 'created'
+            # A savepoint, so a failed insert leaves the session's transaction usable
+            with transaction.atomic():
+                Speech.objects.bulk_create(new_speeches.values(), batch_size=1000, ignore_conflicts=True)
+        except DatabaseError as e:
+            # One bad row (e.g. a link or speaker longer than its column) fails the whole batch;
+            # insert one by one so only the offending speeches are lost
+            logger.warning(f"Bulk insert failed for agenda item {speeches[0].agenda_item_id}, "
+                           f"inserting speeches one by one: {e}")
+            return self.save_speeches_one_by_one(new_speeches.values())
+        
+        return set(new_speeches), set()
+
+    def save_speeches_one_by_one(self, speeches):
+        """Insert speeches one at a time, returning (created UUIDs, failed UUIDs)"""
+        created_uuids, failed_uuids = set(), set()
+        for speech in speeches:
+            try:
+                with transaction.atomic():
+                    Speech.objects.bulk_create([speech], ignore_conflicts=True)
+            except Exception as e:
+                error_msg = f"Failed to create speech: {e}"
+                logger.error(f"{error_msg} for {speech.speaker}")
+                self.log_error('DATABASE', error_msg, entity_type='speech',
+                              entity_id=str(speech.uuid),
+                              entity_name=speech.speaker,
+                              error_details=str(e))
+                failed_uuids.add(speech.uuid)
             else:
-                # Since we're using content-based UUIDs, if it already exists, it's truly the same content
-                logger.debug(f"Speech already exists: {speaker_name} - {text[:50]}... (UUID: {event_uuid[:8]}...)")
-                return 'existed'
-            
-        except Exception as e:
-            error_msg = f"Failed to create speech: {e}"
-            logger.error(f"{error_msg} for {speaker_name}")
-            self.log_error('DATABASE', error_msg, entity_type='speech',
-                          entity_id=event_uuid,
-                          entity_name=speaker_name,
-                          error_details=str(e))
-            return False
+                created_uuids.add(speech.uuid)
+        return created_uuids, failed_uuids
 
     def find_politician_by_name(self, speaker_name):
         """Try to find a politician by speaker name"""
@@ -832,11 +877,9 @@ class Command(BaseCommand):
         # Strip HTML tags
         cleaned = strip_tags(text)
         
-        # Normalize whitespace - replace multiple spaces/newlines with single space
-        cleaned = re.sub(r'\s+', ' ', cleaned)
-        
-        # Strip leading and trailing whitespace
-        cleaned = cleaned.strip()
+        # Normalize whitespace - collapse runs of spaces/newlines to a single space and
+        # strip both ends (str.split() matches the same Unicode whitespace as \s, without regex)
+        cleaned = ' '.join(cleaned.split())
         
         return cleaned
 
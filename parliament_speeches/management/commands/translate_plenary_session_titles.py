@@ -1,6 +1,7 @@
 """
 Management command to translate plenary session titles using AI providers with Batch API support
 """
+import json
 import time
 import logging
 import requests
@@ -10,7 +11,8 @@ from django.conf import settings
 from django.db import models
 
 from parliament_speeches.models import PlenarySession
-from .batch_api_mixin import GeminiBatchAPIMixin
+from .batch_api_mixin import (GeminiBatchAPIMixin, http_session, EN_TAG_RE, RU_TAG_RE,
+                              TARGET_LANGUAGE_NAMES, build_translation_prompt)
 
 logger = logging.getLogger(__name__)
 
@@ -389,10 +391,8 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
     
     def parse_tagged_translation(self, text):
         """Parse translation response with <en> and <ru> tags"""
-        import re
-        
-        en_match = re.search(r'<en>(.*?)</en>', text, re.DOTALL)
-        ru_match = re.search(r'<ru>(.*?)</ru>', text, re.DOTALL)
+        en_match = EN_TAG_RE.search(text)
+        ru_match = RU_TAG_RE.search(text)
         
         result = {}
         if en_match:
@@ -404,33 +404,14 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
     
     def call_ollama_translation(self, text, target_language):
         """Call Ollama API for translation"""
-        import requests
-        
         try:
             # Get Ollama configuration
             ollama_base_url = getattr(settings, 'OLLAMA_BASE_URL', 'http://localhost:11434')
             ollama_model = getattr(settings, 'OLLAMA_MODEL', 'gemma3:12b')
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -444,7 +425,7 @@ Estonian text:
             }
             
             start_time = time.time()
-            response = requests.post(
+            response = http_session.post(
                 f'{ollama_base_url}/api/generate',
                 json=data,
                 timeout=120,
@@ -454,20 +435,20 @@ Estonian text:
             
             if response.status_code == 200:
                 # Handle streaming response
-                content = ""
+                content_parts = []
                 if self.verbose:
                     self.stdout.write(f"   📤 Streaming translation:", ending='')
                     self.stdout.flush()
                 
-                for line in response.iter_lines():
+                # Ollama streams NDJSON: one complete JSON object per line. chunk_size=None
+                # hands over data as it arrives, and json.loads accepts the raw bytes line.
+                for line in response.iter_lines(chunk_size=None):
                     if line:
                         try:
-                            import json
-                            chunk = line.decode('utf-8')
-                            result = json.loads(chunk)  # Parse JSON line
+                            result = json.loads(line)
                             if 'response' in result:
                                 chunk_text = result['response']
-                                content += chunk_text
+                                content_parts.append(chunk_text)
                                 if self.verbose:
                                     self.stdout.write(chunk_text, ending='')
                                     self.stdout.flush()
@@ -476,6 +457,7 @@ Estonian text:
                         except Exception as e:
                             logger.error(f"Error parsing streaming chunk: {e}")
                             continue
+                content = ''.join(content_parts)
                 
                 if self.verbose:
                     self.stdout.write('')  # New line after streaming
@@ -514,8 +496,6 @@ Estonian text:
     
     def call_openai_translation(self, text, target_language):
         """Call OpenAI API for translation"""
-        import requests
-        
         try:
             # Get OpenAI configuration
             openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
@@ -526,25 +506,8 @@ Estonian text:
                 return None
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -567,7 +530,7 @@ Estonian text:
             }
             
             start_time = time.time()
-            response = requests.post(
+            response = http_session.post(
                 'https://api.openai.com/v1/chat/completions',
                 headers=headers,
                 json=data,
@@ -610,8 +573,6 @@ Estonian text:
     
     def call_gemini_translation(self, text, target_language):
         """Call Google Gemini API for translation"""
-        import requests
-        
         try:
             # Get Gemini configuration
             gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
@@ -622,25 +583,8 @@ Estonian text:
                 return None
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -672,7 +616,7 @@ Estonian text:
             url = f"https://generativelanguage.googleapis.com/v1beta/models/{gemini_model}:generateContent?key={gemini_api_key}"
             
             start_time = time.time()
-            response = requests.post(
+            response = http_session.post(
                 url,
                 headers=headers,
                 json=data,
@@ -734,21 +678,7 @@ Estonian text:
             return None  # Skip, already translated
         
         # Create prompt based on target language
-        if self.target_language == 'both':
-            prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-        elif self.target_language == 'en':
-            prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-        elif self.target_language == 'ru':
-            prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-        else:
-            return None
+        prompt = build_translation_prompt(self.target_language, text)
         
         return prompt
     
@@ -771,18 +701,3 @@ Estonian text:
         elif self.target_language == 'ru':
             session.title_ru = translation_text
             session.save(update_fields=['title_ru'])
-    
-    def parse_tagged_translation(self, text):
-        """Parse translation response with <en> and <ru> tags"""
-        import re
-        
-        en_match = re.search(r'<en>(.*?)</en>', text, re.DOTALL)
-        ru_match = re.search(r'<ru>(.*?)</ru>', text, re.DOTALL)
-        
-        result = {}
-        if en_match:
-            result['en'] = en_match.group(1).strip()
-        if ru_match:
-            result['ru'] = ru_match.group(1).strip()
-        
-        return result if result else None
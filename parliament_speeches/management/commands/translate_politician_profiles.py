@@ -19,6 +19,7 @@ Resume Feature:
 - The batch ID is displayed when the batch job is created
 - Skips file creation/upload and jumps directly to polling for results
 """
+import json
 import time
 import logging
 import requests
@@ -28,6 +29,8 @@ from django.conf import settings
 from django.db import models
 
 from parliament_speeches.models import PoliticianProfilePart, Politician
+from .batch_api_mixin import (http_session, EN_TAG_RE, RU_TAG_RE, TARGET_LANGUAGE_NAMES,
+                              build_translation_prompt)
 
 logger = logging.getLogger(__name__)
 
@@ -573,10 +576,8 @@ class Command(BaseCommand):
     
     def parse_tagged_translation(self, text):
         """Parse translation response with <en> and <ru> tags"""
-        import re
-        
-        en_match = re.search(r'<en>(.*?)</en>', text, re.DOTALL)
-        ru_match = re.search(r'<ru>(.*?)</ru>', text, re.DOTALL)
+        en_match = EN_TAG_RE.search(text)
+        ru_match = RU_TAG_RE.search(text)
         
         result = {}
         if en_match:
@@ -588,33 +589,14 @@ class Command(BaseCommand):
     
     def call_ollama_translation(self, text, target_language):
         """Call Ollama API for translation"""
-        import requests
-        
         try:
             # Get Ollama configuration
             ollama_base_url = getattr(settings, 'OLLAMA_BASE_URL', 'http://localhost:11434')
             ollama_model = getattr(settings, 'OLLAMA_MODEL', 'gemma3:12b')
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -628,7 +610,7 @@ Estonian text:
             }
             
             start_time = time.time()
-            response = requests.post(
+            response = http_session.post(
                 f'{ollama_base_url}/api/generate',
                 json=data,
                 timeout=120,
@@ -638,20 +620,20 @@ Estonian text:
             
             if response.status_code == 200:
                 # Handle streaming response
-                content = ""
+                content_parts = []
                 if self.verbose:
                     self.stdout.write(f"   📤 Streaming translation:", ending='')
                     self.stdout.flush()
                 
-                for line in response.iter_lines():
+                # Ollama streams NDJSON: one complete JSON object per line. chunk_size=None
+                # hands over data as it arrives, and json.loads accepts the raw bytes line.
+                for line in response.iter_lines(chunk_size=None):
                     if line:
                         try:
-                            import json
-                            chunk = line.decode('utf-8')
-                            result = json.loads(chunk)  # Parse JSON line
+                            result = json.loads(line)
                             if 'response' in result:
                                 chunk_text = result['response']
-                                content += chunk_text
+                                content_parts.append(chunk_text)
                                 if self.verbose:
                                     self.stdout.write(chunk_text, ending='')
                                     self.stdout.flush()
@@ -660,6 +642,7 @@ Estonian text:
                         except Exception as e:
                             logger.error(f"Error parsing streaming chunk: {e}")
                             continue
+                content = ''.join(content_parts)
                 
                 if self.verbose:
                     self.stdout.write('')  # New line after streaming
@@ -698,8 +681,6 @@ Estonian text:
     
     def call_openai_translation(self, text, target_language):
         """Call OpenAI API for translation"""
-        import requests
-        
         try:
             # Get OpenAI configuration
             openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
@@ -710,25 +691,8 @@ Estonian text:
                 return None
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -751,7 +715,7 @@ Estonian text:
             }
             
             start_time = time.time()
-            response = requests.post(
+            response = http_session.post(
                 'https://api.openai.com/v1/chat/completions',
                 headers=headers,
                 json=data,
@@ -794,8 +758,6 @@ Estonian text:
     
     def call_gemini_translation(self, text, target_language):
         """Call Google Gemini API for translation"""
-        import requests
-        
         try:
             # Get Gemini configuration
             gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
@@ -806,25 +768,8 @@ Estonian text:
                 return None
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -856,7 +801,7 @@ Estonian text:
             url = f"https://generativelanguage.googleapis.com/v1beta/models/{gemini_model}:generateContent?key={gemini_api_key}"
             
             start_time = time.time()
-            response = requests.post(
+            response = http_session.post(
                 url,
                 headers=headers,
                 json=data,
@@ -1046,22 +991,8 @@ Estonian text:
                 continue
             
             # Create translation prompt
-            if needs_en and needs_ru:
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{item.analysis}"""
-            elif needs_en:
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{item.analysis}"
-            elif needs_ru:
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{item.analysis}"
-            else:
-                # This should never happen due to the continue above, but satisfies linter
-                continue
+            prompt_language = 'both' if needs_en and needs_ru else ('en' if needs_en else 'ru')
+            prompt = build_translation_prompt(prompt_language, item.analysis)
             
             # Create batch request
             request_data = {
@@ -1115,7 +1046,7 @@ Estonian text:
             'file': ('batch_requests.jsonl', file_content, 'application/json')
         }
         
-        response = requests.post(url, headers=headers, files=files, timeout=120)
+        response = http_session.post(url, headers=headers, files=files, timeout=120)
         
         if response.status_code == 200:
             result = response.json()
@@ -1151,7 +1082,7 @@ Estonian text:
             }
         }
         
-        response = requests.post(url, headers=headers, json=data, timeout=120)
+        response = http_session.post(url, headers=headers, json=data, timeout=120)
         
         if response.status_code == 200:
             result = response.json()
@@ -1173,7 +1104,7 @@ Estonian text:
         first_unknown = True  # Flag to show response once if status is unknown
         
         while elapsed_time < max_wait_seconds:
-            response = requests.get(url, timeout=30)
+            response = http_session.get(url, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -1314,7 +1245,7 @@ Estonian text:
         
         # Try direct download
         download_url = f"https://generativelanguage.googleapis.com/v1beta/{result_file_uri}?alt=media&key={gemini_api_key}"
-        response = requests.get(download_url, timeout=120)
+        response = http_session.get(download_url, timeout=120)
         
         if response.status_code == 200:
             # Parse JSONL response
@@ -1,22 +1,308 @@
 """
 Management command to translate speech summaries using AI providers with Batch API support
 """
+import hashlib
+import json
+import re
 import time
 import logging
+import threading
 import requests
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from typing import Dict, List, Optional, Tuple, Union
 
-from parliament_speeches.models import Speech, AgendaItem
-from .batch_api_mixin import GeminiBatchAPIMixin
+from parliament_speeches.models import Speech, AgendaItem, TranslationCache
+from .batch_api_mixin import (GeminiBatchAPIMixin, EN_TAG_RE, RU_TAG_RE, TARGET_LANGUAGE_NAMES,
+                              build_translation_prompt)
 
 logger = logging.getLogger(__name__)
 
+# Speech columns read or written while translating; everything else stays deferred
+TRANSLATION_FIELDS = ('pk', 'speaker', 'date', 'ai_summary', 'ai_summary_en', 'ai_summary_ru')
+
+# NLLB-200 language codes used by the local translation server (--ai-provider=nllb)
+NLLB_LANGUAGE_CODES = {
+    'et': 'est_Latn',
+    'en': 'eng_Latn',
+    'ru': 'rus_Cyrl',
+}
+
+# Maximum number of sentences sent to the NLLB server in one request
+NLLB_MAX_BATCH_SIZE = 32
+
+# Sentence boundaries: whitespace following terminal punctuation
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Markdown kept out of NLLB input: line breaks, line prefixes (headings, list items, quotes) and bold markers
+_LINE_BREAKS_RE = re.compile(r'(\n+)')
+_MARKDOWN_PREFIX_RE = re.compile(r'\s*(?:(?:#{1,6}|[-*+>]|\d+[.)])\s+)*')
+_MARKDOWN_EMPHASIS_RE = re.compile(r'(\*\*|__)')
+
+# Number of translated speeches the main thread writes per bulk_update while workers keep translating
+SAVE_BATCH_SIZE = 50
+
+# Number of translations kept in memory in front of the TranslationCache table
+MEMORY_CACHE_SIZE = 4096
+
+# Number of streamed Ollama chunks to buffer before echoing them in verbose mode
+STREAM_OUTPUT_CHUNKS = 64
+
+# Matches rate limit reset durations such as "1s", "250ms" or "6m0s"
+_RESET_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+
+
+def split_markdown_sentences(text: str) -> Tuple[List[Union[str, Tuple[int, int]]], List[str]]:
+    """
+    Split markdown into the sentences to translate and the pieces to rebuild it from
+
+    Pieces are either markup kept as-is (line breaks, list/heading prefixes, bold markers,
+    surrounding whitespace) or (first sentence index, sentence count) for translated text.
+    """
+    pieces, sentences = [], []
+    for line in _LINE_BREAKS_RE.split(text):
+        prefix = _MARKDOWN_PREFIX_RE.match(line).group()
+        rest = line[len(prefix):]
+        if not any(char.isalpha() for char in rest):
+            # Line breaks, blank lines and rules such as '---'
+            pieces.append(line)
+            continue
+        pieces.append(prefix)
+        for chunk in _MARKDOWN_EMPHASIS_RE.split(rest):
+            stripped = chunk.strip()
+            if not stripped or _MARKDOWN_EMPHASIS_RE.fullmatch(chunk):
+                pieces.append(chunk)
+                continue
+            chunk_sentences = _SENTENCE_SPLIT_RE.split(stripped)
+            pieces.extend([
+                chunk[:len(chunk) - len(chunk.lstrip())],
+                (len(sentences), len(chunk_sentences)),
+                chunk[len(chunk.rstrip()):],
+            ])
+            sentences.extend(chunk_sentences)
+    return pieces, sentences
+
+
+def join_markdown_sentences(pieces: List[Union[str, Tuple[int, int]]], translated: List[str]) -> str:
+    """Rebuild markdown split by split_markdown_sentences from the translated sentences"""
+    return ''.join(
+        piece if isinstance(piece, str) else ' '.join(translated[piece[0]:piece[0] + piece[1]])
+        for piece in pieces
+    ).strip()
+
+
+def parse_tagged_translation(text: str) -> Optional[Dict[str, str]]:
+    """Parse translation response with <en> and <ru> tags"""
+    en_match = EN_TAG_RE.search(text)
+    ru_match = RU_TAG_RE.search(text)
+    
+    result: Dict[str, str] = {}
+    if en_match:
+        result['en'] = en_match.group(1).strip()
+    if ru_match:
+        result['ru'] = ru_match.group(1).strip()
+    
+    return result if result else None
+
+
+def format_eta(elapsed_seconds: float, completed: int, total: int) -> str:
+    """Format the remaining time estimate from the average time per completed item"""
+    if completed <= 0:
+        return "calculating..."
+    eta_seconds = elapsed_seconds / completed * (total - completed)
+    eta_minutes = eta_seconds / 60
+    return f"{eta_minutes:.1f}m" if eta_minutes >= 1 else f"{eta_seconds:.0f}s"
+
+
+def iter_stream_lines(response):
+    """
+    Yield newline-delimited lines (as bytes) from a streamed response.
+    
+    Reads chunks as the server sends them into one rolling buffer and splits
+    on newlines in place, avoiding iter_lines' fixed-size reads and per-chunk
+    splitlines copies.
+    """
+    buffer = bytearray()
+    for data in response.iter_content(chunk_size=None):
+        buffer += data
+        start = 0
+        while True:
+            newline = buffer.find(b'\n', start)
+            if newline == -1:
+                break
+            if newline > start:
+                yield bytes(buffer[start:newline])
+            start = newline + 1
+        del buffer[:start]
+    if buffer.strip():
+        yield bytes(buffer)
+
+
+def iter_sse_data(response):
+    """Yield the data payload of each server-sent event until the stream ends or reports [DONE]"""
+    for line in iter_stream_lines(response):
+        if not line.startswith(b'data:'):
+            continue
+        payload = line[5:].strip()
+        if payload == b'[DONE]':
+            return
+        if payload:
+            yield payload
+
+
+def openai_stream_text(event):
+    """Extract the text delta from an OpenAI chat completion stream chunk"""
+    choices = event.get('choices') or [{}]
+    return choices[0].get('delta', {}).get('content')
+
+
+def gemini_stream_text(event):
+    """Extract the text delta from a Gemini streamGenerateContent chunk"""
+    candidates = event.get('candidates') or [{}]
+    parts = candidates[0].get('content', {}).get('parts', [])
+    return ''.join(part.get('text', '') for part in parts)
+
+
+class TaggedStreamParser:
+    """
+    Incrementally extract <en>…</en> and <ru>…</ru> sections from streamed text.
+    
+    A small OUTSIDE / IN_EN / IN_RU state machine. Each chunk is scanned together with
+    a few carried-over characters (enough to match a tag split across chunks), so the
+    work per chunk does not grow with the response; callers know the moment both
+    sections are closed and can stop reading the rest of the stream.
+    """
+    OUTSIDE = None
+    OPEN_TAGS = {'<en>': 'en', '<ru>': 'ru'}
+    
+    def __init__(self):
+        self.sections: Dict[str, str] = {}
+        self._chunks: List[str] = []
+        self._state = self.OUTSIDE
+        self._section_parts: List[str] = []
+        self._tail = ''
+    
+    @property
+    def text(self) -> str:
+        """The full streamed text (joined on each access; read it once the stream ends)"""
+        return ''.join(self._chunks)
+    
+    @property
+    def complete(self) -> bool:
+        return 'en' in self.sections and 'ru' in self.sections
+    
+    def feed(self, chunk: str) -> None:
+        """Append a streamed chunk and advance the parser over it"""
+        self._chunks.append(chunk)
+        buffer = self._tail + chunk
+        while True:
+            if self._state is self.OUTSIDE:
+                found = [(buffer.find(tag), tag) for tag in self.OPEN_TAGS]
+                found = [(pos, tag) for pos, tag in found if pos != -1]
+                if not found:
+                    # Keep enough tail to match a tag split across chunks
+                    self._tail = buffer[-3:]
+                    return
+                pos, tag = min(found)
+                self._state = self.OPEN_TAGS[tag]
+                self._section_parts = []
+                buffer = buffer[pos + len(tag):]
+            else:
+                close_tag = f'</{self._state}>'
+                pos = buffer.find(close_tag)
+                if pos == -1:
+                    # Section text is collected in parts; only a possible partial close tag is carried over
+                    keep = len(close_tag) - 1
+                    if len(buffer) > keep:
+                        self._section_parts.append(buffer[:-keep])
+                        buffer = buffer[-keep:]
+                    self._tail = buffer
+                    return
+                self._section_parts.append(buffer[:pos])
+                # The first complete section wins, matching parse_tagged_translation
+                self.sections.setdefault(self._state, ''.join(self._section_parts).strip())
+                self._state = self.OUTSIDE
+                buffer = buffer[pos + len(close_tag):]
+
+
+class ProviderRateLimiter:
+    """
+    Thread-safe token bucket shared by all parallel workers.
+    
+    Paces requests to an optional fixed requests-per-minute budget and pauses
+    every worker when the provider reports an exhausted quota via
+    Retry-After or X-RateLimit headers.
+    """
+    
+    def __init__(self, requests_per_minute=None):
+        self.rate = requests_per_minute / 60.0 if requests_per_minute else None
+        self.capacity = max(1.0, self.rate) if self.rate else 1.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                wait_seconds = self.blocked_until - now
+                if wait_seconds <= 0:
+                    if not self.rate:
+                        return
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                    self.updated_at = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+    
+    def update_from_response(self, response):
+        """Pause all workers if the response says the quota is exhausted"""
+        headers = response.headers
+        pause_seconds = 0.0
+        
+        retry_after = headers.get('Retry-After')
+        if retry_after and response.status_code in (429, 503):
+            try:
+                pause_seconds = float(retry_after)
+            except ValueError:
+                pause_seconds = 1.0
+        
+        remaining = headers.get('X-RateLimit-Remaining-Requests') or headers.get('X-RateLimit-Remaining')
+        if remaining is not None and remaining.strip() == '0':
+            reset = headers.get('X-RateLimit-Reset-Requests') or headers.get('X-RateLimit-Reset')
+            pause_seconds = max(pause_seconds, self._parse_reset_seconds(reset))
+        
+        if pause_seconds > 0:
+            with self.lock:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + pause_seconds)
+    
+    @staticmethod
+    def _parse_reset_seconds(value):
+        """Parse reset header values like "20", "1.5s" or "6m0s" into seconds"""
+        if not value:
+            return 1.0
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        
+        multipliers = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+        seconds = sum(float(amount) * multipliers[unit] for amount, unit in _RESET_DURATION_RE.findall(value))
+        return seconds or 1.0
+
 
 class Command(GeminiBatchAPIMixin, BaseCommand):
-    help = 'Translate speech AI summaries to English and Russian using AI providers (OpenAI, Gemini, Ollama)'
+    help = 'Translate speech AI summaries to English and Russian using AI providers (OpenAI, Gemini, Ollama, local NLLB)'
+    batch_api_providers = ('gemini', 'openai')
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -62,6 +348,13 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
             default=1.0,
             help='Delay between API calls in seconds (default: 1.0)'
         )
+        parser.add_argument(
+            '--requests-per-minute',
+            type=int,
+            default=None,
+            help='Maximum provider requests per minute across all parallel workers (default: unlimited, '
+                 'paced only by provider rate limit headers)'
+        )
         parser.add_argument(
             '--batch-size',
             type=int,
@@ -71,9 +364,15 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         parser.add_argument(
             '--ai-provider',
             type=str,
-            choices=['ollama', 'openai', 'gemini'],
+            choices=['ollama', 'openai', 'gemini', 'nllb'],
             default='gemini',
-            help='AI provider to use for translation (ollama, openai, gemini). Default: gemini.'
+            help='AI provider to use for translation (ollama, openai, gemini, nllb - local NLLB-200 '
+                 'translation server). Default: gemini.'
+        )
+        parser.add_argument(
+            '--skip-cache',
+            action='store_true',
+            help='Do not reuse cached translations (fresh results are still stored in the cache)'
         )
         parser.add_argument(
             '--verbose',
@@ -92,6 +391,12 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         self.overwrite = options['overwrite']
         self.ai_provider = options['ai_provider']
         self.verbose = options['verbose']
+        self.skip_cache = options['skip_cache']
+        self.recent_translations = OrderedDict()
+        self.recent_translations_lock = threading.Lock()
+        self._load_provider_settings()
+        self.http = self._create_http_session()
+        self.rate_limiter = ProviderRateLimiter(options['requests_per_minute'])
         
         # Initialize batch API settings
         self.initialize_batch_api(options)
@@ -101,7 +406,7 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         
         # Check if we're resuming a batch job
         if self.resume_from_batch_id:
-            self.stdout.write(self.style.HTTP_INFO(f"RESUMING Google Gemini BATCH API job: {self.resume_from_batch_id}"))
+            self.stdout.write(self.style.HTTP_INFO(f"RESUMING {self.ai_provider.upper()} BATCH API job: {self.resume_from_batch_id}"))
             self.stdout.write("=" * 80)
             self.resume_batch_job_only(
                 self.resume_from_batch_id,
@@ -112,14 +417,21 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
 
         # Display AI provider being used
         if self.ai_provider == 'ollama':
-            ollama_url = getattr(settings, 'OLLAMA_BASE_URL', 'http://localhost:11434')
-            ollama_model = getattr(settings, 'OLLAMA_MODEL', 'gemma3:12b')
+            ollama_url = self.ollama_base_url
+            ollama_model = self.ollama_model
             self.stdout.write(f"Using Ollama for translations ({ollama_model} at {ollama_url})")
         elif self.ai_provider == 'openai':
             self.stdout.write("Using OpenAI for translations")
         elif self.ai_provider == 'gemini':
             self.stdout.write("Using Google Gemini for translations")
+        elif self.ai_provider == 'nllb':
+            nllb_url = self.nllb_base_url
+            nllb_model = self.nllb_model
+            self.stdout.write(f"Using local NLLB server for translations ({nllb_model} at {nllb_url})")
 
+        # Worker pool shared for the whole run so threads (and their warm connections) are reused
+        self.executor = ThreadPoolExecutor(max_workers=self.batch_size, thread_name_prefix='translate')
+        
         try:
             if options['speech_id']:
                 # Process specific speech
@@ -139,6 +451,46 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         except Exception as e:
             logger.exception("Error during speech translation")
             raise CommandError(f"Error during processing: {str(e)}")
+        finally:
+            self.executor.shutdown(wait=True)
+
+    def _load_provider_settings(self):
+        """Read provider configuration once per run instead of on every translation call"""
+        self.ollama_base_url = getattr(settings, 'OLLAMA_BASE_URL', 'http://localhost:11434')
+        self.ollama_model = getattr(settings, 'OLLAMA_MODEL', 'gemma3:12b')
+        self.openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
+        self.openai_model = getattr(settings, 'OPENAI_MODEL', 'gpt-4o-mini')
+        self.gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
+        self.gemini_model = getattr(settings, 'GEMINI_MODEL', 'gemini-2.5-flash-lite-preview-09-2025')
+        self.nllb_base_url = getattr(settings, 'NLLB_BASE_URL', 'http://localhost:8080')
+        self.nllb_model = getattr(settings, 'NLLB_MODEL', 'nllb-200-distilled-600M')
+    
+    def _create_http_session(self):
+        """Create a pooled HTTP session so parallel workers reuse keep-alive connections"""
+        # Only idempotent requests are retried on error statuses and read errors: a repeated
+        # generation POST would be billed again. Connection errors (nothing sent) are retried for POST too
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=max(self.batch_size, 10),
+            pool_maxsize=max(self.batch_size * 4, 10),
+            max_retries=retry
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _post_to_provider(self, url, **kwargs):
+        """POST to an AI provider, respecting the shared rate limiter"""
+        self.rate_limiter.acquire()
+        response = self.http.post(url, **kwargs)
+        self.rate_limiter.update_from_response(response)
+        return response
 
     def process_specific_speech(self, speech_id, overwrite):
         """Process a specific speech by ID"""
@@ -177,7 +529,7 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         # Get speeches for this agenda item that have AI summaries
         queryset = agenda.speeches.filter(
             ai_summary__isnull=False
-        ).exclude(ai_summary='').select_related('politician', 'agenda_item')
+        ).exclude(ai_summary='').only(*TRANSLATION_FIELDS)
         
         if not overwrite:
             if self.target_language == 'en':
@@ -191,56 +543,24 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         
         speeches = queryset.order_by('-date')
         
-        if not speeches.exists():
+        speeches_list = list(speeches)
+        if not speeches_list:
             self.stdout.write(f"No speeches found for agenda item {agenda_id} that need translation")
             return
 
-        total_count = speeches.count()
+        total_count = len(speeches_list)
         self.stdout.write(f"Processing agenda item: {agenda.title[:100]}...")
         self.stdout.write(f"Found {total_count} speeches to translate for agenda item {agenda_id}")
         self.stdout.write("=" * 60)
         
-        processed = 0
-        errors = 0
-        start_time = time.time()
-        
-        # Process speeches in batches
-        speeches_list = list(speeches)
-        total_batches = (len(speeches_list) + self.batch_size - 1) // self.batch_size
-        
-        for batch_num in range(total_batches):
-            batch_start = batch_num * self.batch_size
-            batch_end = min(batch_start + self.batch_size, len(speeches_list))
-            batch_speeches = speeches_list[batch_start:batch_end]
-            
-            self.stdout.write(f"\n{'='*20} BATCH {batch_num + 1}/{total_batches} {'='*20}")
-            self.stdout.write(f"Processing {len(batch_speeches)} speeches in parallel...")
-            
-            batch_processed, batch_errors = self._process_batch(
-                batch_speeches, batch_start, len(speeches_list), start_time
-            )
-            
-            processed += batch_processed
-            errors += batch_errors
-        
-        # Final summary with timing
-        total_time = time.time() - start_time
-        avg_time_per_speech = total_time / total_count if total_count > 0 else 0
-        
-        self.stdout.write("\n" + "=" * 60)
-        self.stdout.write(self.style.SUCCESS("PROCESSING COMPLETE"))
-        self.stdout.write(f"Agenda item: {agenda.title[:100]}...")
-        self.stdout.write(f"Total time: {total_time/60:.1f} minutes ({total_time:.1f} seconds)")
-        self.stdout.write(f"Average time per speech: {avg_time_per_speech:.1f} seconds")
-        self.stdout.write(f"Batch size: {self.batch_size} parallel requests")
-        self.stdout.write(f"Successfully processed: {processed}/{total_count} speeches")
-        if errors > 0:
-            self.stdout.write(self.style.ERROR(f"Errors encountered: {errors}"))
-        else:
-            self.stdout.write(self.style.SUCCESS("No errors encountered!"))
+        if self._maybe_dispatch_batch_api(speeches_list):
+            return
         
-        if self.dry_run:
-            self.stdout.write(self.style.WARNING("Note: This was a dry run - no translations were saved to database"))
+        processed, copied, errors, total_time = self._process_in_batches(speeches_list)
+        self._write_processing_summary(
+            total_count, processed, copied, errors, total_time,
+            context_line=f"Agenda item: {agenda.title[:100]}..."
+        )
 
     def process_session_speeches(self, plenary_session_id, overwrite):
         """Process all speeches from a specific plenary session"""
@@ -255,7 +575,7 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         queryset = Speech.objects.filter(
             agenda_item__plenary_session=session,
             ai_summary__isnull=False
-        ).exclude(ai_summary='').select_related('politician', 'agenda_item')
+        ).exclude(ai_summary='').only(*TRANSLATION_FIELDS)
         
         if not overwrite:
             if self.target_language == 'en':
@@ -269,64 +589,32 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         
         speeches = queryset.order_by('-date')
         
-        if not speeches.exists():
+        speeches_list = list(speeches)
+        if not speeches_list:
             self.stdout.write(f"No speeches found in plenary session {plenary_session_id} that need translation")
             return
 
-        total_count = speeches.count()
+        total_count = len(speeches_list)
         self.stdout.write(f"Processing plenary session: {session.title[:100]}...")
         self.stdout.write(f"Session date: {session.date}")
         self.stdout.write(f"Found {total_count} speeches to translate from plenary session {plenary_session_id}")
         self.stdout.write("=" * 60)
         
-        processed = 0
-        errors = 0
-        start_time = time.time()
-        
-        # Process speeches in batches
-        speeches_list = list(speeches)
-        total_batches = (len(speeches_list) + self.batch_size - 1) // self.batch_size
-        
-        for batch_num in range(total_batches):
-            batch_start = batch_num * self.batch_size
-            batch_end = min(batch_start + self.batch_size, len(speeches_list))
-            batch_speeches = speeches_list[batch_start:batch_end]
-            
-            self.stdout.write(f"\n{'='*20} BATCH {batch_num + 1}/{total_batches} {'='*20}")
-            self.stdout.write(f"Processing {len(batch_speeches)} speeches in parallel...")
-            
-            batch_processed, batch_errors = self._process_batch(
-                batch_speeches, batch_start, len(speeches_list), start_time
-            )
-            
-            processed += batch_processed
-            errors += batch_errors
-        
-        # Final summary with timing
-        total_time = time.time() - start_time
-        avg_time_per_speech = total_time / total_count if total_count > 0 else 0
-        
-        self.stdout.write("\n" + "=" * 60)
-        self.stdout.write(self.style.SUCCESS("PROCESSING COMPLETE"))
-        self.stdout.write(f"Plenary session: {session.title[:100]}...")
-        self.stdout.write(f"Total time: {total_time/60:.1f} minutes ({total_time:.1f} seconds)")
-        self.stdout.write(f"Average time per speech: {avg_time_per_speech:.1f} seconds")
-        self.stdout.write(f"Batch size: {self.batch_size} parallel requests")
-        self.stdout.write(f"Successfully processed: {processed}/{total_count} speeches")
-        if errors > 0:
-            self.stdout.write(self.style.ERROR(f"Errors encountered: {errors}"))
-        else:
-            self.stdout.write(self.style.SUCCESS("No errors encountered!"))
+        if self._maybe_dispatch_batch_api(speeches_list):
+            return
         
-        if self.dry_run:
-            self.stdout.write(self.style.WARNING("Note: This was a dry run - no translations were saved to database"))
+        processed, copied, errors, total_time = self._process_in_batches(speeches_list)
+        self._write_processing_summary(
+            total_count, processed, copied, errors, total_time,
+            context_line=f"Plenary session: {session.title[:100]}..."
+        )
 
     def process_speeches(self, limit, overwrite):
         """Process multiple speeches"""
         # Get speeches that have AI summaries but need translations
         queryset = Speech.objects.filter(
             ai_summary__isnull=False
-        ).exclude(ai_summary='').select_related('politician', 'agenda_item')
+        ).exclude(ai_summary='').only(*TRANSLATION_FIELDS)
         
         if not overwrite:
             if self.target_language == 'en':
@@ -343,61 +631,208 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         if limit is not None:
             speeches = speeches[:limit]
         
-        if not speeches.exists():
+        speeches_list = list(speeches)
+        if not speeches_list:
             self.stdout.write("No speeches found that need translation")
             return
 
-        total_count = speeches.count()
+        total_count = len(speeches_list)
         self.stdout.write(f"Found {total_count} speeches to translate")
         self.stdout.write("=" * 60)
         
-        speeches_list = list(speeches)
-        
-        # Use Gemini Batch API if enabled
-        if self.should_use_batch_api():
-            self.stdout.write(self.style.HTTP_INFO(f"Using Google Gemini BATCH API for speeches"))
-            self.stdout.write("=" * 80)
-            self.process_batch_with_chunking(
-                speeches_list,
-                "speeches",
-                self._create_speech_translation_prompt,
-                self._update_speech_with_translation
-            )
+        if self._maybe_dispatch_batch_api(speeches_list):
             return
         
-        # Original parallel processing logic
+        processed, copied, errors, total_time = self._process_in_batches(speeches_list)
+        self._write_processing_summary(total_count, processed, copied, errors, total_time)
+    
+    def _maybe_dispatch_batch_api(self, speeches_list):
+        """Hand speeches to the provider's Batch API if enabled. Returns True if dispatched."""
+        if not self.should_use_batch_api():
+            return False
+        
+        representatives, duplicates_by_pk = self._group_duplicate_summaries(speeches_list)
+        translated_speeches = []
+        
+        def update_and_remember(speech, translation_text):
+            updated_fields = self._update_speech_with_translation(speech, translation_text)
+            translated_speeches.append(speech)
+            return updated_fields
+        
+        self.stdout.write(self.style.HTTP_INFO(f"Using {self.ai_provider.upper()} BATCH API for speeches"))
+        self.stdout.write("=" * 80)
+        self.process_batch_with_chunking(
+            representatives,
+            "speeches",
+            self._create_speech_translation_prompt,
+            update_and_remember
+        )
+        
+        # Duplicates are copied in one bulk_update once the mixin has saved every representative
+        # (a failed save raises out of process_batch_with_chunking, so none are copied then)
+        copied = self._copy_translations_to_duplicates(translated_speeches, duplicates_by_pk)
+        if copied:
+            self.stdout.write(f"Copied translations to {copied} speeches with identical summaries")
+        return True
+    
+    def _process_in_batches(self, speeches_list):
+        """
+        Translate speeches concurrently on the shared worker pool.
+        
+        Returns (processed, copied, errors, total_time): processed and errors count the
+        distinct summaries, copied the duplicate speeches that received their translation.
+        """
         processed = 0
+        copied = 0
         errors = 0
         start_time = time.time()
         
-        # Process speeches in batches
-        total_batches = (len(speeches_list) + self.batch_size - 1) // self.batch_size
+        # Translate each distinct summary once and copy the result to its duplicates
+        representatives, duplicates_by_pk = self._group_duplicate_summaries(speeches_list)
+        total_count = len(representatives)
         
-        for batch_num in range(total_batches):
-            batch_start = batch_num * self.batch_size
-            batch_end = min(batch_start + self.batch_size, len(speeches_list))
-            batch_speeches = speeches_list[batch_start:batch_end]
-            
-            self.stdout.write(f"\n{'='*20} BATCH {batch_num + 1}/{total_batches} {'='*20}")
-            self.stdout.write(f"Processing {len(batch_speeches)} speeches in parallel...")
+        self.stdout.write(f"Processing {total_count} speeches with {self.batch_size} parallel workers...")
+        
+        # Workers only call the AI provider; this thread writes finished speeches in
+        # batches, so database writes overlap with the requests still in flight
+        translated_speeches = []
+        finished_speeches = []
+        
+        self._preload_cached_translations(
+            [speech.ai_summary for speech in representatives if self._needs_translation(speech)]
+        )
+        
+        # Submit everything up front so workers never idle waiting for the slowest speech
+        # of a batch; the pool size bounds the number of in-flight requests
+        future_to_speech = {}
+        for idx, speech in enumerate(representatives):
+            if not self._needs_translation(speech):
+                processed += 1
+                finished_speeches.append(speech)
+                continue
+            future = self.executor.submit(self._process_single_speech, speech, idx + 1, total_count, start_time)
+            future_to_speech[future] = speech
+        
+        completed = processed
+        for future in as_completed(future_to_speech):
+            speech = future_to_speech[future]
+            try:
+                if future.result():
+                    processed += 1
+                    translated_speeches.append(speech)
+                    finished_speeches.append(speech)
+                else:
+                    errors += 1
+            except Exception as e:
+                errors += 1
+                logger.exception(f"Error in parallel processing for speech {speech.pk}")
+                self.stdout.write(self.style.ERROR(f"✗ Error processing speech {speech.pk}: {str(e)}"))
             
-            batch_processed, batch_errors = self._process_batch(
-                batch_speeches, batch_start, len(speeches_list), start_time
-            )
+            if len(translated_speeches) >= SAVE_BATCH_SIZE:
+                batch_copied, save_errors = self._save_translated_speeches(translated_speeches, finished_speeches, duplicates_by_pk)
+                copied += batch_copied
+                processed -= save_errors
+                errors += save_errors
             
-            processed += batch_processed
-            errors += batch_errors
-
-        # Final summary with timing
-        total_time = time.time() - start_time
+            completed += 1
+            if completed % self.batch_size == 0 or completed == total_count:
+                eta_display = format_eta(time.time() - start_time, completed, total_count)
+                self.stdout.write(
+                    f"Progress: {completed}/{total_count} ({completed / total_count * 100:.1f}%) - "
+                    f"{processed} successful, {errors} errors - ETA: {eta_display}"
+                )
+        
+        batch_copied, save_errors = self._save_translated_speeches(translated_speeches, finished_speeches, duplicates_by_pk)
+        copied += batch_copied
+        processed -= save_errors
+        errors += save_errors
+        
+        return processed, copied, errors, time.time() - start_time
+    
+    def _save_translated_speeches(self, translated_speeches, finished_speeches, duplicates_by_pk):
+        """
+        Write translated speeches with bulk_update and copy the results to their duplicates.
+        
+        Both lists are cleared. Returns (duplicate speeches updated, translated speeches that failed to save).
+        """
+        try:
+            # One transaction, so a failure leaves neither the speeches nor their duplicates half-written
+            with transaction.atomic():
+                if translated_speeches and not self.dry_run:
+                    Speech.objects.bulk_update(translated_speeches, ['ai_summary_en', 'ai_summary_ru'], batch_size=SAVE_BATCH_SIZE)
+                return self._copy_translations_to_duplicates(finished_speeches, duplicates_by_pk), 0
+        except Exception as e:
+            logger.exception("Failed to save translated speeches")
+            self.stdout.write(self.style.ERROR(f"✗ Failed to save {len(translated_speeches)} translated speeches: {str(e)}"))
+            return 0, len(translated_speeches)
+        finally:
+            translated_speeches.clear()
+            finished_speeches.clear()
+    
+    def _group_duplicate_summaries(self, speeches_list):
+        """
+        Group speeches whose AI summaries are identical.
+        
+        Returns (representatives, duplicates_by_pk) where duplicates_by_pk maps each
+        representative's pk to the other speeches sharing its summary.
+        """
+        representatives = []
+        duplicates_by_pk = {}
+        representative_by_digest = {}
+        
+        for speech in speeches_list:
+            digest = hashlib.blake2b(speech.ai_summary.encode('utf-8'), digest_size=16).digest()
+            representative = representative_by_digest.get(digest)
+            if representative is None:
+                representative_by_digest[digest] = speech
+                representatives.append(speech)
+                duplicates_by_pk[speech.pk] = []
+            else:
+                duplicates_by_pk[representative.pk].append(speech)
+        
+        duplicate_count = len(speeches_list) - len(representatives)
+        if duplicate_count:
+            self.stdout.write(f"Skipping {duplicate_count} speeches with duplicate summaries (translated once, copied after)")
+        
+        return representatives, duplicates_by_pk
+    
+    def _copy_translations_to_duplicates(self, representatives, duplicates_by_pk):
+        """Copy representative translations to speeches with identical summaries. Returns number updated."""
+        updated_speeches = []
+        
+        for representative in representatives:
+            for duplicate in duplicates_by_pk.get(representative.pk, []):
+                changed = False
+                if (self.target_language in ['en', 'both'] and representative.ai_summary_en
+                        and (not duplicate.ai_summary_en or self.overwrite)):
+                    duplicate.ai_summary_en = representative.ai_summary_en
+                    changed = True
+                if (self.target_language in ['ru', 'both'] and representative.ai_summary_ru
+                        and (not duplicate.ai_summary_ru or self.overwrite)):
+                    duplicate.ai_summary_ru = representative.ai_summary_ru
+                    changed = True
+                if changed:
+                    updated_speeches.append(duplicate)
+        
+        if updated_speeches and not self.dry_run:
+            Speech.objects.bulk_update(updated_speeches, ['ai_summary_en', 'ai_summary_ru'], batch_size=500)
+        
+        return len(updated_speeches)
+    
+    def _write_processing_summary(self, total_count, processed, copied, errors, total_time, context_line=None):
+        """Write the final summary with timing (processed counts distinct summaries, copied their duplicates)"""
         avg_time_per_speech = total_time / total_count if total_count > 0 else 0
         
         self.stdout.write("\n" + "=" * 60)
         self.stdout.write(self.style.SUCCESS("PROCESSING COMPLETE"))
+        if context_line:
+            self.stdout.write(context_line)
         self.stdout.write(f"Total time: {total_time/60:.1f} minutes ({total_time:.1f} seconds)")
         self.stdout.write(f"Average time per speech: {avg_time_per_speech:.1f} seconds")
         self.stdout.write(f"Batch size: {self.batch_size} parallel requests")
-        self.stdout.write(f"Successfully processed: {processed}/{total_count} speeches")
+        self.stdout.write(f"Successfully processed: {processed + copied}/{total_count} speeches")
+        if copied:
+            self.stdout.write(f"  of which {copied} copied from speeches with identical summaries")
         if errors > 0:
             self.stdout.write(self.style.ERROR(f"Errors encountered: {errors}"))
         else:
@@ -406,61 +841,24 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         if self.dry_run:
             self.stdout.write(self.style.WARNING("Note: This was a dry run - no translations were saved to database"))
     
-    def _process_batch(self, batch_speeches, batch_start_idx, total_count, overall_start_time):
-        """Process a batch of speeches in parallel"""
-        processed = 0
-        errors = 0
-        batch_start_time = time.time()
-        
-        # Create futures for parallel processing
-        with ThreadPoolExecutor(max_workers=self.batch_size) as executor:
-            # Submit all speeches in the batch
-            future_to_speech = {
-                executor.submit(self._process_single_speech, speech, idx + batch_start_idx + 1, total_count, overall_start_time): speech 
-                for idx, speech in enumerate(batch_speeches)
-            }
-            
-            # Process completed futures
-            for future in as_completed(future_to_speech):
-                speech = future_to_speech[future]
-                try:
-                    success = future.result()
-                    if success:
-                        processed += 1
-                    else:
-                        errors += 1
-                except Exception as e:
-                    errors += 1
-                    logger.exception(f"Error in parallel processing for speech {speech.pk}")
-                    self.stdout.write(self.style.ERROR(f"✗ Error processing speech {speech.pk}: {str(e)}"))
-        
-        batch_time = time.time() - batch_start_time
-        self.stdout.write(f"Batch completed in {batch_time:.1f}s - {processed} successful, {errors} errors")
-        
-        return processed, errors
+    def _needs_translation(self, speech):
+        """Check whether a speech still needs any translation for the selected target language"""
+        if not speech.ai_summary:
+            return False
+        needs_en = self.target_language in ['en', 'both'] and (not speech.ai_summary_en or self.overwrite)
+        needs_ru = self.target_language in ['ru', 'both'] and (not speech.ai_summary_ru or self.overwrite)
+        return needs_en or needs_ru
     
     def _process_single_speech(self, speech, current_idx, total_count, overall_start_time):
         """Process a single speech (for parallel execution)"""
         try:
-            # Progress information
-            current_time = time.time()
-            elapsed_time = current_time - overall_start_time
-            progress_percent = (current_idx / total_count) * 100
-            
-            # Calculate ETA
-            if current_idx > 1:
-                avg_time_per_item = elapsed_time / (current_idx - 1)
-                remaining_items = total_count - current_idx + 1
-                eta_seconds = avg_time_per_item * remaining_items
-                eta_minutes = eta_seconds / 60
-                eta_display = f"{eta_minutes:.1f}m" if eta_minutes >= 1 else f"{eta_seconds:.0f}s"
-            else:
-                eta_display = "calculating..."
-            
-            self.stdout.write(f"[{current_idx}/{total_count}] ({progress_percent:.1f}%) ETA: {eta_display}")
-            self.stdout.write(f"Processing: {speech.speaker} ({speech.date.date()}) - ID: {speech.pk}")
-            
+            # Per-speech progress is only written in verbose mode; workers would
+            # otherwise serialize on the shared stdout stream
             if self.verbose:
+                progress_percent = (current_idx / total_count) * 100
+                self.stdout.write(f"[{current_idx}/{total_count}] ({progress_percent:.1f}%)")
+                self.stdout.write(f"Processing: {speech.speaker} ({speech.date.date()}) - ID: {speech.pk}")
+                
                 # Show what will be translated
                 translate_info = []
                 if hasattr(speech, 'ai_summary') and speech.ai_summary:
@@ -476,14 +874,18 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
                     self.stdout.write(f"   └─ ⚠️  No translations needed (already exists or no AI summary)")
             
             speech_start_time = time.time()
-            success = self.translate_speech(speech)
+            # Saving is left to the main thread, which batches the writes
+            success = self.translate_speech(speech, save=False)
             speech_duration = time.time() - speech_start_time
             
             if success:
-                self.stdout.write(self.style.SUCCESS(f"✓ Translated speech ({speech_duration:.1f}s)"))
+                if self.verbose:
+                    self.stdout.write(self.style.SUCCESS(f"✓ Translated speech ({speech_duration:.1f}s)"))
+                else:
+                    logger.debug(f"Translated speech {speech.pk} ({speech_duration:.1f}s)")
                 return True
             else:
-                self.stdout.write(self.style.ERROR(f"✗ Failed to translate speech ({speech_duration:.1f}s)"))
+                self.stdout.write(self.style.ERROR(f"✗ Failed to translate speech {speech.pk} ({speech_duration:.1f}s)"))
                 return False
                 
         except Exception as e:
@@ -491,8 +893,8 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
             self.stdout.write(self.style.ERROR(f"✗ Error processing speech {speech.pk}: {str(e)}"))
             return False
 
-    def translate_speech(self, speech):
-        """Translate AI summary for a single speech"""
+    def translate_speech(self, speech, save=True):
+        """Translate AI summary for a single speech (save=False leaves persisting to the caller)"""
         if not speech.ai_summary:
             self.stdout.write(f"Skipping speech {speech.pk} - no AI summary to translate")
             return False
@@ -500,13 +902,23 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
         try:
             translations_made = False
             
-            # For OpenAI and Gemini, translate both at once if target is 'both'
-            if self.target_language == 'both' and self.ai_provider in ['openai', 'gemini']:
+            # Translate both languages with a single tagged call if target is 'both'
+            if self.target_language == 'both':
                 needs_en = not speech.ai_summary_en or self.overwrite
                 needs_ru = not speech.ai_summary_ru or self.overwrite
                 
                 if needs_en or needs_ru:
-                    translations = self.call_ai_translation(speech.ai_summary, 'both')
+                    # A copy: the returned dict is also the cached entry, which update() below must not change
+                    translations = dict(self.call_ai_translation(speech.ai_summary, 'both') or {})
+                    
+                    # Tagged response missing a language: request the missing ones separately, in parallel
+                    missing_languages = [
+                        lang for lang, needed in (('en', needs_en), ('ru', needs_ru))
+                        if needed and lang not in translations
+                    ]
+                    if missing_languages:
+                        translations.update(self._call_languages_in_parallel(speech.ai_summary, missing_languages))
+                    
                     if translations:
                         if needs_en and 'en' in translations:
                             if not self.dry_run:
@@ -523,9 +935,8 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
                                 self.stdout.write(f"Russian translation (DRY RUN): {translations['ru'][:100]}...")
                                 translations_made = True
             else:
-                # Fall back to separate translations for local service or single language
-                # Translate to English if needed
-                if self.target_language in ['en', 'both']:
+                # Single target language
+                if self.target_language == 'en':
                     if not speech.ai_summary_en or self.overwrite:
                         en_translation = self.call_ai_translation(speech.ai_summary, 'en')
                         if en_translation and not self.dry_run:
@@ -535,8 +946,7 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
                             self.stdout.write(f"English translation (DRY RUN): {en_translation[:100]}...")
                             translations_made = True
                 
-                # Translate to Russian if needed
-                if self.target_language in ['ru', 'both']:
+                if self.target_language == 'ru':
                     if not speech.ai_summary_ru or self.overwrite:
                         ru_translation = self.call_ai_translation(speech.ai_summary, 'ru')
                         if ru_translation and not self.dry_run:
@@ -547,7 +957,7 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
                             translations_made = True
             
             # Save the speech if translations were made
-            if translations_made and not self.dry_run:
+            if save and translations_made and not self.dry_run:
                 speech.save(update_fields=['ai_summary_en', 'ai_summary_ru'])
             
             return translations_made
@@ -557,62 +967,150 @@ class Command(GeminiBatchAPIMixin, BaseCommand):
             self.stdout.write(self.style.ERROR(f"Translation error: {str(e)}"))
             return False
 
+    def _call_languages_in_parallel(self, text, languages):
+        """Request single-language translations concurrently. Returns {language: translation}."""
+        # A dedicated pool: the shared executor's workers are the callers of this method
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            futures = {lang: executor.submit(self.call_ai_translation, text, lang) for lang in languages}
+        
+        results = {}
+        for lang, future in futures.items():
+            translation = future.result()
+            if translation:
+                results[lang] = translation
+        return results
+
     def call_ai_translation(self, text, target_language):
-        """Call AI service for translation based on selected provider"""
+        """Call AI service for translation based on selected provider, reusing cached results"""
+        cache_key = self._translation_cache_key(text, target_language)
+        # --overwrite is used to redo translations (e.g. after a prompt or model change), so it
+        # never reuses a cached result; fresh results are still stored
+        if not (self.skip_cache or self.overwrite):
+            cached = self._get_cached_translation(cache_key)
+            if cached:
+                if self.verbose:
+                    self.stdout.write(f"   ♻️  Using cached {TARGET_LANGUAGE_NAMES.get(target_language, target_language)} translation")
+                return cached
+        
         if self.ai_provider == 'ollama':
-            return self.call_ollama_translation(text, target_language)
+            result = self.call_ollama_translation(text, target_language)
         elif self.ai_provider == 'openai':
-            return self.call_openai_translation(text, target_language)
+            result = self.call_openai_translation(text, target_language)
         elif self.ai_provider == 'gemini':
-            return self.call_gemini_translation(text, target_language)
+            result = self.call_gemini_translation(text, target_language)
+        elif self.ai_provider == 'nllb':
+            result = self.call_nllb_translation(text, target_language)
         else:
             self.stdout.write(self.style.ERROR(f"Unsupported AI provider: {self.ai_provider}"))
             return None
+        
+        if result:
+            self._store_cached_translation(cache_key, target_language, result)
+        return result
+    
+    # The cache table is read and written from the worker threads, each with its own
+    # database connection (one per --batch-size worker), closed when the command exits
+    
+    def _preload_cached_translations(self, texts):
+        """
+        Load the run's cached translations into the LRU with one query per thousand keys,
+        so workers find them in memory instead of each querying the table
+        """
+        if self.skip_cache or self.overwrite:
+            return
+        # Beyond the LRU size the earliest entries would be evicted before use; the rest
+        # are looked up one by one as before
+        keys = [self._translation_cache_key(text, self.target_language) for text in texts[:MEMORY_CACHE_SIZE]]
+        loaded = 0
+        for start in range(0, len(keys), 1000):
+            for key, translation in TranslationCache.objects.filter(
+                key__in=keys[start:start + 1000]
+            ).values_list('key', 'translation'):
+                self._remember_translation(key, translation)
+                loaded += 1
+        if loaded:
+            self.stdout.write(f"Found {loaded} cached translations")
+    
+    def _get_cached_translation(self, cache_key):
+        """Look up a translation in the in-memory LRU first, then in the TranslationCache table"""
+        with self.recent_translations_lock:
+            if cache_key in self.recent_translations:
+                self.recent_translations.move_to_end(cache_key)
+                return self.recent_translations[cache_key]
+        
+        cached = TranslationCache.objects.filter(key=cache_key).values_list('translation', flat=True).first()
+        if cached:
+            self._remember_translation(cache_key, cached)
+        return cached
+    
+    def _store_cached_translation(self, cache_key, target_language, translation):
+        """Store a translation in memory and in the TranslationCache table"""
+        self._remember_translation(cache_key, translation)
+        if self.dry_run:
+            return
+        entry = TranslationCache(
+            key=cache_key,
+            provider=self.ai_provider,
+            model=self._translation_model(),
+            target_language=target_language,
+            translation=translation,
+        )
+        try:
+            if self.overwrite:
+                # --overwrite redoes translations, so the fresh result replaces the cached one
+                TranslationCache.objects.bulk_create(
+                    [entry], update_conflicts=True, unique_fields=['key'], update_fields=['translation']
+                )
+            else:
+                # INSERT ... ON CONFLICT DO NOTHING: another worker or run may have stored the same key
+                TranslationCache.objects.bulk_create([entry], ignore_conflicts=True)
+        except Exception:
+            # The translation itself succeeded; only its reuse in later runs is lost
+            logger.warning("Failed to store translation in the cache", exc_info=True)
+    
+    def _remember_translation(self, cache_key, translation):
+        """Keep a translation in the bounded in-memory LRU"""
+        with self.recent_translations_lock:
+            self.recent_translations[cache_key] = translation
+            self.recent_translations.move_to_end(cache_key)
+            if len(self.recent_translations) > MEMORY_CACHE_SIZE:
+                self.recent_translations.popitem(last=False)
+    
+    def _translation_model(self):
+        """Model name of the selected provider"""
+        if self.ai_provider == 'ollama':
+            return self.ollama_model
+        elif self.ai_provider == 'openai':
+            return self.openai_model
+        elif self.ai_provider == 'nllb':
+            return self.nllb_model
+        return self.gemini_model
+    
+    def _translation_cache_key(self, text, target_language):
+        """
+        Cache key for a translation: the hex 32-byte BLAKE2b digest of the provider, model,
+        target language and source text
+        """
+        hasher = hashlib.blake2b(
+            f"{self.ai_provider}|{self._translation_model()}|{target_language}\n".encode('utf-8'), digest_size=32
+        )
+        hasher.update(text.encode('utf-8'))
+        return hasher.hexdigest()
     
     def parse_tagged_translation(self, text):
         """Parse translation response with <en> and <ru> tags"""
-        import re
-        
-        en_match = re.search(r'<en>(.*?)</en>', text, re.DOTALL)
-        ru_match = re.search(r'<ru>(.*?)</ru>', text, re.DOTALL)
-        
-        result = {}
-        if en_match:
-            result['en'] = en_match.group(1).strip()
-        if ru_match:
-            result['ru'] = ru_match.group(1).strip()
-        
-        return result if result else None
+        return parse_tagged_translation(text)
     
     def call_ollama_translation(self, text, target_language):
         """Call Ollama API for translation"""
-        import requests
-        
         try:
             # Get Ollama configuration
-            ollama_base_url = getattr(settings, 'OLLAMA_BASE_URL', 'http://localhost:11434')
-            ollama_model = getattr(settings, 'OLLAMA_MODEL', 'gemma3:12b')
+            ollama_base_url = self.ollama_base_url
+            ollama_model = self.ollama_model
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -626,7 +1124,7 @@ Estonian text:
             }
             
             start_time = time.time()
-            response = requests.post(
+            response = self._post_to_provider(
                 f'{ollama_base_url}/api/generate',
                 json=data,
                 timeout=120,
@@ -636,31 +1134,38 @@ Estonian text:
             
             if response.status_code == 200:
                 # Handle streaming response
-                content = ""
                 if self.verbose:
                     self.stdout.write(f"   📤 Streaming translation:", ending='')
                     self.stdout.flush()
                 
-                for line in response.iter_lines():
+                # Tags are parsed while the stream arrives so reading can stop as soon
+                # as both translations are closed, instead of waiting for trailing output
+                parser = TaggedStreamParser()
+                pending_output = []
+                for line in iter_stream_lines(response):
                     if line:
                         try:
-                            import json
-                            chunk = line.decode('utf-8')
-                            result = json.loads(chunk)  # Parse JSON line
+                            result = json.loads(line)  # Parse JSON line (bytes accepted directly)
                             if 'response' in result:
                                 chunk_text = result['response']
-                                content += chunk_text
+                                parser.feed(chunk_text)
                                 if self.verbose:
-                                    self.stdout.write(chunk_text, ending='')
-                                    self.stdout.flush()
+                                    pending_output.append(chunk_text)
+                                    if len(pending_output) >= STREAM_OUTPUT_CHUNKS:
+                                        self.stdout.write(''.join(pending_output), ending='')
+                                        pending_output.clear()
                             if result.get('done', False):
                                 break
+                            if target_language == 'both' and parser.complete:
+                                break
                         except Exception as e:
                             logger.error(f"Error parsing streaming chunk: {e}")
                             continue
+                response.close()
+                content = parser.text
                 
                 if self.verbose:
-                    self.stdout.write('')  # New line after streaming
+                    self.stdout.write(''.join(pending_output))  # Flush remainder and end the line
                 
                 api_time = time.time() - start_time
                 content = content.strip()
@@ -668,7 +1173,7 @@ Estonian text:
                 if content:
                     if target_language == 'both':
                         # Parse tagged response
-                        translations = self.parse_tagged_translation(content)
+                        translations = parser.sections or self.parse_tagged_translation(content)
                         if translations:
                             if self.verbose:
                                 self.stdout.write(f"   ✅ Translations received ({api_time:.1f}s): EN={len(translations.get('en', ''))} chars, RU={len(translations.get('ru', ''))} chars")
@@ -694,39 +1199,43 @@ Estonian text:
             self.stdout.write(self.style.ERROR(f"Ollama translation error: {str(e)}"))
             return None
     
+    def _read_tagged_stream(self, response, target_language, chunk_text_func):
+        """
+        Accumulate streamed text deltas from a server-sent event response
+        
+        In 'both' mode the connection is closed as soon as both tagged translations
+        are complete, so any trailing model output is never downloaded.
+        """
+        parser = TaggedStreamParser()
+        try:
+            for payload in iter_sse_data(response):
+                try:
+                    chunk_text = chunk_text_func(json.loads(payload))
+                except (ValueError, AttributeError, IndexError) as e:
+                    logger.error(f"Error parsing streaming chunk: {e}")
+                    continue
+                if chunk_text:
+                    parser.feed(chunk_text)
+                    if target_language == 'both' and parser.complete:
+                        break
+        finally:
+            response.close()
+        return parser
+    
     def call_openai_translation(self, text, target_language):
         """Call OpenAI API for translation"""
-        import requests
-        
         try:
             # Get OpenAI configuration
-            openai_api_key = getattr(settings, 'OPENAI_API_KEY', '')
-            openai_model = getattr(settings, 'OPENAI_MODEL', 'gpt-4o-mini')
+            openai_api_key = self.openai_api_key
+            openai_model = self.openai_model
             
             if not openai_api_key:
                 self.stdout.write(self.style.ERROR("OPENAI_API_KEY not configured"))
                 return None
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -745,38 +1254,38 @@ Estonian text:
                         'role': 'user',
                         'content': prompt
                     }
-                ]
+                ],
+                'stream': True
             }
             
             start_time = time.time()
-            response = requests.post(
+            response = self._post_to_provider(
                 'https://api.openai.com/v1/chat/completions',
                 headers=headers,
                 json=data,
-                timeout=60
+                timeout=60,
+                stream=True
             )
-            api_time = time.time() - start_time
             
             if response.status_code == 200:
-                result = response.json()
-                if 'choices' in result and len(result['choices']) > 0:
-                    message = result['choices'][0].get('message', {})
-                    content = message.get('content', '')
-                    if content:
-                        if target_language == 'both':
-                            # Parse tagged response
-                            translations = self.parse_tagged_translation(content)
-                            if translations:
-                                if self.verbose:
-                                    self.stdout.write(f"   ✅ Translations received ({api_time:.1f}s): EN={len(translations.get('en', ''))} chars, RU={len(translations.get('ru', ''))} chars")
-                                return translations
-                            else:
-                                self.stdout.write(self.style.ERROR("Failed to parse tagged translations from OpenAI response"))
-                                return None
-                        else:
+                parser = self._read_tagged_stream(response, target_language, openai_stream_text)
+                api_time = time.time() - start_time
+                content = parser.text.strip()
+                if content:
+                    if target_language == 'both':
+                        # Parse tagged response
+                        translations = parser.sections or self.parse_tagged_translation(content)
+                        if translations:
                             if self.verbose:
-                                self.stdout.write(f"   ✅ Translation received ({api_time:.1f}s): {content}")
-                            return content.strip()
+                                self.stdout.write(f"   ✅ Translations received ({api_time:.1f}s): EN={len(translations.get('en', ''))} chars, RU={len(translations.get('ru', ''))} chars")
+                            return translations
+                        else:
+                            self.stdout.write(self.style.ERROR("Failed to parse tagged translations from OpenAI response"))
+                            return None
+                    else:
+                        if self.verbose:
+                            self.stdout.write(f"   ✅ Translation received ({api_time:.1f}s): {content}")
+                        return content
                 self.stdout.write(self.style.ERROR("No translation content in OpenAI response"))
                 return None
             else:
@@ -792,37 +1301,18 @@ Estonian text:
     
     def call_gemini_translation(self, text, target_language):
         """Call Google Gemini API for translation"""
-        import requests
-        
         try:
             # Get Gemini configuration
-            gemini_api_key = getattr(settings, 'GEMINI_API_KEY', '')
-            gemini_model = getattr(settings, 'GEMINI_MODEL', 'gemini-2.5-flash-lite-preview-09-2025')
+            gemini_api_key = self.gemini_api_key
+            gemini_model = self.gemini_model
             
             if not gemini_api_key:
                 self.stdout.write(self.style.ERROR("GEMINI_API_KEY not configured"))
                 return None
             
             # Create translation prompt
-            if target_language == 'both':
-                prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-                lang_name = "English and Russian"
-            elif target_language == 'en':
-                prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "English"
-            elif target_language == 'ru':
-                prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-                lang_name = "Russian"
-            else:
-                self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
-                return None
+            prompt = build_translation_prompt(target_language, text)
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
             
             if self.verbose:
                 text_preview = text[:100] + "..." if len(text) > 100 else text
@@ -850,41 +1340,37 @@ Estonian text:
                 }
             }
             
-            # Use the Gemini REST API endpoint with API key as query parameter
-            url = f"https://generativelanguage.googleapis.com/v1beta/models/{gemini_model}:generateContent?key={gemini_api_key}"
+            # Use the streaming Gemini REST endpoint (server-sent events) with API key as query parameter
+            url = f"https://generativelanguage.googleapis.com/v1beta/models/{gemini_model}:streamGenerateContent?alt=sse&key={gemini_api_key}"
             
             start_time = time.time()
-            response = requests.post(
+            response = self._post_to_provider(
                 url,
                 headers=headers,
                 json=data,
-                timeout=60
+                timeout=60,
+                stream=True
             )
-            api_time = time.time() - start_time
             
             if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and len(result['candidates']) > 0:
-                    candidate = result['candidates'][0]
-                    if 'content' in candidate and 'parts' in candidate['content']:
-                        parts = candidate['content']['parts']
-                        if len(parts) > 0 and 'text' in parts[0]:
-                            content = parts[0]['text'].strip()
-                            if content:
-                                if target_language == 'both':
-                                    # Parse tagged response
-                                    translations = self.parse_tagged_translation(content)
-                                    if translations:
-                                        if self.verbose:
-                                            self.stdout.write(f"   ✅ Translations received ({api_time:.1f}s): EN={len(translations.get('en', ''))} chars, RU={len(translations.get('ru', ''))} chars")
-                                        return translations
-                                    else:
-                                        self.stdout.write(self.style.ERROR("Failed to parse tagged translations from Gemini response"))
-                                        return None
-                                else:
-                                    if self.verbose:
-                                        self.stdout.write(f"   ✅ Translation received ({api_time:.1f}s): {content}")
-                                    return content
+                parser = self._read_tagged_stream(response, target_language, gemini_stream_text)
+                api_time = time.time() - start_time
+                content = parser.text.strip()
+                if content:
+                    if target_language == 'both':
+                        # Parse tagged response
+                        translations = parser.sections or self.parse_tagged_translation(content)
+                        if translations:
+                            if self.verbose:
+                                self.stdout.write(f"   ✅ Translations received ({api_time:.1f}s): EN={len(translations.get('en', ''))} chars, RU={len(translations.get('ru', ''))} chars")
+                            return translations
+                        else:
+                            self.stdout.write(self.style.ERROR("Failed to parse tagged translations from Gemini response"))
+                            return None
+                    else:
+                        if self.verbose:
+                            self.stdout.write(f"   ✅ Translation received ({api_time:.1f}s): {content}")
+                        return content
                 self.stdout.write(self.style.ERROR("No translation content in Gemini response"))
                 return None
             else:
@@ -898,44 +1384,91 @@ Estonian text:
             self.stdout.write(self.style.ERROR(f"Gemini translation error: {str(e)}"))
             return None
     
+    def call_nllb_translation(self, text, target_language):
+        """
+        Call a local NLLB-200 translation server (e.g. CTranslate2 int8) for translation
+        
+        The text is split into sentences that are sent in batches of up to
+        NLLB_MAX_BATCH_SIZE, so the server can batch them on the GPU. The server is
+        expected to accept POST {NLLB_BASE_URL}/translate with
+        {"source": [...], "src_lang": "est_Latn", "tgt_lang": "eng_Latn"} and to
+        answer {"translations": [...]} in the same order.
+        """
+        if target_language == 'both':
+            # NLLB translates into one language per request; run both concurrently
+            return self._call_languages_in_parallel(text, ['en', 'ru']) or None
+        
+        if target_language not in NLLB_LANGUAGE_CODES:
+            self.stdout.write(self.style.ERROR(f"Unsupported target language: {target_language}"))
+            return None
+        
+        try:
+            nllb_base_url = self.nllb_base_url
+            lang_name = TARGET_LANGUAGE_NAMES[target_language]
+            
+            # Only the sentences go to NLLB; the markdown around them is kept as written
+            pieces, sentences = split_markdown_sentences(text)
+            if not sentences:
+                return None
+            
+            if self.verbose:
+                self.stdout.write(f"   Requesting {lang_name} translation of {len(sentences)} sentences from NLLB...")
+            
+            start_time = time.time()
+            translated = []
+            for batch_start in range(0, len(sentences), NLLB_MAX_BATCH_SIZE):
+                response = self._post_to_provider(
+                    f'{nllb_base_url}/translate',
+                    json={
+                        'source': sentences[batch_start:batch_start + NLLB_MAX_BATCH_SIZE],
+                        'src_lang': NLLB_LANGUAGE_CODES['et'],
+                        'tgt_lang': NLLB_LANGUAGE_CODES[target_language],
+                    },
+                    timeout=120
+                )
+                if response.status_code != 200:
+                    self.stdout.write(self.style.ERROR(f"NLLB API error: {response.status_code} - {response.text}"))
+                    return None
+                translated.extend(response.json().get('translations', []))
+            
+            if len(translated) != len(sentences):
+                self.stdout.write(self.style.ERROR(f"NLLB returned {len(translated)} translations for {len(sentences)} sentences"))
+                return None
+            
+            content = join_markdown_sentences(pieces, translated)
+            
+            if self.verbose:
+                api_time = time.time() - start_time
+                self.stdout.write(f"   ✅ Translation received ({api_time:.1f}s): {content}")
+            return content or None
+            
+        except requests.exceptions.RequestException as e:
+            self.stdout.write(self.style.ERROR(f"NLLB request error: {str(e)}"))
+            return None
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"NLLB translation error: {str(e)}"))
+            return None
+    
     # ========================================================================
     # BATCH API HELPER METHODS
     # ========================================================================
     
     def _create_speech_translation_prompt(self, speech):
         """Create translation prompt for speech AI summary using batch API"""
-        text = speech.ai_summary
-        if not text:
-            return None
-        
-        # Check if needs translation
-        needs_en = self.target_language in ['en', 'both'] and (not speech.ai_summary_en or self.overwrite)
-        needs_ru = self.target_language in ['ru', 'both'] and (not speech.ai_summary_ru or self.overwrite)
+        if not self._needs_translation(speech):
+            return None  # Skip, no summary or already translated
         
-        if not needs_en and not needs_ru:
-            return None  # Skip, already translated
+        text = speech.ai_summary
         
         # Create prompt based on target language
-        if self.target_language == 'both':
-            prompt = f"""Translate the following Estonian text to English and Russian like you are a native speaker of each language. Do not summarize, translate everything.
-
-Provide the translations in this exact format:
-<en>English translation here</en>
-<ru>Russian translation here</ru>
-
-Estonian text:
-{text}"""
-        elif self.target_language == 'en':
-            prompt = f"Translate the following Estonian text to English like you are a native English speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-        elif self.target_language == 'ru':
-            prompt = f"Translate the following Estonian text to Russian like you are a native Russian speaker. Do not summarize, translate everything. Provide only the translation, no explanations:\n\n{text}"
-        else:
-            return None
-        
-        return prompt
+        return build_translation_prompt(self.target_language, text)
     
-    def _update_speech_with_translation(self, speech, translation_text):
-        """Update speech with translation from batch API"""
+    def _update_speech_with_translation(self, speech: Speech, translation_text: str) -> List[str]:
+        """
+        Apply a batch API translation to the speech in memory.
+        
+        Returns the changed field names; the batch mixin saves them with bulk_update.
+        """
         if self.target_language == 'both':
             # Parse tagged translation
             translations = self.parse_tagged_translation(translation_text)
@@ -944,27 +1477,13 @@ Estonian text:
                     speech.ai_summary_en = translations['en']
                 if 'ru' in translations:
                     speech.ai_summary_ru = translations['ru']
-                speech.save(update_fields=['ai_summary_en', 'ai_summary_ru'])
-            else:
-                logger.error(f"Failed to parse tagged translations for speech {speech.pk}")
+                return ['ai_summary_en', 'ai_summary_ru']
+            logger.error(f"Failed to parse tagged translations for speech {speech.pk}")
+            return []
         elif self.target_language == 'en':
             speech.ai_summary_en = translation_text
-            speech.save(update_fields=['ai_summary_en'])
+            return ['ai_summary_en']
         elif self.target_language == 'ru':
             speech.ai_summary_ru = translation_text
-            speech.save(update_fields=['ai_summary_ru'])
-    
-    def parse_tagged_translation(self, text):
-        """Parse translation response with <en> and <ru> tags"""
-        import re
-        
-        en_match = re.search(r'<en>(.*?)</en>', text, re.DOTALL)
-        ru_match = re.search(r'<ru>(.*?)</ru>', text, re.DOTALL)
-        
-        result = {}
-        if en_match:
-            result['en'] = en_match.group(1).strip()
-        if ru_match:
-            result['ru'] = ru_match.group(1).strip()
-        
-        return result if result else None
+            return ['ai_summary_ru']
+        return []
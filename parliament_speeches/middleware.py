@@ -1,18 +1,68 @@
 """
 Language detection middleware for pyi18next translations
 """
-import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
 from django.utils.deprecation import MiddlewareMixin
 
+SUPPORTED_LANGUAGES = frozenset(('et', 'en', 'ru'))
+
+
+@lru_cache(maxsize=1024)
+def parse_accept_language(accept_language: str) -> Optional[str]:
+    """
+    Parse the Accept-Language header to find the best matching language
+    
+    Browsers send only a handful of distinct header strings, so results are
+    cached by the raw header value.
+    
+    Args:
+        accept_language: The Accept-Language header value
+        
+    Returns:
+        Language code or None if no match found
+    """
+    if not accept_language:
+        return None
+    
+    # Parse Accept-Language header
+    # Format: "en-US,en;q=0.9,et;q=0.8,ru;q=0.7"
+    languages: List[Tuple[str, float]] = []
+    
+    for item in accept_language.split(','):
+        item = item.strip()
+        if ';' in item:
+            lang, q = item.split(';', 1)
+            try:
+                quality = float(q.split('=')[1])
+            except (IndexError, ValueError):
+                quality = 1.0
+        else:
+            lang = item
+            quality = 1.0
+        
+        # Extract language code (first 2 characters)
+        lang_code = lang.strip()[:2].lower()
+        if lang_code in SUPPORTED_LANGUAGES:
+            languages.append((lang_code, quality))
+    
+    # Return the highest quality supported language (the first one listed on ties)
+    if languages:
+        return max(languages, key=lambda x: x[1])[0]
+    
+    return None
+
+
 class LanguageMiddleware(MiddlewareMixin):
     """
     Middleware to detect and set the user's preferred language
     """
     
-    SUPPORTED_LANGUAGES = ['et', 'en', 'ru']
+    SUPPORTED_LANGUAGES = SUPPORTED_LANGUAGES
     DEFAULT_LANGUAGE = 'et'
     
-    def process_request(self, request):
+    def process_request(self, request) -> None:
         """
         Process the request to determine the user's language preference
         """
@@ -47,7 +97,7 @@ class LanguageMiddleware(MiddlewareMixin):
         # Set the language on the request
         request.LANGUAGE_CODE = lang
     
-    def parse_accept_language(self, accept_language):
+    def parse_accept_language(self, accept_language: str) -> Optional[str]:
         """
         Parse the Accept-Language header to find the best matching language
         
@@ -57,35 +107,4 @@ class LanguageMiddleware(MiddlewareMixin):
         Returns:
             Language code or None if no match found
         """
-        if not accept_language:
-            return None
-        
-        # Parse Accept-Language header
-        # Format: "en-US,en;q=0.9,et;q=0.8,ru;q=0.7"
-        languages = []
-        
-        for item in accept_language.split(','):
-            item = item.strip()
-            if ';' in item:
-                lang, q = item.split(';', 1)
-                try:
-                    quality = float(q.split('=')[1])
-                except (IndexError, ValueError):
-                    quality = 1.0
-            else:
-                lang = item
-                quality = 1.0
-            
-            # Extract language code (first 2 characters)
-            lang_code = lang.strip()[:2].lower()
-            if lang_code in self.SUPPORTED_LANGUAGES:
-                languages.append((lang_code, quality))
-        
-        # Sort by quality (highest first)
-        languages.sort(key=lambda x: x[1], reverse=True)
-        
-        # Return the highest quality supported language
-        if languages:
-            return languages[0][0]
-        
-        return None
+        return parse_accept_language(accept_language)
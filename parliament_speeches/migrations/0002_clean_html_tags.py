@@ -1,6 +1,5 @@
 # Generated migration to clean HTML tags from existing data
 
-import re
 from django.db import migrations
 from django.utils.html import strip_tags
 
@@ -13,15 +12,36 @@ def clean_html_text(text):
     # Strip HTML tags
     cleaned = strip_tags(text)
     
-    # Normalize whitespace - replace multiple spaces/newlines with single space
-    cleaned = re.sub(r'\s+', ' ', cleaned)
-    
-    # Strip leading and trailing whitespace
-    cleaned = cleaned.strip()
+    # Normalize whitespace - collapse runs of spaces/newlines to a single space and
+    # strip both ends (str.split() matches the same Unicode whitespace as \s, without regex)
+    cleaned = ' '.join(cleaned.split())
     
     return cleaned
 
 
+def clean_html_fields(model, fields, batch_size=1000):
+    """Clean HTML from the given fields of every row, saving changed rows in bulk"""
+    dirty = []
+    # Only the cleaned columns are fetched; other (large) text columns stay in the database
+    for obj in model.objects.only('pk', *fields).iterator(chunk_size=2000):
+        changed = False
+        for field in fields:
+            original = getattr(obj, field)
+            cleaned = clean_html_text(original)
+            if original != cleaned:
+                setattr(obj, field, cleaned)
+                changed = True
+        
+        if changed:
+            dirty.append(obj)
+            if len(dirty) >= batch_size:
+                model.objects.bulk_update(dirty, fields, batch_size=batch_size)
+                dirty.clear()
+    
+    if dirty:
+        model.objects.bulk_update(dirty, fields, batch_size=batch_size)
+
+
 def clean_html_tags_forward(apps, schema_editor):
     """Clean HTML tags from existing data"""
     PlenarySession = apps.get_model('parliament_speeches', 'PlenarySession')
@@ -29,33 +49,13 @@ def clean_html_tags_forward(apps, schema_editor):
     Speech = apps.get_model('parliament_speeches', 'Speech')
     
     # Clean plenary session titles
-    for session in PlenarySession.objects.all():
-        original_title = session.title
-        cleaned_title = clean_html_text(original_title)
-        if original_title != cleaned_title:
-            session.title = cleaned_title
-            session.save(update_fields=['title'])
+    clean_html_fields(PlenarySession, ['title'])
     
     # Clean agenda item titles
-    for item in AgendaItem.objects.all():
-        original_title = item.title
-        cleaned_title = clean_html_text(original_title)
-        if original_title != cleaned_title:
-            item.title = cleaned_title
-            item.save(update_fields=['title'])
+    clean_html_fields(AgendaItem, ['title'])
     
     # Clean speech content
-    for speech in Speech.objects.all():
-        original_speaker = speech.speaker
-        original_text = speech.text
-        
-        cleaned_speaker = clean_html_text(original_speaker)
-        cleaned_text = clean_html_text(original_text)
-        
-        if original_speaker != cleaned_speaker or original_text != cleaned_text:
-            speech.speaker = cleaned_speaker
-            speech.text = cleaned_text
-            speech.save(update_fields=['speaker', 'text'])
+    clean_html_fields(Speech, ['speaker', 'text'])
 
 
 def clean_html_tags_reverse(apps, schema_editor):
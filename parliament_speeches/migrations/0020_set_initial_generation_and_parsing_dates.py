@@ -1,5 +1,6 @@
 # Data migration to set initial generation and parsing dates
 from django.db import migrations
+from django.db.models import Case, F, Q, Value, When
 from django.utils import timezone
 from datetime import datetime
 
@@ -19,14 +20,17 @@ def set_initial_dates(apps, schema_editor):
     AgendaActivePolitician = apps.get_model('parliament_speeches', 'AgendaActivePolitician')
     PoliticianProfilePart = apps.get_model('parliament_speeches', 'PoliticianProfilePart')
     
-    # Set parsed_at for all existing speeches
-    speeches_count = Speech.objects.all().update(parsed_at=default_date)
-    print(f"Set parsed_at for {speeches_count} speeches to {default_date}")
-    
-    # Set ai_summary_generated_at for speeches that have AI summaries
-    speeches_with_summary = Speech.objects.filter(ai_summary__isnull=False).exclude(ai_summary='')
-    speeches_summary_count = speeches_with_summary.update(ai_summary_generated_at=default_date)
-    print(f"Set ai_summary_generated_at for {speeches_summary_count} speeches with AI summaries to {default_date}")
+    # Set parsed_at for all existing speeches and ai_summary_generated_at for speeches
+    # that have AI summaries in a single UPDATE (one pass over the speech table)
+    has_summary = Q(ai_summary__isnull=False) & ~Q(ai_summary='')
+    speeches_count = Speech.objects.all().update(
+        parsed_at=default_date,
+        ai_summary_generated_at=Case(
+            When(has_summary, then=Value(default_date)),
+            default=F('ai_summary_generated_at'),
+        ),
+    )
+    print(f"Set parsed_at (and ai_summary_generated_at where summarized) for {speeches_count} speeches to {default_date}")
     
     # Set ai_summary_generated_at for all agenda summaries
     agenda_summaries_count = AgendaSummary.objects.all().update(ai_summary_generated_at=default_date)
@@ -1,6 +1,58 @@
 # Generated data migration to mark existing incomplete entities
+#
+# The backfill is kept separate from the column additions in 0024: on PostgreSQL 11+
+# adding a column with a constant default is metadata-only, so the only table pass is
+# the set-based UPDATEs below, which touch just the rows that need flagging.
+
+import logging
+import os
+import sys
+from functools import wraps
+
+from django.db import migrations, transaction
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+logger = logging.getLogger(__name__)
+
+
+def report(message):
+    """Log migration progress; set DJANGO_MIGRATION_VERBOSE to also echo it to stderr"""
+    logger.info(message)
+    if os.environ.get('DJANGO_MIGRATION_VERBOSE'):
+        sys.stderr.write(message + '\n')
+        sys.stderr.flush()
+
+
+def run_in_transaction(func):
+    """Run a data migration step in its own transaction (the migration itself is non-atomic)"""
+    @wraps(func)
+    def wrapper(apps, schema_editor):
+        connection = schema_editor.connection
+        with transaction.atomic(using=connection.alias):
+            if connection.vendor == 'postgresql':
+                # Don't wait for the WAL flush on commit: the steps are idempotent,
+                # so a run lost to a crash can simply be re-run
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL synchronous_commit = OFF')
+            return func(apps, schema_editor)
+    return wrapper
+
+
+def mark_pks_incomplete(model, pks, connection, batch_size=10000):
+    """Flag the given rows as incomplete, batching the pk list to stay under query parameter limits"""
+    batch_size = min(batch_size, connection.features.max_query_params or batch_size)
+    count = 0
+    for start in range(0, len(pks), batch_size):
+        count += model.objects.filter(pk__in=pks[start:start + batch_size]).update(is_incomplete=True)
+    return count
+
 
-from django.db import migrations
+def has_incomplete_speeches(apps):
+    """Cheap LIMIT 1 probe; fresh databases have nothing to mark, so later steps can be skipped"""
+    Speech = apps.get_model('parliament_speeches', 'Speech')
+    return Speech.objects.filter(event_type='SPEECH', is_incomplete=True).exists()
 
 
 def mark_incomplete_speeches(apps, schema_editor):
@@ -8,176 +60,173 @@ def mark_incomplete_speeches(apps, schema_editor):
     Speech = apps.get_model('parliament_speeches', 'Speech')
     
     # Find all speeches containing "Stenogramm on koostamisel" (case-insensitive)
-    incomplete_speeches = Speech.objects.filter(
-        event_type='SPEECH',
-        text__icontains='stenogramm on koostamisel'
-    )
+    speeches = Speech.objects.filter(event_type='SPEECH')
+    if not speeches.exists():
+        report("No speeches found, skipping")
+        return
+    
+    if schema_editor.connection.vendor == 'postgresql':
+        # ILIKE matches case-insensitively in a single pass, instead of the
+        # UPPER(text) LIKE UPPER(...) that icontains generates on PostgreSQL
+        incomplete_speeches = speeches.extra(where=['text ILIKE %s'], params=['%stenogramm on koostamisel%'])
+    else:
+        incomplete_speeches = speeches.filter(text__icontains='stenogramm on koostamisel')
     
     count = incomplete_speeches.update(is_incomplete=True)
-    print(f"Marked {count} speeches as incomplete")
+    report(f"Marked {count} speeches as incomplete")
 
 
 def mark_incomplete_agendas(apps, schema_editor):
     """Mark agendas with incomplete speeches as incomplete"""
+    if not has_incomplete_speeches(apps):
+        report("No incomplete speeches found, skipping agendas")
+        return
+    
     AgendaItem = apps.get_model('parliament_speeches', 'AgendaItem')
     Speech = apps.get_model('parliament_speeches', 'Speech')
     
-    # Get all agenda items
-    agendas = AgendaItem.objects.all()
-    count = 0
+    # Flag every agenda that has an incomplete speech in a single UPDATE ... WHERE id IN (subquery)
+    incomplete_agenda_ids = Speech.objects.filter(
+        event_type='SPEECH',
+        is_incomplete=True
+    ).values('agenda_item_id')
     
-    for agenda in agendas:
-        # Check if this agenda has any incomplete speeches
-        has_incomplete = Speech.objects.filter(
-            agenda_item=agenda,
-            event_type='SPEECH',
-            is_incomplete=True
-        ).exists()
-        
-        if has_incomplete:
-            agenda.is_incomplete = True
-            agenda.save(update_fields=['is_incomplete'])
-            count += 1
+    count = AgendaItem.objects.filter(id__in=incomplete_agenda_ids).update(is_incomplete=True)
     
-    print(f"Marked {count} agendas as incomplete")
+    report(f"Marked {count} agendas as incomplete")
 
 
 def mark_incomplete_plenary_sessions(apps, schema_editor):
     """Mark plenary sessions with incomplete agendas as incomplete"""
+    if not has_incomplete_speeches(apps):
+        report("No incomplete speeches found, skipping plenary sessions")
+        return
+    
     PlenarySession = apps.get_model('parliament_speeches', 'PlenarySession')
     AgendaItem = apps.get_model('parliament_speeches', 'AgendaItem')
     
-    # Get all plenary sessions
-    sessions = PlenarySession.objects.all()
-    count = 0
+    # Flag every session that has an incomplete agenda (marked in the previous step) in one UPDATE
+    incomplete_session_ids = AgendaItem.objects.filter(is_incomplete=True).values('plenary_session_id')
+    count = PlenarySession.objects.filter(id__in=incomplete_session_ids).update(is_incomplete=True)
     
-    for session in sessions:
-        # Check if this session has any incomplete agendas
-        has_incomplete = AgendaItem.objects.filter(
-            plenary_session=session,
-            is_incomplete=True
-        ).exists()
-        
-        if has_incomplete:
-            session.is_incomplete = True
-            session.save(update_fields=['is_incomplete'])
-            count += 1
-    
-    print(f"Marked {count} plenary sessions as incomplete")
+    report(f"Marked {count} plenary sessions as incomplete")
 
 
 def mark_incomplete_agenda_summaries(apps, schema_editor):
     """Mark agenda summaries with incomplete speeches as incomplete"""
-    AgendaSummary = apps.get_model('parliament_speeches', 'AgendaSummary')
-    Speech = apps.get_model('parliament_speeches', 'Speech')
+    if not has_incomplete_speeches(apps):
+        report("No incomplete speeches found, skipping agenda summaries")
+        return
     
-    # Get all agenda summaries
-    summaries = AgendaSummary.objects.all()
-    count = 0
+    AgendaSummary = apps.get_model('parliament_speeches', 'AgendaSummary')
+    AgendaItem = apps.get_model('parliament_speeches', 'AgendaItem')
     
-    for summary in summaries:
-        # Check if the related agenda has any incomplete speeches
-        has_incomplete = Speech.objects.filter(
-            agenda_item=summary.agenda_item,
-            event_type='SPEECH',
-            is_incomplete=True
-        ).exists()
-        
-        if has_incomplete:
-            summary.is_incomplete = True
-            summary.save(update_fields=['is_incomplete'])
-            count += 1
+    # Summaries follow their agenda's flag, set in the agenda step above; the incomplete
+    # agenda ids are resolved once as a subquery rather than joined per summary row
+    incomplete_agenda_ids = AgendaItem.objects.filter(is_incomplete=True).values('pk')
+    count = AgendaSummary.objects.filter(agenda_item_id__in=incomplete_agenda_ids).update(is_incomplete=True)
     
-    print(f"Marked {count} agenda summaries as incomplete")
+    report(f"Marked {count} agenda summaries as incomplete")
 
 
 def mark_incomplete_politician_profiles(apps, schema_editor):
     """Mark politician profiles with incomplete speeches as incomplete"""
+    if not has_incomplete_speeches(apps):
+        report("No incomplete speeches found, skipping politician profiles")
+        return
+    
     PoliticianProfilePart = apps.get_model('parliament_speeches', 'PoliticianProfilePart')
     Speech = apps.get_model('parliament_speeches', 'Speech')
     
-    # Get all politician profile parts
+    incomplete_speeches = Speech.objects.filter(event_type='SPEECH', is_incomplete=True)
     profiles = PoliticianProfilePart.objects.all()
     count = 0
     
-    for profile in profiles:
-        # Build query for speeches related to this profile based on period type
-        has_incomplete = False
-        
-        if profile.period_type == 'AGENDA' and profile.agenda_item:
-            has_incomplete = Speech.objects.filter(
-                agenda_item=profile.agenda_item,
-                politician=profile.politician,
-                event_type='SPEECH',
-                is_incomplete=True
-            ).exists()
-        elif profile.period_type == 'PLENARY_SESSION' and profile.plenary_session:
-            has_incomplete = Speech.objects.filter(
-                agenda_item__plenary_session=profile.plenary_session,
-                politician=profile.politician,
-                event_type='SPEECH',
-                is_incomplete=True
-            ).exists()
-        elif profile.period_type == 'MONTH' and profile.month:
+    # One UPDATE per period type instead of an EXISTS query per profile
+    count += profiles.filter(period_type='AGENDA').filter(Exists(
+        incomplete_speeches.filter(agenda_item=OuterRef('agenda_item'), politician=OuterRef('politician'))
+    )).update(is_incomplete=True)
+    
+    count += profiles.filter(period_type='PLENARY_SESSION').filter(Exists(
+        incomplete_speeches.filter(agenda_item__plenary_session=OuterRef('plenary_session'), politician=OuterRef('politician'))
+    )).update(is_incomplete=True)
+    
+    count += profiles.filter(
+        period_type='ALL',
+        politician_id__in=incomplete_speeches.values('politician_id')
+    ).update(is_incomplete=True)
+    
+    # Month (stored as MM.YYYY) and year periods: load the small set of periods that
+    # contain incomplete speeches with one query, then check candidate profiles against it
+    incomplete_months = set(
+        incomplete_speeches.annotate(year=ExtractYear('date'), month=ExtractMonth('date'))
+        .values_list('politician_id', 'year', 'month').distinct()
+    )
+    incomplete_years = {(politician_id, year) for politician_id, year, month in incomplete_months}
+    incomplete_ids = []
+    candidates = profiles.filter(
+        period_type__in=['MONTH', 'YEAR'],
+        politician_id__in={politician_id for politician_id, year in incomplete_years}
+    ).values_list('pk', 'politician_id', 'period_type', 'month', 'year')
+    for pk, politician_id, period_type, month, year in candidates.iterator(chunk_size=2000):
+        if period_type == 'YEAR' and year:
+            if (politician_id, year) in incomplete_years:
+                incomplete_ids.append(pk)
+        elif period_type == 'MONTH' and month:
             # Parse month (format: MM.YYYY)
-            month_parts = profile.month.split('.')
+            month_parts = month.split('.')
             if len(month_parts) == 2:
                 month_num, year = int(month_parts[0]), int(month_parts[1])
-                has_incomplete = Speech.objects.filter(
-                    politician=profile.politician,
-                    event_type='SPEECH',
-                    date__month=month_num,
-                    date__year=year,
-                    is_incomplete=True
-                ).exists()
-        elif profile.period_type == 'YEAR' and profile.year:
-            has_incomplete = Speech.objects.filter(
-                politician=profile.politician,
-                event_type='SPEECH',
-                date__year=profile.year,
-                is_incomplete=True
-            ).exists()
-        elif profile.period_type == 'ALL':
-            has_incomplete = Speech.objects.filter(
-                politician=profile.politician,
-                event_type='SPEECH',
-                is_incomplete=True
-            ).exists()
-        
-        if has_incomplete:
-            profile.is_incomplete = True
-            profile.save(update_fields=['is_incomplete'])
-            count += 1
-    
-    print(f"Marked {count} politician profiles as incomplete")
+                if (politician_id, year, month_num) in incomplete_months:
+                    incomplete_ids.append(pk)
+    
+    count += mark_pks_incomplete(PoliticianProfilePart, incomplete_ids, schema_editor.connection)
+    
+    report(f"Marked {count} politician profiles as incomplete")
 
 
+@run_in_transaction
+def mark_incomplete_entities(apps, schema_editor):
+    """Run the marking steps in order, in one transaction"""
+    # The order matters: agendas are derived from speeches, sessions and summaries
+    # from agendas, and profiles from speeches
+    mark_incomplete_speeches(apps, schema_editor)
+    mark_incomplete_agendas(apps, schema_editor)
+    mark_incomplete_plenary_sessions(apps, schema_editor)
+    mark_incomplete_agenda_summaries(apps, schema_editor)
+    mark_incomplete_politician_profiles(apps, schema_editor)
+
+
+@run_in_transaction
 def reverse_mark_incomplete(apps, schema_editor):
     """Reverse the migration by unmarking all entities"""
+    # Only rewrite the flagged rows; the (indexed) flag is rarely set
     Speech = apps.get_model('parliament_speeches', 'Speech')
     AgendaItem = apps.get_model('parliament_speeches', 'AgendaItem')
     PlenarySession = apps.get_model('parliament_speeches', 'PlenarySession')
     AgendaSummary = apps.get_model('parliament_speeches', 'AgendaSummary')
     PoliticianProfilePart = apps.get_model('parliament_speeches', 'PoliticianProfilePart')
     
-    Speech.objects.all().update(is_incomplete=False)
-    AgendaItem.objects.all().update(is_incomplete=False)
-    PlenarySession.objects.all().update(is_incomplete=False)
-    AgendaSummary.objects.all().update(is_incomplete=False)
-    PoliticianProfilePart.objects.all().update(is_incomplete=False)
+    Speech.objects.filter(is_incomplete=True).update(is_incomplete=False)
+    AgendaItem.objects.filter(is_incomplete=True).update(is_incomplete=False)
+    PlenarySession.objects.filter(is_incomplete=True).update(is_incomplete=False)
+    AgendaSummary.objects.filter(is_incomplete=True).update(is_incomplete=False)
+    PoliticianProfilePart.objects.filter(is_incomplete=True).update(is_incomplete=False)
 
 
 class Migration(migrations.Migration):
 
+    # The whole backfill commits in a single transaction (see run_in_transaction)
+    atomic = False
+
     dependencies = [
         ('parliament_speeches', '0024_add_is_incomplete_field'),
     ]
 
+    # The steps are plain set-based UPDATEs run back to back through one operation;
+    # running them in separate processes would only add connection setup and lock
+    # contention on the same tables.
     operations = [
-        migrations.RunPython(mark_incomplete_speeches, reverse_mark_incomplete),
-        migrations.RunPython(mark_incomplete_agendas, reverse_mark_incomplete),
-        migrations.RunPython(mark_incomplete_plenary_sessions, reverse_mark_incomplete),
-        migrations.RunPython(mark_incomplete_agenda_summaries, reverse_mark_incomplete),
-        migrations.RunPython(mark_incomplete_politician_profiles, reverse_mark_incomplete),
+        migrations.RunPython(mark_incomplete_entities, reverse_mark_incomplete),
     ]
 
@@ -1,75 +1,101 @@
 # Generated data migration to mark existing incomplete decisions and active politicians
 
-from django.db import migrations
+import logging
+import os
+import sys
+from functools import wraps
 
+from django.db import migrations, transaction
 
+
+logger = logging.getLogger(__name__)
+
+
+def report(message):
+    """Log migration progress; set DJANGO_MIGRATION_VERBOSE to also echo it to stderr"""
+    logger.info(message)
+    if os.environ.get('DJANGO_MIGRATION_VERBOSE'):
+        sys.stderr.write(message + '\n')
+        sys.stderr.flush()
+
+
+def run_in_transaction(func):
+    """Run a data migration step in its own transaction (the migration itself is non-atomic)"""
+    @wraps(func)
+    def wrapper(apps, schema_editor):
+        connection = schema_editor.connection
+        with transaction.atomic(using=connection.alias):
+            if connection.vendor == 'postgresql':
+                # Don't wait for the WAL flush on commit: the steps are idempotent,
+                # so a run lost to a crash can simply be re-run
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL synchronous_commit = OFF')
+            return func(apps, schema_editor)
+    return wrapper
+
+
+def has_incomplete_agendas(apps):
+    """Cheap LIMIT 1 probe; fresh databases have nothing to mark, so the steps can be skipped"""
+    AgendaItem = apps.get_model('parliament_speeches', 'AgendaItem')
+    return AgendaItem.objects.filter(is_incomplete=True).exists()
+
+
+@run_in_transaction
 def mark_incomplete_decisions(apps, schema_editor):
     """Mark agenda decisions with incomplete speeches as incomplete"""
-    AgendaDecision = apps.get_model('parliament_speeches', 'AgendaDecision')
-    Speech = apps.get_model('parliament_speeches', 'Speech')
+    if not has_incomplete_agendas(apps):
+        report("No incomplete agendas found, skipping agenda decisions")
+        return
     
-    # Get all agenda decisions
-    decisions = AgendaDecision.objects.all()
-    count = 0
+    AgendaDecision = apps.get_model('parliament_speeches', 'AgendaDecision')
+    AgendaItem = apps.get_model('parliament_speeches', 'AgendaItem')
     
-    for decision in decisions:
-        # Check if the related agenda has any incomplete speeches
-        has_incomplete = Speech.objects.filter(
-            agenda_item=decision.agenda_item,
-            event_type='SPEECH',
-            is_incomplete=True
-        ).exists()
-        
-        if has_incomplete:
-            decision.is_incomplete = True
-            decision.save(update_fields=['is_incomplete'])
-            count += 1
+    # Decisions follow their agenda's flag, already set by migration 0025
+    incomplete_agenda_ids = AgendaItem.objects.filter(is_incomplete=True).values('pk')
+    count = AgendaDecision.objects.filter(agenda_item_id__in=incomplete_agenda_ids).update(is_incomplete=True)
     
-    print(f"Marked {count} agenda decisions as incomplete")
+    report(f"Marked {count} agenda decisions as incomplete")
 
 
+@run_in_transaction
 def mark_incomplete_active_politicians(apps, schema_editor):
     """Mark agenda active politicians with incomplete speeches as incomplete"""
-    AgendaActivePolitician = apps.get_model('parliament_speeches', 'AgendaActivePolitician')
-    Speech = apps.get_model('parliament_speeches', 'Speech')
+    if not has_incomplete_agendas(apps):
+        report("No incomplete agendas found, skipping agenda active politicians")
+        return
     
-    # Get all agenda active politicians
-    active_politicians = AgendaActivePolitician.objects.all()
-    count = 0
+    AgendaActivePolitician = apps.get_model('parliament_speeches', 'AgendaActivePolitician')
+    AgendaItem = apps.get_model('parliament_speeches', 'AgendaItem')
     
-    for active_politician in active_politicians:
-        # Check if the related agenda has any incomplete speeches
-        has_incomplete = Speech.objects.filter(
-            agenda_item=active_politician.agenda_item,
-            event_type='SPEECH',
-            is_incomplete=True
-        ).exists()
-        
-        if has_incomplete:
-            active_politician.is_incomplete = True
-            active_politician.save(update_fields=['is_incomplete'])
-            count += 1
+    # Active politician descriptions follow their agenda's flag, already set by migration 0025
+    incomplete_agenda_ids = AgendaItem.objects.filter(is_incomplete=True).values('pk')
+    count = AgendaActivePolitician.objects.filter(agenda_item_id__in=incomplete_agenda_ids).update(is_incomplete=True)
     
-    print(f"Marked {count} agenda active politicians as incomplete")
+    report(f"Marked {count} agenda active politicians as incomplete")
 
 
+@run_in_transaction
 def reverse_mark_incomplete(apps, schema_editor):
     """Reverse the migration by unmarking all entities"""
+    # Only rewrite the flagged rows; the (indexed) flag is rarely set
     AgendaDecision = apps.get_model('parliament_speeches', 'AgendaDecision')
     AgendaActivePolitician = apps.get_model('parliament_speeches', 'AgendaActivePolitician')
     
-    AgendaDecision.objects.all().update(is_incomplete=False)
-    AgendaActivePolitician.objects.all().update(is_incomplete=False)
+    AgendaDecision.objects.filter(is_incomplete=True).update(is_incomplete=False)
+    AgendaActivePolitician.objects.filter(is_incomplete=True).update(is_incomplete=False)
 
 
 class Migration(migrations.Migration):
 
+    # Each step commits in its own transaction (see run_in_transaction)
+    atomic = False
+
     dependencies = [
         ('parliament_speeches', '0026_add_is_incomplete_to_decisions_and_active'),
     ]
 
     operations = [
         migrations.RunPython(mark_incomplete_decisions, reverse_mark_incomplete),
-        migrations.RunPython(mark_incomplete_active_politicians, reverse_mark_incomplete),
+        migrations.RunPython(mark_incomplete_active_politicians, migrations.RunPython.noop),
     ]
 
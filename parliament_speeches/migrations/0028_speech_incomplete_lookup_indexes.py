@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:22
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('parliament_speeches', '0027_mark_incomplete_decisions_and_active'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='speech',
+            index=models.Index(fields=['agenda_item', 'event_type', 'is_incomplete'], name='speech_ai_et_inc_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='speech',
+            index=models.Index(fields=['politician', 'event_type', 'date', 'is_incomplete'], name='speech_pol_et_d_inc_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parliament_speeches', '0028_speech_incomplete_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='politicianfaction',
+            index=models.Index(condition=models.Q(('end_date__isnull', True)), fields=['politician'], name='polfac_active_idx'),
+        ),
+    ]
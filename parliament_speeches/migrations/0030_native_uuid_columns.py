@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parliament_speeches', '0029_politicianfaction_active_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='agendaitem',
+            name='uuid',
+            field=models.UUIDField(help_text='Päevakorrapunkti UUID', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='faction',
+            name='uuid',
+            field=models.UUIDField(help_text='UUID from Riigikogu API', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='politician',
+            name='uuid',
+            field=models.UUIDField(help_text='UUID from Riigikogu API', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='speech',
+            name='uuid',
+            field=models.UUIDField(help_text='Sündmuse UUID', unique=True),
+        ),
+    ]
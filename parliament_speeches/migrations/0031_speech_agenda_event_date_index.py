@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:31
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('parliament_speeches', '0030_native_uuid_columns'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='speech',
+            index=models.Index(fields=['agenda_item', 'event_type', 'date'], name='speech_agenda_evt_date_idx'),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:38
+
+import logging
+import os
+import sys
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+logger = logging.getLogger(__name__)
+
+# Period column that identifies a profile part for each period type
+PERIOD_FIELDS = {
+    'AGENDA': 'agenda_item',
+    'PLENARY_SESSION': 'plenary_session',
+    'MONTH': 'month',
+    'YEAR': 'year',
+    'ALL': None,
+}
+
+
+def report(message):
+    """Log migration progress; set DJANGO_MIGRATION_VERBOSE to also echo it to stderr"""
+    logger.info(message)
+    if os.environ.get('DJANGO_MIGRATION_VERBOSE'):
+        sys.stderr.write(message + '\n')
+        sys.stderr.flush()
+
+
+def check_duplicate_profile_parts(apps, schema_editor):
+    """Stop before adding the new constraints if duplicate parts exist
+
+    The old unique_together constraints never matched rows whose period columns were NULL,
+    so duplicates (in particular of period_type=ALL) may already exist. They hold paid AI
+    output, so which copy to keep is left to the operator instead of being decided here.
+    """
+    PoliticianProfilePart = apps.get_model('parliament_speeches', 'PoliticianProfilePart')
+    
+    older_pks = []
+    for period_type, period_field in PERIOD_FIELDS.items():
+        key_fields = ['politician', 'category'] + ([period_field] if period_field else [])
+        duplicates = (
+            PoliticianProfilePart.objects.filter(period_type=period_type)
+            .values(*key_fields)
+            .annotate(rows=Count('id'))
+            .filter(rows__gt=1)
+            .order_by()
+        )
+        for key in duplicates:
+            key.pop('rows')
+            pks = list(
+                PoliticianProfilePart.objects.filter(period_type=period_type, **key)
+                .order_by('-updated_at', '-pk')
+                .values_list('pk', flat=True)
+            )
+            report(f"Duplicate {period_type} profile parts {key}: pks {pks} (most recently updated first)")
+            older_pks.extend(pks[1:])
+    
+    if older_pks:
+        raise RuntimeError(
+            f"{len(older_pks)} politician profile parts duplicate a more recently updated part "
+            f"(pks {sorted(older_pks)}). Delete or merge them, then run migrate again."
+        )
+    report("No duplicate politician profile parts found")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parliament_speeches', '0031_speech_agenda_event_date_index'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='politicianprofilepart',
+            unique_together=set(),
+        ),
+        migrations.RunPython(check_duplicate_profile_parts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='politicianprofilepart',
+            constraint=models.UniqueConstraint(condition=models.Q(('period_type', 'AGENDA')), fields=('politician', 'category', 'agenda_item'), name='ppp_uniq_agenda'),
+        ),
+        migrations.AddConstraint(
+            model_name='politicianprofilepart',
+            constraint=models.UniqueConstraint(condition=models.Q(('period_type', 'PLENARY_SESSION')), fields=('politician', 'category', 'plenary_session'), name='ppp_uniq_session'),
+        ),
+        migrations.AddConstraint(
+            model_name='politicianprofilepart',
+            constraint=models.UniqueConstraint(condition=models.Q(('period_type', 'MONTH')), fields=('politician', 'category', 'month'), name='ppp_uniq_month'),
+        ),
+        migrations.AddConstraint(
+            model_name='politicianprofilepart',
+            constraint=models.UniqueConstraint(condition=models.Q(('period_type', 'YEAR')), fields=('politician', 'category', 'year'), name='ppp_uniq_year'),
+        ),
+        migrations.AddConstraint(
+            model_name='politicianprofilepart',
+            constraint=models.UniqueConstraint(condition=models.Q(('period_type', 'ALL')), fields=('politician', 'category'), name='ppp_uniq_all'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:38
+
+import logging
+import os
+import sys
+
+from django.db import migrations, models
+
+
+logger = logging.getLogger(__name__)
+
+# Period column that identifies a profile part for each period type
+PERIOD_FIELDS = {
+    'AGENDA': 'agenda_item',
+    'PLENARY_SESSION': 'plenary_session',
+    'MONTH': 'month',
+    'YEAR': 'year',
+    'ALL': None,
+}
+
+
+def report(message):
+    """Log migration progress; set DJANGO_MIGRATION_VERBOSE to also echo it to stderr"""
+    logger.info(message)
+    if os.environ.get('DJANGO_MIGRATION_VERBOSE'):
+        sys.stderr.write(message + '\n')
+        sys.stderr.flush()
+
+
+def normalize_period_identifiers(apps, schema_editor):
+    """Bring existing rows in line with the check constraint before it is added
+
+    Period columns that do not belong to a row's period_type are cleared. Rows missing
+    their own period identifier stop the migration: they hold paid AI output, so fixing
+    or deleting them is left to the operator.
+    """
+    PoliticianProfilePart = apps.get_model('parliament_speeches', 'PoliticianProfilePart')
+    
+    missing_pks = []
+    for period_type, period_field in PERIOD_FIELDS.items():
+        rows = PoliticianProfilePart.objects.filter(period_type=period_type)
+        if period_field:
+            missing_pks.extend(rows.filter(**{f'{period_field}__isnull': True}).values_list('pk', flat=True))
+    
+    if missing_pks:
+        raise RuntimeError(
+            f"{len(missing_pks)} politician profile parts have no {'/'.join(filter(None, PERIOD_FIELDS.values()))} "
+            f"value for their period_type (pks {sorted(missing_pks)}). Set or delete them, then run migrate again."
+        )
+    
+    for period_type, period_field in PERIOD_FIELDS.items():
+        other_fields = [field for field in PERIOD_FIELDS.values() if field and field != period_field]
+        stray = models.Q()
+        for field in other_fields:
+            stray |= models.Q(**{f'{field}__isnull': False})
+        count = PoliticianProfilePart.objects.filter(stray, period_type=period_type).update(
+            **{field: None for field in other_fields}
+        )
+        report(f"Cleared other period columns of {count} {period_type} profile parts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parliament_speeches', '0032_politicianprofilepart_partial_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_period_identifiers, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='politicianprofilepart',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('agenda_item__isnull', True), ('month__isnull', True), ('period_type', 'ALL'), ('plenary_session__isnull', True), ('year__isnull', True)), models.Q(('agenda_item__isnull', False), ('month__isnull', True), ('period_type', 'AGENDA'), ('plenary_session__isnull', True), ('year__isnull', True)), models.Q(('agenda_item__isnull', True), ('month__isnull', True), ('period_type', 'PLENARY_SESSION'), ('plenary_session__isnull', False), ('year__isnull', True)), models.Q(('agenda_item__isnull', True), ('month__isnull', False), ('period_type', 'MONTH'), ('plenary_session__isnull', True), ('year__isnull', True)), models.Q(('agenda_item__isnull', True), ('month__isnull', True), ('period_type', 'YEAR'), ('plenary_session__isnull', True), ('year__isnull', False)), _connector='OR'), name='ppp_period_identifier', violation_error_message='Only the period identifier matching period_type may be set'),
+        ),
+    ]
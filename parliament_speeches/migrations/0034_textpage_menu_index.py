@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parliament_speeches', '0033_politicianprofilepart_period_check'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='textpage',
+            index=models.Index(condition=models.Q(('is_published', True), ('show_in_menu', True)), fields=['menu_order', 'title'], name='textpage_menu_idx'),
+        ),
+    ]
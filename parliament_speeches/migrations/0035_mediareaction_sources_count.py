@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 13:49
+
+from django.db import migrations, models
+
+
+def fill_sources_count(apps, schema_editor):
+    """Set sources_count from the stored sources_data of existing media reactions"""
+    MediaReaction = apps.get_model('parliament_speeches', 'MediaReaction')
+    
+    reactions = []
+    for reaction in MediaReaction.objects.only('pk', 'sources_data').iterator(chunk_size=500):
+        reaction.sources_count = len(reaction.sources_data) if reaction.sources_data else 0
+        if reaction.sources_count:
+            reactions.append(reaction)
+    
+    MediaReaction.objects.bulk_update(reactions, ['sources_count'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parliament_speeches', '0034_textpage_menu_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mediareaction',
+            name='sources_count',
+            field=models.IntegerField(default=0, help_text='Allikate arv'),
+        ),
+        migrations.RunPython(fill_sources_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('parliament_speeches', '0035_mediareaction_sources_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Allikteksti ja tõlkeseadete räsi', max_length=64, unique=True)),
+                ('provider', models.CharField(help_text='AI teenusepakkuja', max_length=20)),
+                ('model', models.CharField(help_text='Mudeli nimi', max_length=200)),
+                ('target_language', models.CharField(help_text='Sihtkeel (en, ru või both)', max_length=10)),
+                ('translation', models.JSONField(help_text='Tõlge')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Translation Cache Entry',
+                'verbose_name_plural': 'Translation Cache Entries',
+            },
+        ),
+    ]
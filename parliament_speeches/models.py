@@ -1,12 +1,70 @@
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+_translate = None
+
+
+def _get_translate():
+    """Return translation.translate, importing it on first use (the module sets up i18next on import)"""
+    global _translate
+    if _translate is None:
+        from .translation import translate
+        _translate = translate
+    return _translate
+
+
+def accepts_show_missing(method):
+    """Mark a get_localized_* method as taking show_missing, so template tags can check it cheaply"""
+    method.accepts_show_missing = True
+    return method
+
+
+# Translated texts are stored as separate <field>, <field>_en and <field>_ru columns rather
+# than one JSON column: untranslated (NULL) columns take no space in the row on PostgreSQL,
+# each language can be filtered and indexed directly (e.g. "missing translations" queries),
+# and views that need a single language can .defer() the others.
+
+
+def current_faction_prefetch(lookup='faction_memberships'):
+    """Prefetch only active faction memberships into `_current_memberships` (read by current_faction)"""
+    return models.Prefetch(
+        lookup,
+        # Ordered by pk like the unprefetched .first() fallback, so overlapping memberships resolve the same way
+        queryset=PoliticianFaction.objects.filter(end_date__isnull=True).select_related('faction').order_by('pk'),
+        to_attr='_current_memberships'
+    )
+
+
+class PoliticianManager(models.Manager):
+    """Manager for Politician with helpers for list views"""
+    
+    def with_current_faction(self):
+        """Politicians with their current faction loaded in one extra query"""
+        return self.get_queryset().prefetch_related(current_faction_prefetch())
+    
+    def with_profiling_ratio(self):
+        """Politicians annotated with `profiling_ratio` (same value as profiling_percentage, unrounded) for SQL sorting"""
+        return self.get_queryset().annotate(
+            profiling_ratio=models.Case(
+                models.When(
+                    profiles_required__gt=0,
+                    then=models.F('profiles_already_profiled') * 100.0 / models.F('profiles_required')
+                ),
+                default=models.Value(0.0),
+                output_field=models.FloatField()
+            )
+        )
 
 
 class Politician(models.Model):
     """Model representing a politician/parliament member"""
     
-    uuid = models.CharField(max_length=36, unique=True, db_index=True, 
-                           help_text="UUID from Riigikogu API")
+    uuid = models.UUIDField(unique=True, help_text="UUID from Riigikogu API")
     first_name = models.CharField(max_length=100, help_text="Eesnimi")
     last_name = models.CharField(max_length=100, help_text="Perekonnanimi")
     full_name = models.CharField(max_length=200, help_text="Täisnimi")
@@ -39,6 +97,8 @@ class Politician(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = PoliticianManager()
+    
     class Meta:
         verbose_name = "Politician"
         verbose_name_plural = "Politicians"
@@ -47,23 +107,27 @@ class Politician(models.Model):
     def __str__(self):
         return self.full_name or f"{self.first_name} {self.last_name}"
     
-    @property
+    @cached_property
     def formatted_total_time(self):
         """Return formatted total speaking time as hours:minutes"""
         if not self.total_time_seconds:
             return None
         
-        hours = self.total_time_seconds // 3600
-        minutes = (self.total_time_seconds % 3600) // 60
+        hours, remainder = divmod(self.total_time_seconds, 3600)
+        minutes = remainder // 60
         
         if hours > 0:
             return f"{hours}h {minutes}m"
         else:
             return f"{minutes}m"
     
-    @property
+    @cached_property
     def current_faction(self):
         """Return the politician's current faction (active membership without end_date)"""
+        # Use memberships loaded by current_faction_prefetch() when available
+        if hasattr(self, '_current_memberships'):
+            return self._current_memberships[0].faction if self._current_memberships else None
+        
         current_membership = self.faction_memberships.filter(
             end_date__isnull=True
         ).select_related('faction').first()
@@ -83,8 +147,7 @@ class Politician(models.Model):
 class Faction(models.Model):
     """Model representing a political faction"""
     
-    uuid = models.CharField(max_length=36, unique=True, db_index=True,
-                           help_text="UUID from Riigikogu API")
+    uuid = models.UUIDField(unique=True, help_text="UUID from Riigikogu API")
     name = models.CharField(max_length=200, help_text="Fraktsiooni nimi")
     
     # Metadata
@@ -118,6 +181,11 @@ class PoliticianFaction(models.Model):
         verbose_name = "Politician Faction Membership"
         verbose_name_plural = "Politician Faction Memberships"
         unique_together = ['politician', 'faction', 'start_date']
+        indexes = [
+            # Active memberships only (typically one per politician), for current_faction
+            models.Index(fields=['politician'], condition=models.Q(end_date__isnull=True),
+                         name='polfac_active_idx'),
+        ]
         
     def __str__(self):
         return f"{self.politician} - {self.faction}"
@@ -149,25 +217,57 @@ class PlenarySession(models.Model):
     def __str__(self):
         return f"{self.title} ({self.date.date()})"
     
+    # The get_localized_* getters (here and on the other models) use explicit comparisons and
+    # direct attribute access on purpose: a shared getattr()-based helper measured slower
+    @accepts_show_missing
     def get_localized_title(self, language='et', show_missing=False):
         """Get title in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.title or ''
         if language == 'en' and self.title_en:
             return self.title_en
         elif language == 'ru' and self.title_ru:
             return self.title_ru
-        elif language != 'et' and show_missing and self.title:
-            # Import here to avoid circular import
-            from .translation import translate
-            missing_text = translate('TRANSLATION_MISSING', language)
+        elif show_missing and self.title:
+            missing_text = _get_translate()('TRANSLATION_MISSING', language)
             return f"{missing_text}{self.title}"
         return self.title or ''
 
 
+class AgendaItemManager(models.Manager):
+    """Manager for AgendaItem with helpers for detail views"""
+    
+    def with_full_context(self):
+        """Agenda items with session, structured data and spoken speeches loaded up front
+
+        Summary and active politician come in the main query; decisions and the SPEECH events
+        (ordered by date, in `spoken_speeches`) each take one extra query, plus one per
+        politician set for their current factions.
+        """
+        return self.get_queryset().select_related(
+            'plenary_session', 'structured_summary', 'active_politician__politician'
+        ).defer('structured_summary__xml_response').prefetch_related(
+            current_faction_prefetch('active_politician__politician__faction_memberships'),
+            models.Prefetch(
+                'decisions',
+                queryset=AgendaDecision.objects.select_related('politician').prefetch_related(
+                    current_faction_prefetch('politician__faction_memberships')
+                )
+            ),
+            models.Prefetch(
+                'speeches',
+                queryset=Speech.objects.filter(event_type='SPEECH').select_related('politician').prefetch_related(
+                    current_faction_prefetch('politician__faction_memberships')
+                ).order_by('date'),
+                to_attr='spoken_speeches'
+            ),
+        )
+
+
 class AgendaItem(models.Model):
     """Model representing an agenda item in a plenary session"""
     
-    uuid = models.CharField(max_length=36, unique=True, db_index=True,
-                           help_text="Päevakorrapunkti UUID")
+    uuid = models.UUIDField(unique=True, help_text="Päevakorrapunkti UUID")
     plenary_session = models.ForeignKey(PlenarySession, on_delete=models.CASCADE,
                                       related_name='agenda_items')
     date = models.DateTimeField(help_text="Päevakorrapunkti aeg")
@@ -182,6 +282,8 @@ class AgendaItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = AgendaItemManager()
+    
     class Meta:
         verbose_name = "Agenda Item"
         verbose_name_plural = "Agenda Items"
@@ -190,30 +292,31 @@ class AgendaItem(models.Model):
     def __str__(self):
         return f"{self.title[:100]}..."
     
-    @property
+    @cached_property
     def formatted_total_time(self):
         """Return formatted total time as hours:minutes"""
         if not self.total_time_seconds:
             return ""
         
-        hours = self.total_time_seconds // 3600
-        minutes = (self.total_time_seconds % 3600) // 60
+        hours, remainder = divmod(self.total_time_seconds, 3600)
+        minutes = remainder // 60
         
         if hours > 0:
             return f"{hours}h {minutes}m"
         else:
             return f"{minutes}m"
     
+    @accepts_show_missing
     def get_localized_title(self, language='et', show_missing=False):
         """Get title in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.title or ''
         if language == 'en' and self.title_en:
             return self.title_en
         elif language == 'ru' and self.title_ru:
             return self.title_ru
-        elif language != 'et' and show_missing and self.title:
-            # Import here to avoid circular import
-            from .translation import translate
-            missing_text = translate('TRANSLATION_MISSING', language)
+        elif show_missing and self.title:
+            missing_text = _get_translate()('TRANSLATION_MISSING', language)
             return f"{missing_text}{self.title}"
         return self.title or ''
 
@@ -248,16 +351,17 @@ class AgendaSummary(models.Model):
     def __str__(self):
         return f"Summary for {self.agenda_item.title[:50]}..."
     
+    @accepts_show_missing
     def get_localized_summary(self, language='et', show_missing=False):
         """Get summary in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.summary_text or ''
         if language == 'en' and self.summary_text_en:
             return self.summary_text_en
         elif language == 'ru' and self.summary_text_ru:
             return self.summary_text_ru
-        elif language != 'et' and show_missing and self.summary_text:
-            # Import here to avoid circular import
-            from .translation import translate
-            missing_text = translate('TRANSLATION_MISSING', language)
+        elif show_missing and self.summary_text:
+            missing_text = _get_translate()('TRANSLATION_MISSING', language)
             return f"{missing_text}{self.summary_text}"
         return self.summary_text or ''
 
@@ -295,16 +399,17 @@ class AgendaDecision(models.Model):
             return f"Decision by {self.politician.full_name}: {self.decision_text[:50]}..."
         return f"Collective decision: {self.decision_text[:50]}..."
     
+    @accepts_show_missing
     def get_localized_decision(self, language='et', show_missing=False):
         """Get decision text in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.decision_text or ''
         if language == 'en' and self.decision_text_en:
             return self.decision_text_en
         elif language == 'ru' and self.decision_text_ru:
             return self.decision_text_ru
-        elif language != 'et' and show_missing and self.decision_text:
-            # Import here to avoid circular import
-            from .translation import translate
-            missing_text = translate('TRANSLATION_MISSING', language)
+        elif show_missing and self.decision_text:
+            missing_text = _get_translate()('TRANSLATION_MISSING', language)
             return f"{missing_text}{self.decision_text}"
         return self.decision_text or ''
 
@@ -341,20 +446,29 @@ class AgendaActivePolitician(models.Model):
             return f"Active: {self.politician.full_name} in {self.agenda_item.title[:50]}..."
         return f"No active politician in {self.agenda_item.title[:50]}..."
     
+    @accepts_show_missing
     def get_localized_activity(self, language='et', show_missing=False):
         """Get activity description in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.activity_description or ''
         if language == 'en' and self.activity_description_en:
             return self.activity_description_en
         elif language == 'ru' and self.activity_description_ru:
             return self.activity_description_ru
-        elif language != 'et' and show_missing and self.activity_description:
-            # Import here to avoid circular import
-            from .translation import translate
-            missing_text = translate('TRANSLATION_MISSING', language)
+        elif show_missing and self.activity_description:
+            missing_text = _get_translate()('TRANSLATION_MISSING', language)
             return f"{missing_text}{self.activity_description}"
         return self.activity_description or ''
 
 
+class SpeechManager(models.Manager):
+    """Manager for Speech with helpers for list views"""
+    
+    def without_text(self):
+        """Speeches without the transcript text and AI summaries, for pages that only need metadata"""
+        return self.get_queryset().defer('text', 'ai_summary', 'ai_summary_en', 'ai_summary_ru')
+
+
 class Speech(models.Model):
     """Model representing a speech or statement by a politician"""
     
@@ -365,12 +479,13 @@ class Speech(models.Model):
         ('SESSION_END', 'Session End'),
     )
     
-    uuid = models.CharField(max_length=36, unique=True, db_index=True,
-                           help_text="Sündmuse UUID")
+    uuid = models.UUIDField(unique=True, help_text="Sündmuse UUID")
     agenda_item = models.ForeignKey(AgendaItem, on_delete=models.CASCADE,
                                   related_name='speeches')
     politician = models.ForeignKey(Politician, on_delete=models.CASCADE,
                                  related_name='speeches', blank=True, null=True)
+    # Choice codes (here and in PoliticianProfilePart) are kept as short varchar values: they
+    # appear in URLs, templates and AI prompts, and varchar is not padded to max_length
     event_type = models.CharField(max_length=20, choices=EVENT_TYPES, default='SPEECH',
                                 help_text="Sündmuse tüüp")
     date = models.DateTimeField(help_text="Sündmuse aeg")
@@ -393,6 +508,8 @@ class Speech(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = SpeechManager()
+    
     class Meta:
         verbose_name = "Speech"
         verbose_name_plural = "Speeches"
@@ -401,6 +518,11 @@ class Speech(models.Model):
             models.Index(fields=['date']),
             models.Index(fields=['speaker']),
             models.Index(fields=['event_type']),
+            # Incomplete-speech lookups per agenda item and per politician/period
+            models.Index(fields=['agenda_item', 'event_type', 'is_incomplete'], name='speech_ai_et_inc_idx'),
+            models.Index(fields=['politician', 'event_type', 'date', 'is_incomplete'], name='speech_pol_et_d_inc_idx'),
+            # Per-agenda speech lists (agenda_item=?, event_type=?) ORDER BY date, without a sort step
+            models.Index(fields=['agenda_item', 'event_type', 'date'], name='speech_agenda_evt_date_idx'),
         ]
         
     def __str__(self):
@@ -409,20 +531,23 @@ class Speech(models.Model):
     @property
     def text_preview(self):
         """Return first 200 characters of the speech text"""
-        if self.text:
-            return self.text[:200] + "..." if len(self.text) > 200 else self.text
+        # Use the text_head annotation (first 201 characters) when the queryset provides it
+        text = self.text_head if hasattr(self, 'text_head') else self.text
+        if text:
+            return text[:200] + "..." if len(text) > 200 else text
         return ""
     
+    @accepts_show_missing
     def get_localized_ai_summary(self, language='et', show_missing=False):
         """Get AI summary in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.ai_summary or ''
         if language == 'en' and self.ai_summary_en:
             return self.ai_summary_en
         elif language == 'ru' and self.ai_summary_ru:
             return self.ai_summary_ru
-        elif language != 'et' and show_missing and self.ai_summary:
-            # Import here to avoid circular import
-            from .translation import translate
-            missing_text = translate('TRANSLATION_MISSING', language)
+        elif show_missing and self.ai_summary:
+            missing_text = _get_translate()('TRANSLATION_MISSING', language)
             return f"{missing_text}{self.ai_summary}"
         return self.ai_summary or ''
 
@@ -508,12 +633,37 @@ class PoliticianProfilePart(models.Model):
     class Meta:
         verbose_name = "Politician Profile Part"
         verbose_name_plural = "Politician Profile Parts"
-        # Ensure unique combinations based on period type
-        unique_together = [
-            ['politician', 'category', 'period_type', 'agenda_item'],
-            ['politician', 'category', 'period_type', 'plenary_session'],
-            ['politician', 'category', 'period_type', 'month'],
-            ['politician', 'category', 'period_type', 'year'],
+        # Ensure unique combinations based on period type. Partial constraints are used
+        # because the unused period columns are NULL, and NULLs never collide in a plain
+        # unique index; each one also only indexes the rows of its own period type
+        constraints = [
+            models.UniqueConstraint(fields=['politician', 'category', 'agenda_item'],
+                                    condition=models.Q(period_type='AGENDA'), name='ppp_uniq_agenda'),
+            models.UniqueConstraint(fields=['politician', 'category', 'plenary_session'],
+                                    condition=models.Q(period_type='PLENARY_SESSION'), name='ppp_uniq_session'),
+            models.UniqueConstraint(fields=['politician', 'category', 'month'],
+                                    condition=models.Q(period_type='MONTH'), name='ppp_uniq_month'),
+            models.UniqueConstraint(fields=['politician', 'category', 'year'],
+                                    condition=models.Q(period_type='YEAR'), name='ppp_uniq_year'),
+            models.UniqueConstraint(fields=['politician', 'category'],
+                                    condition=models.Q(period_type='ALL'), name='ppp_uniq_all'),
+            # Only the period identifier matching period_type may be set (none for ALL)
+            models.CheckConstraint(
+                check=(
+                    models.Q(period_type='ALL', agenda_item__isnull=True, plenary_session__isnull=True,
+                             month__isnull=True, year__isnull=True)
+                    | models.Q(period_type='AGENDA', agenda_item__isnull=False, plenary_session__isnull=True,
+                               month__isnull=True, year__isnull=True)
+                    | models.Q(period_type='PLENARY_SESSION', agenda_item__isnull=True,
+                               plenary_session__isnull=False, month__isnull=True, year__isnull=True)
+                    | models.Q(period_type='MONTH', agenda_item__isnull=True, plenary_session__isnull=True,
+                               month__isnull=False, year__isnull=True)
+                    | models.Q(period_type='YEAR', agenda_item__isnull=True, plenary_session__isnull=True,
+                               month__isnull=True, year__isnull=False)
+                ),
+                name='ppp_period_identifier',
+                violation_error_message="Only the period identifier matching period_type may be set",
+            ),
         ]
         ordering = ['politician', 'category', 'period_type']
         
@@ -535,42 +685,19 @@ class PoliticianProfilePart(models.Model):
             return "All Time"
         return self.period_type
     
+    @accepts_show_missing
     def get_localized_analysis(self, language='et', show_missing=False):
         """Get analysis in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.analysis
         if language == 'en' and self.analysis_en:
             return self.analysis_en
         elif language == 'ru' and self.analysis_ru:
             return self.analysis_ru
-        elif language != 'et' and show_missing and self.analysis:
-            # Import here to avoid circular import
-            from .translation import translate
-            missing_text = translate('TRANSLATION_MISSING', language)
+        elif show_missing and self.analysis:
+            missing_text = _get_translate()('TRANSLATION_MISSING', language)
             return f"{missing_text}{self.analysis}"
         return self.analysis
-    
-    def clean(self):
-        """Validate that only appropriate period identifier is set"""
-        from django.core.exceptions import ValidationError
-        
-        # Count non-null period identifiers
-        period_fields = [self.agenda_item, self.plenary_session, self.month, self.year]
-        non_null_count = sum(1 for field in period_fields if field is not None)
-        
-        if self.period_type == 'ALL':
-            if non_null_count > 0:
-                raise ValidationError("For period_type=ALL, no period identifiers should be set")
-        elif self.period_type == 'AGENDA':
-            if not self.agenda_item or non_null_count != 1:
-                raise ValidationError("For period_type=AGENDA, only agenda_item should be set")
-        elif self.period_type == 'PLENARY_SESSION':
-            if not self.plenary_session or non_null_count != 1:
-                raise ValidationError("For period_type=PLENARY_SESSION, only plenary_session should be set")
-        elif self.period_type == 'MONTH':
-            if not self.month or non_null_count != 1:
-                raise ValidationError("For period_type=MONTH, only month should be set")
-        elif self.period_type == 'YEAR':
-            if not self.year or non_null_count != 1:
-                raise ValidationError("For period_type=YEAR, only year should be set")
 
 
 class MediaReaction(models.Model):
@@ -578,6 +705,7 @@ class MediaReaction(models.Model):
     
     politician = models.ForeignKey(Politician, on_delete=models.CASCADE,
                                  related_name='media_reactions')
+    # Same string codes as PoliticianProfilePart (see the note on Speech.event_type)
     category = models.CharField(max_length=50, 
                               choices=PoliticianProfilePart.PROFILE_CATEGORIES,
                               help_text="Profilieerimise kategooria")
@@ -611,6 +739,8 @@ class MediaReaction(models.Model):
                                   help_text="Allikad JSON formaadis")
     time_series_data = models.JSONField(default=list, blank=True,
                                       help_text="Ajaline andmestik JSON formaadis")
+    # Kept in sync with sources_data by save(), so the count can be shown without loading the JSON
+    sources_count = models.IntegerField(default=0, help_text="Allikate arv")
     
     # Metadata
     last_updated = models.DateTimeField(auto_now=True)
@@ -627,6 +757,8 @@ class MediaReaction(models.Model):
     
     def get_localized_analysis(self, language='et'):
         """Get media analysis in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.media_analysis_et or ''
         if language == 'en' and self.media_analysis_en:
             return self.media_analysis_en
         elif language == 'ru' and self.media_analysis_ru:
@@ -635,12 +767,16 @@ class MediaReaction(models.Model):
     
     def get_localized_summary(self, language='et'):
         """Get media summary in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.media_summary_et or ''
         if language == 'en' and self.media_summary_en:
             return self.media_summary_en
         elif language == 'ru' and self.media_summary_ru:
             return self.media_summary_ru
         return self.media_summary_et or ''
     
+    # Derived on read: two float comparisons cost less than storing (and indexing) a label
+    # column; to select by sentiment in SQL, filter avg_sentiment on the same 0.1 thresholds
     @property
     def sentiment_label(self):
         """Get human-readable sentiment label"""
@@ -654,7 +790,15 @@ class MediaReaction(models.Model):
     @property
     def unique_sources_count(self):
         """Get count of unique sources"""
-        return len(self.sources_data) if self.sources_data else 0
+        return self.sources_count
+    
+    def save(self, *args, **kwargs):
+        """Save, refreshing sources_count from sources_data"""
+        self.sources_count = len(self.sources_data) if self.sources_data else 0
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'sources_data' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'sources_count'}
+        super().save(*args, **kwargs)
 
 
 class StatisticsEntry(models.Model):
@@ -681,6 +825,8 @@ class StatisticsEntry(models.Model):
     
     def get_localized_name(self, language='et'):
         """Get name in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.name or ''
         if language == 'en' and self.name_en:
             return self.name_en
         elif language == 'ru' and self.name_ru:
@@ -693,6 +839,9 @@ class TextPage(models.Model):
     
     slug = models.SlugField(max_length=100, unique=True, help_text="URL slug (e.g., 'about-us')")
     
+    # One column per language, the same as every other translated model here, and not a single
+    # JSON column: menu_queryset() can then load one title column and leave out the content columns.
+    # Long content is TOASTed out of line, so unread columns add little to a row fetch
     # Estonian content (default)
     title = models.CharField(max_length=200, help_text="Pealkiri eesti keeles")
     meta_description = models.TextField(max_length=300, blank=True, null=True, help_text="Meta kirjeldus eesti keeles")
@@ -724,12 +873,46 @@ class TextPage(models.Model):
         verbose_name = "Text Page"
         verbose_name_plural = "Text Pages"
         ordering = ['menu_order', 'title']
+        indexes = [
+            # Menu pages (the query behind get_menu_pages), already in menu order
+            models.Index(fields=['menu_order', 'title'],
+                         condition=models.Q(is_published=True, show_in_menu=True),
+                         name='textpage_menu_idx'),
+        ]
         
+    # The menu is rendered on every page. The cache is per process (LocMemCache): a change clears
+    # the worker that made it at once (see the signal receivers below), and the other workers
+    # show the old menu for at most MENU_PAGES_CACHE_TIMEOUT seconds
+    MENU_PAGES_CACHE_KEY = 'text_page_menu_pages'
+    MENU_PAGES_CACHE_TIMEOUT = 60
+    
     def __str__(self):
         return self.title
     
+    @classmethod
+    def menu_queryset(cls, language=None):
+        """Published menu pages in menu order, loading only slug and titles (not the content columns)"""
+        # The Estonian title is always loaded: it is the fallback for missing translations
+        title_fields = ['title_en', 'title_ru'] if language is None else (
+            [f'title_{language}'] if language in ('en', 'ru') else []
+        )
+        return cls.objects.filter(is_published=True, show_in_menu=True).only(
+            'slug', 'title', *title_fields
+        ).order_by('menu_order', 'title')
+    
+    @classmethod
+    def get_menu_pages(cls):
+        """Published menu pages for every language (cached)"""
+        menu_pages = cache.get(cls.MENU_PAGES_CACHE_KEY)
+        if menu_pages is None:
+            menu_pages = list(cls.menu_queryset())
+            cache.set(cls.MENU_PAGES_CACHE_KEY, menu_pages, cls.MENU_PAGES_CACHE_TIMEOUT)
+        return menu_pages
+    
     def get_localized_title(self, language='et'):
         """Get title in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.title or ''
         if language == 'en' and self.title_en:
             return self.title_en
         elif language == 'ru' and self.title_ru:
@@ -738,6 +921,8 @@ class TextPage(models.Model):
     
     def get_localized_meta_description(self, language='et'):
         """Get meta description in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.meta_description or ''
         if language == 'en' and self.meta_description_en:
             return self.meta_description_en
         elif language == 'ru' and self.meta_description_ru:
@@ -746,6 +931,8 @@ class TextPage(models.Model):
     
     def get_localized_keywords(self, language='et'):
         """Get keywords in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.keywords or ''
         if language == 'en' and self.keywords_en:
             return self.keywords_en
         elif language == 'ru' and self.keywords_ru:
@@ -754,6 +941,8 @@ class TextPage(models.Model):
     
     def get_localized_content(self, language='et'):
         """Get content in specified language, fallback to Estonian"""
+        if language == 'et':
+            return self.content or ''
         if language == 'en' and self.content_en:
             return self.content_en
         elif language == 'ru' and self.content_ru:
@@ -761,6 +950,12 @@ class TextPage(models.Model):
         return self.content or ''
 
 
+@receiver([post_save, post_delete], sender=TextPage)
+def clear_menu_pages_cache(sender, **kwargs):
+    """Drop the cached menu when a text page changes (signals also cover queryset deletes)"""
+    cache.delete(TextPage.MENU_PAGES_CACHE_KEY)
+
+
 class ParliamentParseError(models.Model):
     """Model for tracking parsing errors from the Parliament API"""
     
@@ -807,3 +1002,25 @@ class ParliamentParseError(models.Model):
         
     def __str__(self):
         return f"{self.get_error_type_display()}: {self.error_message[:100]}"
+
+
+class TranslationCache(models.Model):
+    """AI translation results kept across runs, so identical source texts are not paid for twice"""
+    
+    # BLAKE2b digest of provider, model, target language and source text; the translation
+    # does not go stale, as a new provider or model gives a new key
+    key = models.CharField(max_length=64, unique=True, help_text="Allikteksti ja tõlkeseadete räsi")
+    provider = models.CharField(max_length=20, help_text="AI teenusepakkuja")
+    model = models.CharField(max_length=200, help_text="Mudeli nimi")
+    target_language = models.CharField(max_length=10, help_text="Sihtkeel (en, ru või both)")
+    # A string, or {'en': ..., 'ru': ...} for target_language 'both'
+    translation = models.JSONField(help_text="Tõlge")
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = "Translation Cache Entry"
+        verbose_name_plural = "Translation Cache Entries"
+    
+    def __str__(self):
+        return f"{self.provider}/{self.model} → {self.target_language}: {self.key[:12]}"
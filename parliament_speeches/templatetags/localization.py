@@ -1,6 +1,9 @@
 """
 Template filters for localization support
 """
+import threading
+from functools import lru_cache
+
 from django import template
 import markdown
 from django.utils.safestring import mark_safe
@@ -8,64 +11,111 @@ from django.utils.html import linebreaks as django_linebreaks
 
 register = template.Library()
 
+# Kept as plain Python (not compiled with mypyc/Cython): each filter is a getattr and a
+# method call, and most of a render goes to Django's template engine calling into it and to
+# the markdown library. The costly work is the markdown/linebreaks rendering, which the caches
+# below already skip for repeated text
+
+# One Markdown converter per thread: building it (extension setup) costs far more than a
+# conversion, and instances keep per-document state, so they cannot be shared across threads
+_markdown_local = threading.local()
+
+
+def _build_markdown():
+    """Create a Markdown converter with the extensions used by markdown_to_html"""
+    # Configure markdown with extensions for better formatting
+    return markdown.Markdown(extensions=[
+        'markdown.extensions.extra',      # Tables, fenced code blocks, etc.
+        'markdown.extensions.nl2br',     # Convert newlines to <br>
+        'markdown.extensions.sane_lists', # Better list handling
+    ])
+
+
+def _get_markdown(text):
+    """Return a reset Markdown converter for text, reusing this thread's one when safe"""
+    # Abbreviation definitions ("*[HTML]: ...") register patterns that reset() does not
+    # remove in Python-Markdown 3.5, so such documents get a converter of their own
+    if '*[' in text:
+        return _build_markdown()
+    
+    md = getattr(_markdown_local, 'md', None)
+    if md is None:
+        md = _markdown_local.md = _build_markdown()
+    return md.reset()
+
+
+# The same summaries and decisions appear on many pages; linebreaks' regex passes cost far
+# more than a cache lookup. An in-process cache is used on purpose: a hit in Django's
+# LocMemCache (lock + unpickle) costs nearly as much as running linebreaks again
+@lru_cache(maxsize=1024)
+def _linebreaks(text):
+    """linebreaks() for a text, remembering recent results"""
+    return django_linebreaks(text)
+
+
+def _get_localized_title(getter, language):
+    """Call a get_localized_title method, asking for missing-translation markers where supported"""
+    # Set by the models.accepts_show_missing decorator
+    if getattr(getter, 'accepts_show_missing', False):
+        return getter(language, show_missing=True)
+    return getter(language)
+
+
 @register.filter
 def localized_title(obj, language):
     """Get localized title for an object"""
-    if hasattr(obj, 'get_localized_title'):
-        # Check if the method accepts show_missing parameter
-        try:
-            return obj.get_localized_title(language, show_missing=True)
-        except TypeError:
-            # Fallback for methods that don't accept show_missing parameter
-            return obj.get_localized_title(language)
+    getter = getattr(obj, 'get_localized_title', None)
+    if getter is not None:
+        return _get_localized_title(getter, language)
     return getattr(obj, 'title', '')
 
 @register.filter
 def localized_ai_summary(obj, language):
     """Get localized AI summary for an object"""
-    if hasattr(obj, 'get_localized_ai_summary'):
-        return obj.get_localized_ai_summary(language, show_missing=True)
+    getter = getattr(obj, 'get_localized_ai_summary', None)
+    if getter is not None:
+        return getter(language, show_missing=True)
     return getattr(obj, 'ai_summary', '')
 
 @register.filter
 def localized_analysis(obj, language):
     """Get localized analysis for a politician profile"""
-    if hasattr(obj, 'get_localized_analysis'):
-        return obj.get_localized_analysis(language)
+    getter = getattr(obj, 'get_localized_analysis', None)
+    if getter is not None:
+        return getter(language)
     return getattr(obj, 'analysis_et', '')
 
 @register.filter
 def localized_decision(obj, language):
     """Get localized decision for an AgendaDecision"""
-    if hasattr(obj, 'get_localized_decision'):
-        return obj.get_localized_decision(language, show_missing=True)
+    getter = getattr(obj, 'get_localized_decision', None)
+    if getter is not None:
+        return getter(language, show_missing=True)
     return getattr(obj, 'decision_text', '')
 
 @register.filter
 def localized_summary(obj, language):
     """Get localized summary for an AgendaSummary"""
-    if hasattr(obj, 'get_localized_summary'):
-        return obj.get_localized_summary(language, show_missing=True)
+    getter = getattr(obj, 'get_localized_summary', None)
+    if getter is not None:
+        return getter(language, show_missing=True)
     return getattr(obj, 'summary_text', '')
 
 @register.filter
 def localized_activity(obj, language):
     """Get localized activity description for an AgendaActivePolitician"""
-    if hasattr(obj, 'get_localized_activity'):
-        return obj.get_localized_activity(language, show_missing=True)
+    getter = getattr(obj, 'get_localized_activity', None)
+    if getter is not None:
+        return getter(language, show_missing=True)
     return getattr(obj, 'activity_description', '')
 
 @register.simple_tag(takes_context=True)
 def localized_title_tag(context, obj):
     """Template tag to get localized title using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_title'):
-        # Check if the method accepts show_missing parameter
-        try:
-            return obj.get_localized_title(language, show_missing=True)
-        except TypeError:
-            # Fallback for methods that don't accept show_missing parameter
-            return obj.get_localized_title(language)
+    getter = getattr(obj, 'get_localized_title', None)
+    if getter is not None:
+        return _get_localized_title(getter, language)
     return getattr(obj, 'title', '')
 
 @register.simple_tag(takes_context=True)
@@ -73,55 +123,58 @@ def localized_ai_summary_tag(context, obj):
     """Template tag to get localized AI summary using current language from context"""
     language = context.get('current_language', 'et')
     
-    # For AgendaItem objects, use structured_summary
-    if hasattr(obj, 'structured_summary'):
-        try:
-            return obj.structured_summary.get_localized_summary(language, show_missing=True)
-        except AttributeError:
-            return ''
+    # For AgendaItem objects, use structured_summary (a missing one reads as None here)
+    summary = getattr(obj, 'structured_summary', None)
+    if summary is not None:
+        return summary.get_localized_summary(language, show_missing=True)
     
     # For Speech objects, keep using the old method for now
-    if hasattr(obj, 'get_localized_ai_summary'):
-        return obj.get_localized_ai_summary(language, show_missing=True)
+    getter = getattr(obj, 'get_localized_ai_summary', None)
+    if getter is not None:
+        return getter(language, show_missing=True)
     return getattr(obj, 'ai_summary', '')
 
 @register.simple_tag(takes_context=True)
 def localized_analysis_tag(context, obj):
     """Template tag to get localized analysis using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_analysis'):
-        return obj.get_localized_analysis(language, show_missing=True)
+    getter = getattr(obj, 'get_localized_analysis', None)
+    if getter is not None:
+        return getter(language, show_missing=True)
     return getattr(obj, 'analysis_et', '')
 
 @register.simple_tag(takes_context=True)
 def localized_activity_tag(context, obj):
     """Template tag to get localized activity description using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_activity'):
-        text = obj.get_localized_activity(language, show_missing=True)
-        return mark_safe(django_linebreaks(text))
+    getter = getattr(obj, 'get_localized_activity', None)
+    if getter is not None:
+        text = getter(language, show_missing=True)
+        return mark_safe(_linebreaks(text))
     text = getattr(obj, 'activity_description', '')
-    return mark_safe(django_linebreaks(text))
+    return mark_safe(_linebreaks(text))
 
 @register.simple_tag(takes_context=True)
 def localized_decision_tag(context, obj):
     """Template tag to get localized decision text using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_decision'):
-        text = obj.get_localized_decision(language, show_missing=True)
-        return mark_safe(django_linebreaks(text))
+    getter = getattr(obj, 'get_localized_decision', None)
+    if getter is not None:
+        text = getter(language, show_missing=True)
+        return mark_safe(_linebreaks(text))
     text = getattr(obj, 'decision_text', '')
-    return mark_safe(django_linebreaks(text))
+    return mark_safe(_linebreaks(text))
 
 @register.simple_tag(takes_context=True)
 def localized_summary_tag(context, obj):
     """Template tag to get localized summary text using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_summary'):
-        text = obj.get_localized_summary(language, show_missing=True)
-        return mark_safe(django_linebreaks(text))
+    getter = getattr(obj, 'get_localized_summary', None)
+    if getter is not None:
+        text = getter(language, show_missing=True)
+        return mark_safe(_linebreaks(text))
     text = getattr(obj, 'summary_text', '')
-    return mark_safe(django_linebreaks(text))
+    return mark_safe(_linebreaks(text))
 
 @register.filter
 def get_item(dictionary, key):
@@ -133,46 +186,52 @@ def get_item(dictionary, key):
 @register.filter
 def localized_content(obj, language):
     """Get localized content for a TextPage"""
-    if hasattr(obj, 'get_localized_content'):
-        return obj.get_localized_content(language)
+    getter = getattr(obj, 'get_localized_content', None)
+    if getter is not None:
+        return getter(language)
     return getattr(obj, 'content', '')
 
 @register.filter
 def localized_meta_description(obj, language):
     """Get localized meta description for a TextPage"""
-    if hasattr(obj, 'get_localized_meta_description'):
-        return obj.get_localized_meta_description(language)
+    getter = getattr(obj, 'get_localized_meta_description', None)
+    if getter is not None:
+        return getter(language)
     return getattr(obj, 'meta_description', '')
 
 @register.filter
 def localized_keywords(obj, language):
     """Get localized keywords for a TextPage"""
-    if hasattr(obj, 'get_localized_keywords'):
-        return obj.get_localized_keywords(language)
+    getter = getattr(obj, 'get_localized_keywords', None)
+    if getter is not None:
+        return getter(language)
     return getattr(obj, 'keywords', '')
 
 @register.simple_tag(takes_context=True)
 def localized_content_tag(context, obj):
     """Template tag to get localized content using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_content'):
-        return obj.get_localized_content(language)
+    getter = getattr(obj, 'get_localized_content', None)
+    if getter is not None:
+        return getter(language)
     return getattr(obj, 'content', '')
 
 @register.simple_tag(takes_context=True)
 def localized_meta_description_tag(context, obj):
     """Template tag to get localized meta description using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_meta_description'):
-        return obj.get_localized_meta_description(language)
+    getter = getattr(obj, 'get_localized_meta_description', None)
+    if getter is not None:
+        return getter(language)
     return getattr(obj, 'meta_description', '')
 
 @register.simple_tag(takes_context=True)
 def localized_keywords_tag(context, obj):
     """Template tag to get localized keywords using current language from context"""
     language = context.get('current_language', 'et')
-    if hasattr(obj, 'get_localized_keywords'):
-        return obj.get_localized_keywords(language)
+    getter = getattr(obj, 'get_localized_keywords', None)
+    if getter is not None:
+        return getter(language)
     return getattr(obj, 'keywords', '')
 
 @register.filter
@@ -181,12 +240,11 @@ def markdown_to_html(text):
     if not text:
         return ''
     
-    # Configure markdown with extensions for better formatting
-    md = markdown.Markdown(extensions=[
-        'markdown.extensions.extra',      # Tables, fenced code blocks, etc.
-        'markdown.extensions.nl2br',     # Convert newlines to <br>
-        'markdown.extensions.sane_lists', # Better list handling
-    ])
-    
-    html = md.convert(text)
+    html = _render_markdown(text)
     return mark_safe(html)
+
+
+@lru_cache(maxsize=128)
+def _render_markdown(text):
+    """Convert Markdown to HTML, remembering recent results (text pages render the same content on every request)"""
+    return _get_markdown(text).convert(text)
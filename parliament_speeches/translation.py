@@ -2,6 +2,7 @@
 Translation utilities using pyi18next for server-side template translation
 """
 import os
+import sys
 import json
 from typing import Optional, Dict, Any
 
@@ -12,10 +13,22 @@ except ImportError:
     I18NEXT_AVAILABLE = False
     print("Warning: pyi18next not installed. Install with: pip install pyi18next")
 
+def _interpolate(translation, kwargs):
+    """Fill {placeholders} in a fallback translation, leaving it as-is when it has none"""
+    if kwargs and '{' in translation:
+        try:
+            return translation.format_map(kwargs)
+        except (KeyError, ValueError):
+            return translation
+    return translation
+
+
 class TranslationManager:
     def __init__(self):
         self.i18n = None
         self.fallback_translations = {}
+        self.flat_translations = {}
+        self.translate_funcs = {}
         self.setup()
     
     def setup(self):
@@ -27,24 +40,13 @@ class TranslationManager:
             self.load_translations_for_pyi18next()
     
     def load_translations_for_pyi18next(self):
-        """Load translation files and initialize pyi18next"""
-        locales_dir = os.path.join(os.path.dirname(__file__), '..', 'locales')
-        resources = {}
-        
-        for lang in ['en', 'et', 'ru']:
-            translation_file = os.path.join(locales_dir, lang, 'translation.json')
-            try:
-                with open(translation_file, 'r', encoding='utf-8') as f:
-                    translations = json.load(f)
-                    resources[lang] = {
-                        'translation': translations
-                    }
-            except FileNotFoundError:
-                print(f"Warning: Translation file not found for language: {lang}")
-                resources[lang] = {'translation': {}}
-            except json.JSONDecodeError:
-                print(f"Warning: Invalid JSON in translation file for language: {lang}")
-                resources[lang] = {'translation': {}}
+        """Initialize pyi18next from the translation files loaded by load_fallback_translations"""
+        # setup() always loads the fallback translations first, so each file is parsed only once;
+        # pyi18next gets its own copies of the dicts
+        resources = {
+            lang: {'translation': dict(translations)}
+            for lang, translations in self.fallback_translations.items()
+        }
         
         try:
             # Initialize pyi18next with resources
@@ -54,6 +56,10 @@ class TranslationManager:
                 default_ns='translation',
                 resources=resources
             )
+            # Language-bound translate functions, built once instead of on every translate() call
+            self.translate_funcs = {
+                lang: self.i18n.get_translate_func(lng=lang) for lang in resources
+            }
             print("pyi18next initialized successfully")
         except Exception as e:
             print(f"Error initializing pyi18next: {e}")
@@ -68,8 +74,22 @@ class TranslationManager:
             try:
                 with open(translation_file, 'r', encoding='utf-8') as f:
                     self.fallback_translations[lang] = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
+            except FileNotFoundError:
+                print(f"Warning: Translation file not found for language: {lang}")
+                self.fallback_translations[lang] = {}
+            except json.JSONDecodeError:
+                print(f"Warning: Invalid JSON in translation file for language: {lang}")
                 self.fallback_translations[lang] = {}
+        
+        # (lang, key) -> text for plain string values, used by translate() for lookups without
+        # interpolation so they cost a single dict access. Keys are interned: each file holds its
+        # own copy of every key, and interned keys match template lookups by identity
+        self.flat_translations = {
+            (lang, sys.intern(key)): value
+            for lang, translations in self.fallback_translations.items()
+            for key, value in translations.items()
+            if isinstance(value, str)
+        }
     
     def translate(self, key: str, lang: str = 'et', **kwargs) -> str:
         """
@@ -87,48 +107,39 @@ class TranslationManager:
         if lang not in ['et', 'en', 'ru']:
             lang = 'et'
         
+        # Plain lookups come straight from the loaded files; interpolation and missing keys
+        # go through pyi18next / the fallback system below
+        if not kwargs:
+            translation = self.flat_translations.get((lang, key))
+            if translation is not None:
+                return translation
+        
         if I18NEXT_AVAILABLE and self.i18n:
             try:
                 # Use pyi18next for translation with correct API
-                # Get language-specific translation function
-                t_ = self.i18n.get_translate_func(lng=lang)
+                # Get language-specific translation function (prepared in setup)
+                t_ = self.translate_funcs[lang]
                 result = t_(key, **kwargs)
                 
                 # If pyi18next returns None or the key (meaning not found), fall back to fallback translations
                 if result is None or result == key:
                     translations = self.fallback_translations.get(lang, {})
                     translation = translations.get(key, key)
-                    if kwargs:
-                        try:
-                            return translation.format(**kwargs)
-                        except (KeyError, ValueError):
-                            return translation
-                    return translation
+                    return _interpolate(translation, kwargs)
                 return result
             except Exception as e:
                 print(f"pyi18next translation error: {e}")
                 # Fall back to fallback translations if pyi18next fails
                 translations = self.fallback_translations.get(lang, {})
                 translation = translations.get(key, key)
-                if kwargs:
-                    try:
-                        return translation.format(**kwargs)
-                    except (KeyError, ValueError):
-                        return translation
-                return translation
+                return _interpolate(translation, kwargs)
         else:
             # Fallback translation system
             translations = self.fallback_translations.get(lang, {})
             translation = translations.get(key, key)
             
             # Simple interpolation for fallback
-            if kwargs:
-                try:
-                    return translation.format(**kwargs)
-                except (KeyError, ValueError):
-                    return translation
-            
-            return translation
+            return _interpolate(translation, kwargs)
 
 # Global translation manager instance
 _translation_manager = None
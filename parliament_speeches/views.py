@@ -1,6 +1,6 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Prefetch, prefetch_related_objects
 from django.http import JsonResponse
 from .models import (PlenarySession, AgendaItem, Speech, Politician, PoliticianProfilePart,
                      AgendaSummary, AgendaDecision, AgendaActivePolitician, TextPage, ParliamentParseError)
@@ -16,17 +16,21 @@ def calculate_politician_speaking_time_for_agenda(politician, agenda_item):
     speeches = agenda_item.speeches.filter(
         politician=politician,
         event_type='SPEECH'
-    ).order_by('date')
+    ).only('date').order_by('date')
     
-    if not speeches.exists():
+    return calculate_speaking_time(list(speeches))
+
+
+def calculate_speaking_time(speeches_list):
+    """Calculate speaking time from one politician's speeches, ordered by date"""
+    if not speeches_list:
         return 0
     
-    if speeches.count() == 1:
+    if len(speeches_list) == 1:
         # Single speech, estimate 30 seconds
         return 30
     
     total_speaking_seconds = 0
-    speeches_list = list(speeches)
     
     # Calculate intervals between consecutive speeches by this politician
     for i in range(len(speeches_list) - 1):
@@ -67,23 +71,26 @@ def format_speaking_time(seconds):
         return f"{remaining_seconds}s"
 
 
+def attach_structured_decisions(agenda_items):
+    """Load the decisions of the given agenda items, with their politicians, in one query as `structured_decisions`"""
+    prefetch_related_objects(
+        list(agenda_items),
+        Prefetch('decisions', queryset=AgendaDecision.objects.select_related('politician'),
+                 to_attr='structured_decisions')
+    )
+
+
 def home(request):
     """Home page with slogan and navigation"""
     # Get all active politicians who have at least one speech
-    politicians_with_profiles = Politician.objects.filter(
+    # Sorted by profiling percentage in the database - show all politicians
+    politicians_for_chart = Politician.objects.with_profiling_ratio().filter(
         active=True
     ).annotate(
         speech_count=Count('speeches')
     ).filter(
         speech_count__gt=0
-    ).select_related()
-    
-    # Sort by profiling percentage (calculated property) - show all politicians
-    politicians_for_chart = sorted(
-        politicians_with_profiles, 
-        key=lambda p: p.profiling_percentage, 
-        reverse=True
-    )
+    ).order_by('-profiling_ratio', 'last_name', 'first_name')
     
     context = {
         'politicians_for_chart': politicians_for_chart,
@@ -121,7 +128,11 @@ def plenary_sessions_list(request):
         except ValueError:
             pass
     
-    sessions = sessions.prefetch_related('agenda_items').order_by('-date')
+    sessions = sessions.prefetch_related(
+        Prefetch('agenda_items', queryset=AgendaItem.objects.select_related('structured_summary').defer(
+            'structured_summary__xml_response'
+        ))
+    ).order_by('-date')
     
     # Add AI summary stats and structured data for each session
     sessions_with_stats = []
@@ -131,25 +142,17 @@ def plenary_sessions_list(request):
         session.ai_summaries_count = ai_summaries_count
         session.ai_summaries_percentage = (ai_summaries_count / len(agenda_items) * 100) if agenda_items else 0
         
-        # Add structured data for each agenda item
-        agenda_items_with_structured_data = []
-        for agenda_item in agenda_items:
-            # Add structured data
-            try:
-                agenda_item.structured_summary = AgendaSummary.objects.get(agenda_item=agenda_item)
-            except AgendaSummary.DoesNotExist:
-                agenda_item.structured_summary = None
-                
-            agenda_item.structured_decisions = AgendaDecision.objects.filter(agenda_item=agenda_item).select_related('politician')
-            agenda_items_with_structured_data.append(agenda_item)
-        
-        # Replace the agenda_items relation with our enhanced data
-        session.agenda_items_with_structured_data = agenda_items_with_structured_data
+        # Structured summaries come with the prefetched agenda items; decisions are
+        # loaded below for the displayed page only
+        session.agenda_items_with_structured_data = list(agenda_items)
         sessions_with_stats.append(session)
     
     paginator = Paginator(sessions_with_stats, 10)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+    attach_structured_decisions(
+        agenda_item for session in page_obj for agenda_item in session.agenda_items_with_structured_data
+    )
     
     context = {
         'page_obj': page_obj,
@@ -176,7 +179,9 @@ def plenary_session_detail(request, session_id):
             Q(title__icontains=search_query)
         )
     
-    agenda_items = agenda_items.order_by('date')
+    agenda_items = agenda_items.select_related('structured_summary').defer(
+        'structured_summary__xml_response'
+    ).order_by('date')
     
     # Add AI summary stats and structured data for agenda items
     agenda_items_with_stats = []
@@ -190,14 +195,6 @@ def plenary_session_detail(request, session_id):
         agenda_item.speeches_with_ai = speeches_with_ai
         agenda_item.speeches_ai_percentage = round(speeches_ai_percentage, 1)
         
-        # Add structured data
-        try:
-            agenda_item.structured_summary = AgendaSummary.objects.get(agenda_item=agenda_item)
-        except AgendaSummary.DoesNotExist:
-            agenda_item.structured_summary = None
-            
-        agenda_item.structured_decisions = AgendaDecision.objects.filter(agenda_item=agenda_item).select_related('politician')
-        
         agenda_items_with_stats.append(agenda_item)
     
     # Calculate session-level AI summary stats
@@ -235,6 +232,7 @@ def plenary_session_detail(request, session_id):
     paginator = Paginator(agenda_items_with_stats, 10)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+    attach_structured_decisions(page_obj)
     
     context = {
         'session': session,
@@ -344,8 +342,7 @@ def politicians_agendas_list(request):
         agendas = agendas_query.distinct().select_related(
             'plenary_session'
         ).prefetch_related(
-            'structured_summary',
-            'speeches'
+            Prefetch('structured_summary', queryset=AgendaSummary.objects.defer('xml_response'))
         ).order_by('-date')
         
         # Get total count before limiting
@@ -407,31 +404,30 @@ def politicians_agendas_list(request):
 
 def agenda_detail(request, agenda_id):
     """Detail view for an agenda item with speeches (similar to admin complete-speech)"""
-    agenda_item = get_object_or_404(AgendaItem, pk=agenda_id)
-    speeches = agenda_item.speeches.filter(event_type='SPEECH').select_related(
-        'politician'
-    ).prefetch_related(
-        'politician__faction_memberships__faction'
-    ).order_by('date')
+    agenda_item = get_object_or_404(AgendaItem.objects.with_full_context(), pk=agenda_id)
+    speeches = agenda_item.spoken_speeches
     
     # Calculate AI summary statistics for speeches
-    total_speeches = speeches.count()
-    speeches_with_ai = speeches.filter(ai_summary__isnull=False, ai_summary__gt='').count()
+    total_speeches = len(speeches)
+    speeches_with_ai = sum(1 for speech in speeches if speech.ai_summary)
     speeches_ai_percentage = (speeches_with_ai / total_speeches * 100) if total_speeches > 0 else 0
     
     # Get unique politicians who spoke in this agenda
-    participating_politicians = Politician.objects.filter(
+    participating_politicians = Politician.objects.with_current_faction().filter(
         speeches__agenda_item=agenda_item,
         speeches__event_type='SPEECH'
-    ).prefetch_related(
-        'faction_memberships__faction'
     ).distinct().order_by('last_name', 'first_name')
     
-    # Calculate speaking time for each politician for pie chart
+    # Calculate speaking time for each politician for pie chart, from the speeches already loaded
+    speeches_by_politician = defaultdict(list)
+    for speech in speeches:
+        speeches_by_politician[speech.politician_id].append(speech)
+    
     politician_speaking_data = []
     for politician in participating_politicians:
-        speaking_time_seconds = calculate_politician_speaking_time_for_agenda(politician, agenda_item)
-        speech_count = agenda_item.speeches.filter(politician=politician, event_type='SPEECH').count()
+        politician_speeches = speeches_by_politician[politician.pk]
+        speaking_time_seconds = calculate_speaking_time(politician_speeches)
+        speech_count = len(politician_speeches)
         
         politician_speaking_data.append({
             'politician': politician,
@@ -443,16 +439,16 @@ def agenda_detail(request, agenda_id):
     # Sort by speaking time (descending)
     politician_speaking_data.sort(key=lambda x: x['speaking_time_seconds'], reverse=True)
     
-    # Get structured data from new models
+    # Get structured data from new models (loaded by with_full_context)
     try:
-        agenda_summary = AgendaSummary.objects.get(agenda_item=agenda_item)
+        agenda_summary = agenda_item.structured_summary
     except AgendaSummary.DoesNotExist:
         agenda_summary = None
     
-    agenda_decisions = AgendaDecision.objects.filter(agenda_item=agenda_item).select_related('politician')
+    agenda_decisions = agenda_item.decisions.all()
     
     try:
-        active_politician = AgendaActivePolitician.objects.get(agenda_item=agenda_item)
+        active_politician = agenda_item.active_politician
     except AgendaActivePolitician.DoesNotExist:
         active_politician = None
     
@@ -686,7 +682,9 @@ def politician_detail(request, politician_id):
         
         activity_descriptions = {}
     
-    agendas = agendas.select_related('plenary_session').order_by('-date')
+    agendas = agendas.select_related('plenary_session', 'structured_summary').defer(
+        'structured_summary__xml_response'
+    ).order_by('-date')
     
     # Calculate AI summary stats for this politician's agendas
     ai_summaries_count = sum(1 for agenda in agendas if hasattr(agenda, 'structured_summary'))
@@ -702,14 +700,6 @@ def politician_detail(request, politician_id):
         agenda.politician_speaking_time_formatted = format_speaking_time(speaking_time)
         agenda.politician_speech_count = politician_speech_count
         
-        # Add structured data
-        try:
-            agenda.structured_summary = AgendaSummary.objects.get(agenda_item=agenda)
-        except AgendaSummary.DoesNotExist:
-            agenda.structured_summary = None
-            
-        agenda.structured_decisions = AgendaDecision.objects.filter(agenda_item=agenda).select_related('politician')
-        
         # Add activity description if politician was most active
         if agenda.id in activity_descriptions:
             agenda.activity_description_obj = activity_descriptions[agenda.id]
@@ -721,6 +711,7 @@ def politician_detail(request, politician_id):
     paginator = Paginator(agendas_with_speaking_time, 10)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+    attach_structured_decisions(page_obj)
     
     context = {
         'politician': politician,
@@ -882,12 +873,12 @@ def politician_profiling(request, politician_id):
     overall_profiles = PoliticianProfilePart.objects.filter(
         politician=politician, 
         period_type='ALL'
-    ).order_by('category')
+    ).defer('metrics').order_by('category')
     
     overall_profiles_by_category = {profile.category: profile for profile in overall_profiles}
     
     # Calculate profile statistics based on speeches data (similar to profile_politician.py)
-    speeches = Speech.objects.filter(
+    speeches = Speech.objects.without_text().filter(
         politician=politician,
         event_type='SPEECH'
     ).select_related('agenda_item__plenary_session')
@@ -899,6 +890,14 @@ def politician_profiling(request, politician_id):
         months = set(f"{speech.date.month:02d}.{speech.date.year}" for speech in speeches)
         years = set(speech.date.year for speech in speeches)
         
+        # Count existing profiles per (category, period_type) in one grouped query
+        existing_counts = {
+            (row['category'], row['period_type']): row['count']
+            for row in PoliticianProfilePart.objects.filter(
+                politician=politician
+            ).values('category', 'period_type').annotate(count=Count('id')).order_by()
+        }
+        
         # Count existing and missing profiles for each category
         profile_stats = {}
         for category_code, category_name in available_categories:
@@ -916,16 +915,11 @@ def politician_profiling(request, politician_id):
                 'year_existing': 0,
             }
             
-            # Count existing profiles for this category
-            existing_profiles = PoliticianProfilePart.objects.filter(
-                politician=politician,
-                category=category_code
-            )
-            
-            stats['agenda_existing'] = existing_profiles.filter(period_type='AGENDA').count()
-            stats['session_existing'] = existing_profiles.filter(period_type='PLENARY_SESSION').count()
-            stats['month_existing'] = existing_profiles.filter(period_type='MONTH').count()
-            stats['year_existing'] = existing_profiles.filter(period_type='YEAR').count()
+            # Existing profiles for this category
+            stats['agenda_existing'] = existing_counts.get((category_code, 'AGENDA'), 0)
+            stats['session_existing'] = existing_counts.get((category_code, 'PLENARY_SESSION'), 0)
+            stats['month_existing'] = existing_counts.get((category_code, 'MONTH'), 0)
+            stats['year_existing'] = existing_counts.get((category_code, 'YEAR'), 0)
             
             profile_stats[category_code] = stats
     else:
@@ -1160,11 +1154,11 @@ def politician_profiling_months(request, politician_id, category='ALL'):
     # Get filter parameter
     filter_year = request.GET.get('year')
     
-    # Get all months where this politician spoke
-    speeches = Speech.objects.filter(
+    # Get all months where this politician spoke (only speech dates are needed)
+    speeches = Speech.objects.without_text().filter(
         politician=politician,
         event_type='SPEECH'
-    ).select_related('agenda_item__plenary_session')
+    )
     
     # Filter by year if specified
     if filter_year:
@@ -1264,11 +1258,11 @@ def politician_profiling_years(request, politician_id, category='ALL'):
     # Get all available categories
     available_categories = PoliticianProfilePart.PROFILE_CATEGORIES
     
-    # Get all years where this politician spoke
-    speeches = Speech.objects.filter(
+    # Get all years where this politician spoke (only speech dates are needed)
+    speeches = Speech.objects.without_text().filter(
         politician=politician,
         event_type='SPEECH'
-    ).select_related('agenda_item__plenary_session')
+    )
     
     years_set = set(speech.date.year for speech in speeches)
     years_list = sorted(years_set, reverse=True)
@@ -1358,7 +1352,8 @@ def politician_profiling_agenda_detail(request, politician_id, category, agenda_
     if category != 'ALL':
         profile_filter['category'] = category
     
-    profiles = PoliticianProfilePart.objects.filter(**profile_filter).order_by('category')
+    # The metrics JSON is never rendered on these pages, so it stays in the database
+    profiles = PoliticianProfilePart.objects.filter(**profile_filter).defer('metrics').order_by('category')
     
     profiles_by_category = {profile.category: profile for profile in profiles}
     
@@ -1397,7 +1392,8 @@ def politician_profiling_session_detail(request, politician_id, category, sessio
     if category != 'ALL':
         profile_filter['category'] = category
     
-    profiles = PoliticianProfilePart.objects.filter(**profile_filter).order_by('category')
+    # The metrics JSON is never rendered on these pages, so it stays in the database
+    profiles = PoliticianProfilePart.objects.filter(**profile_filter).defer('metrics').order_by('category')
     
     profiles_by_category = {profile.category: profile for profile in profiles}
     
@@ -1435,7 +1431,8 @@ def politician_profiling_month_detail(request, politician_id, category, month):
     if category != 'ALL':
         profile_filter['category'] = category
     
-    profiles = PoliticianProfilePart.objects.filter(**profile_filter).order_by('category')
+    # The metrics JSON is never rendered on these pages, so it stays in the database
+    profiles = PoliticianProfilePart.objects.filter(**profile_filter).defer('metrics').order_by('category')
     
     profiles_by_category = {profile.category: profile for profile in profiles}
     
@@ -1473,7 +1470,8 @@ def politician_profiling_year_detail(request, politician_id, category, year):
     if category != 'ALL':
         profile_filter['category'] = category
     
-    profiles = PoliticianProfilePart.objects.filter(**profile_filter).order_by('category')
+    # The metrics JSON is never rendered on these pages, so it stays in the database
+    profiles = PoliticianProfilePart.objects.filter(**profile_filter).defer('metrics').order_by('category')
     
     profiles_by_category = {profile.category: profile for profile in profiles}
     
@@ -104,6 +104,13 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Caches
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+}
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -129,6 +136,10 @@ OLLAMA_MODEL = os.environ.get('OLLAMA_MODEL', 'gemma3:12b')
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', '')
 GEMINI_MODEL = os.environ.get('GEMINI_MODEL', 'gemini-2.5-flash-preview-09-2025')
 
+# Local NLLB-200 translation server (e.g. CTranslate2 with int8 weights), used by --ai-provider=nllb
+NLLB_BASE_URL = os.environ.get('NLLB_BASE_URL', 'http://localhost:8080')
+NLLB_MODEL = os.environ.get('NLLB_MODEL', 'nllb-200-distilled-600M')
+
 # Provider-specific recommendations:
 # - Claude: Best for complex analysis, summaries, and Estonian language tasks
 # - OpenAI: Good balance of performance and cost
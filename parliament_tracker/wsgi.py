@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'parliament_tracker.settings')
 
 application = get_wsgi_application()
+
+# Load the translation files now rather than on the first request
+from parliament_speeches.translation import get_translation_manager  # noqa: E402
+
+get_translation_manager()